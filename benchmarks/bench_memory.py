@@ -0,0 +1,89 @@
+"""Compares the memory held by builder dicts and by `nodes` per block.
+
+Run with `python -m benchmarks.bench_memory` from the repository root.
+"""
+import tracemalloc
+
+from slack_blocks_wrapper import section
+from slack_blocks_wrapper.elements import (
+    TextType,
+    static_select_element,
+    text_element,
+)
+from slack_blocks_wrapper.nodes import (
+    ButtonNode,
+    OptionNode,
+    SectionNode,
+    StaticSelectNode,
+    TextNode,
+)
+
+
+def button_dict(i):
+    return section.button_section(
+        "Approve request {}".format(i), "approve_{}".format(i), "primary",
+        value=str(i)
+    )
+
+
+def button_node(i):
+    text = "Approve request {}".format(i)
+    return SectionNode(
+        TextNode(text),
+        accessory=ButtonNode(text, "approve_{}".format(i), "primary",
+                             value=str(i))
+    )
+
+
+def select_dict(i):
+    return {
+        "type": "section",
+        **text_element("Pick a project", TextType.PLAIN_TEXT),
+        "accessory": static_select_element(
+            "Select a project", "project_{}".format(i),
+            options=[
+                text_element("Project {}".format(n), TextType.PLAIN_TEXT,
+                             value=str(n))
+                for n in range(20)
+            ]
+        )
+    }
+
+
+def select_node(i):
+    return SectionNode(
+        TextNode("Pick a project"),
+        accessory=StaticSelectNode(
+            "Select a project", "project_{}".format(i),
+            options=[OptionNode("Project {}".format(n), str(n))
+                     for n in range(20)]
+        )
+    )
+
+
+def bytes_per_block(build, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    blocks = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del blocks
+    return (after - before) / count
+
+
+def main(count: int = 10000):
+    assert button_node(1).to_dict() == button_dict(1)
+    assert select_node(1).to_dict() == select_dict(1)
+    for name, as_dict, as_node in (
+            ("button_section", button_dict, button_node),
+            ("static_select_section", select_dict, select_node),
+    ):
+        dict_size = bytes_per_block(as_dict, count)
+        node_size = bytes_per_block(as_node, count)
+        print("{:<22} dict {:8.0f} B/block | node {:8.0f} B/block | "
+              "{:.2f}x smaller".format(
+                  name, dict_size, node_size, dict_size / node_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Compares `to_json_bytes` against an equivalent `json.dumps` on realistic
+payloads.
+
+The baseline uses the same compact separators and UTF-8 output, so both
+sides produce the same bytes. The `+fragments` cases pre-encode the constant
+blocks (header, dividers and context footers) once with `fragment`, as a
+`FragmentCache` would, and time only the encoding of the whole payload;
+the baseline encodes the same blocks as dicts.
+
+Run with `python -m benchmarks.bench_serialize` from the repository root.
+"""
+import json
+import timeit
+
+from benchmarks.payloads import home_tab_view, message_blocks
+from slack_blocks_wrapper.serialize import fragment, to_json_bytes
+
+CONSTANT_TYPES = ("header", "divider", "context")
+
+
+def json_dumps(payload):
+    return json.dumps(
+        payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def with_fragments(blocks):
+    return [
+        fragment(block) if block["type"] in CONSTANT_TYPES else block
+        for block in blocks
+    ]
+
+
+def best(function, number: int, repeat: int = 5) -> float:
+    # The fastest of a few runs, which is the least disturbed by noise.
+    return min(timeit.repeat(function, number=number, repeat=repeat)) \
+        / number
+
+
+def main(number: int = 400):
+    message = message_blocks(50)
+    home_tab = home_tab_view(100)
+    cases = {
+        "message_50_blocks": (message, message),
+        "message_50_blocks+fragments": (message, with_fragments(message)),
+        "home_tab_100_blocks": (home_tab, home_tab),
+        "home_tab_100_blocks+fragments": (home_tab, {
+            **home_tab, "blocks": with_fragments(home_tab["blocks"])}),
+    }
+    for name, (payload, encoded) in cases.items():
+        assert to_json_bytes(encoded) == json_dumps(payload)
+        baseline = best(lambda: json_dumps(payload), number)
+        serialized = best(lambda: to_json_bytes(encoded), number)
+        print("{:<30} json.dumps {:8.1f} us | to_json_bytes {:8.1f} us | "
+              "{:6d} bytes | {:.2f}x".format(
+                  name,
+                  baseline * 1e6,
+                  serialized * 1e6,
+                  len(json_dumps(payload)),
+                  baseline / serialized))
+
+
+if __name__ == "__main__":
+    main()
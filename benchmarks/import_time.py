@@ -0,0 +1,69 @@
+"""Checks that importing the package stays within an import-time budget.
+
+Run with `python -m benchmarks.import_time` from the repository root. Each
+measurement imports the package and makes a first builder call in a fresh
+interpreter, so the modules that are only loaded on first use are counted
+too. The best of `--runs` is compared to `--budget` and the script exits
+with status 1 when it is over:
+
+    python -m benchmarks.import_time --budget 5
+"""
+import argparse
+import subprocess
+import sys
+
+IMPORT = (
+    "import slack_blocks_wrapper, slack_blocks_wrapper.elements, "
+    "slack_blocks_wrapper.section\n"
+    "slack_blocks_wrapper.section.button_section("
+    "'Deploy', 'deploy', 'primary', value='v1')"
+)
+# Measured in the child process, so interpreter start up is not included.
+# `typing`, which the builders' annotations need, is imported before the
+# clock starts: nearly every application has loaded it already, and it
+# would add the same few milliseconds to every run.
+SCRIPT = (
+    "import time, typing\n"
+    "start = time.perf_counter()\n"
+    f"{IMPORT}\n"
+    "print((time.perf_counter() - start) * 1000)\n"
+)
+
+
+def import_time_ms(runs: int) -> float:
+    return min(
+        float(subprocess.check_output([sys.executable, "-c", SCRIPT]))
+        for _ in range(runs)
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--budget", type=float, default=5.0,
+        help="the import-time budget, in milliseconds (default: 5)")
+    parser.add_argument(
+        "--runs", type=int, default=7,
+        help="the number of fresh interpreters to measure (default: 7)")
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="print the `-X importtime` breakdown of the package modules")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        report = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", IMPORT],
+            stderr=subprocess.PIPE, text=True, check=True
+        ).stderr
+        print("\n".join(
+            line for line in report.splitlines()
+            if "slack_blocks_wrapper" in line
+        ))
+    elapsed = import_time_ms(args.runs)
+    print("import time: {:.2f} ms (budget {:.2f} ms)".format(
+        elapsed, args.budget))
+    return 1 if elapsed > args.budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
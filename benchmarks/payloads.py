@@ -0,0 +1,111 @@
+"""Realistic block payloads shared by the benchmark scripts."""
+import json
+
+from slack_blocks_wrapper import section
+from slack_blocks_wrapper.context import context
+from slack_blocks_wrapper.divider import divider_node
+from slack_blocks_wrapper.elements import (
+    TextType,
+    image_element,
+    static_select_element,
+    text_element,
+)
+from slack_blocks_wrapper.header import header_block_node
+
+
+def options(count: int):
+    return [
+        text_element("Option {}".format(i), TextType.PLAIN_TEXT,
+                     value="option_{}".format(i))
+        for i in range(count)
+    ]
+
+
+def message_blocks(count: int = 50):
+    """A report-style message: header, then rows of text, buttons and
+    footers, `count` blocks in total."""
+    blocks = [header_block_node("Daily report", "report_header")]
+    i = 0
+    while len(blocks) < count:
+        kind = i % 5
+        if kind == 0:
+            blocks.append(section.markdown_text(
+                "*Build #{}* finished in {}s — all checks passed :white_check_mark:".format(i, i * 3)
+            ))
+        elif kind == 1:
+            blocks.append(section.button_section(
+                text="Approve deployment {}".format(i),
+                action_id="approve_{}".format(i),
+                style="primary",
+                value=str(i)
+            ))
+        elif kind == 2:
+            blocks.append(section.text_fields([
+                text_element("*Owner*\n<@U{:08d}>".format(i),
+                             TextType.MARKDOWN_TEXT)["text"],
+                text_element("*Status*\nRunning", TextType.MARKDOWN_TEXT)["text"],
+            ]))
+        elif kind == 3:
+            blocks.append(context(
+                [image_element("https://example.com/icon.png", "icon"),
+                 text_element("Updated by the deploy bot",
+                              TextType.PLAIN_TEXT)["text"]],
+                block_id="context_{}".format(i)
+            ))
+        else:
+            blocks.append(divider_node())
+        i += 1
+    return blocks
+
+
+def home_tab_view(count: int = 100, option_count: int = 20,
+                  shared_options=None):
+    """A home tab view with `count` blocks, including static selects. The
+    selects share `shared_options` if given."""
+    blocks = message_blocks(count)
+    for i in range(2, count, 10):
+        blocks[i] = {
+            "type": "section",
+            **text_element("Pick a project", TextType.MARKDOWN_TEXT),
+            "accessory": static_select_element(
+                "Select a project",
+                "project_{}".format(i),
+                options=options(option_count)
+                if shared_options is None else shared_options,
+            ),
+        }
+    return {"type": "home", "blocks": blocks}
+
+
+def view_submission(count: int = 40):
+    """The JSON of a `view_submission` payload for a form of `count`
+    inputs, cycling through the element types."""
+    states = [
+        {"type": "plain_text_input", "value": "Some text"},
+        {"type": "static_select", "selected_option": {
+            "text": {"type": "plain_text", "text": "Option 0"},
+            "value": "option_0",
+        }},
+        {"type": "multi_users_select", "selected_users": ["U1", "U2"]},
+        {"type": "datepicker", "selected_date": "2024-01-31"},
+        {"type": "checkboxes", "selected_options": [
+            {"text": {"type": "plain_text", "text": "A"}, "value": "a"},
+            {"text": {"type": "plain_text", "text": "B"}, "value": "b"},
+        ]},
+    ]
+    values = {
+        "block_{}".format(i): {"input_{}".format(i): states[i % len(states)]}
+        for i in range(count)
+    }
+    return json.dumps({
+        "type": "view_submission",
+        "user": {"id": "U123", "name": "user"},
+        "view": {
+            "id": "V123",
+            "type": "modal",
+            "callback_id": "form",
+            "private_metadata": "",
+            "blocks": [],
+            "state": {"values": values},
+        },
+    })
@@ -0,0 +1,305 @@
+"""Microbenchmarks for every public builder and for composite payloads.
+
+Run with `python -m benchmarks.run` from the repository root. Results are
+printed as a table and can be written as JSON with `--output`; pass a
+previous JSON file with `--compare` to fail on regressions:
+
+    python -m benchmarks.run --output before.json
+    # upgrade or change the package
+    python -m benchmarks.run --compare before.json --threshold 0.1
+"""
+import argparse
+import datetime
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+
+import slack_blocks_wrapper
+from benchmarks.payloads import (
+    home_tab_view,
+    message_blocks,
+    options,
+    view_submission,
+)
+from slack_blocks_wrapper import elements, section
+from slack_blocks_wrapper.context import context
+from slack_blocks_wrapper.divider import divider_node
+from slack_blocks_wrapper.elements.select import filtered_conversations_select
+from slack_blocks_wrapper.elements.timepicker import timepicker_element
+from slack_blocks_wrapper.file import file_node
+from slack_blocks_wrapper.fragment_cache import FragmentCache
+from slack_blocks_wrapper.header import header_block_node
+from slack_blocks_wrapper.home_tab import HomeTab, Panel
+from slack_blocks_wrapper.image import image_block_node
+from slack_blocks_wrapper.input import input_block_node
+from slack_blocks_wrapper.interactions import parse_payload
+from slack_blocks_wrapper.router import ActionRouter
+from slack_blocks_wrapper.serialize import to_json_bytes
+from slack_blocks_wrapper.view_cache import ViewCache
+
+OPTIONS = options(10)
+PROJECTS = elements.OptionSet(options(20))
+VIEW_SUBMISSION = view_submission(40)
+ROUTER = ActionRouter()
+for i in range(1000):
+    ROUTER.add("action_{}".format(i), print)
+    ROUTER.add_prefix("prefix_{}_".format(i), print)
+for i in range(100):
+    ROUTER.add_pattern(r"pattern_{}_\d+".format(i), print)
+VIEWS = ViewCache()
+FRAGMENTS = FragmentCache()
+USER_TEXTS = ["Ticket #{} <{}> & co".format(i, i) for i in range(1000)]
+PLAIN = elements.TextType.PLAIN_TEXT
+MARKDOWN = elements.TextType.MARKDOWN_TEXT
+IMAGE_URL = "https://example.com/image.png"
+HOME = HomeTab([
+    Panel("panel_{}".format(i), lambda user: message_blocks(20),
+          ("data_{}".format(i),))
+    for i in range(5)
+])
+HOME_VERSIONS = {"data_{}".format(i): 0 for i in range(5)}
+
+
+def home_tab_one_panel_changed():
+    HOME_VERSIONS["data_0"] += 1
+    return HOME.render(HOME_VERSIONS, key="U123")
+
+
+# Every case is a zero-argument callable, named after what it measures.
+CASES = {
+    # elements
+    "elements.text_element": lambda: elements.text_element(
+        "Approve", PLAIN),
+    "elements.text_element[mrkdwn,value]": lambda: elements.text_element(
+        "*Approve*", MARKDOWN, value="approve"),
+    "elements.button_element": lambda: elements.button_element(
+        "Approve", "approve", "primary", value="1"),
+    "elements.checkbox_element": lambda: elements.checkbox_element(
+        OPTIONS, "checkbox"),
+    "elements.datepicker_element": lambda: elements.datepicker_element(
+        "date", "2024-01-31", "Pick a date"),
+    "elements.image_element": lambda: elements.image_element(
+        IMAGE_URL, "An image"),
+    "elements.multiconversations_select_element":
+        lambda: elements.multiconversations_select_element(
+            "Pick conversations", "conversations"),
+    "elements.multistatic_select_element":
+        lambda: elements.multistatic_select_element(
+            "Pick options", OPTIONS, "options"),
+    "elements.multiexternal_select_element":
+        lambda: elements.multiexternal_select_element(
+            "Pick options", "external", min_query_length=2),
+    "elements.multiuser_select_element":
+        lambda: elements.multiuser_select_element("Pick users", "users"),
+    "elements.multichannels_select_element":
+        lambda: elements.multichannels_select_element(
+            "Pick channels", "channels"),
+    "elements.plain_text_input_element":
+        lambda: elements.plain_text_input_element(
+            "name", "Your name", multiline=True, max_length=200),
+    "elements.radio_button_group_element":
+        lambda: elements.radio_button_group_element("radio", OPTIONS),
+    "elements.user_select_element": lambda: elements.user_select_element(
+        "Pick a user", "user"),
+    "elements.static_select_element": lambda: elements.static_select_element(
+        "Pick an option", "option", options=OPTIONS),
+    "elements.external_select_element":
+        lambda: elements.external_select_element(
+            "Pick an option", "external", min_query_length=2),
+    "elements.conversations_select_element":
+        lambda: elements.conversations_select_element(
+            "Pick a conversation", "conversation"),
+    "elements.channels_select_element":
+        lambda: elements.channels_select_element("Pick a channel", "channel"),
+    "elements.filtered_conversations_select":
+        lambda: filtered_conversations_select(
+            "Pick a conversation", "conversation", ["public", "private"],
+            exclude_bot_users=True),
+    "elements.overflow_menu_element": lambda: elements.overflow_menu_element(
+        OPTIONS[:5], "overflow"),
+    "elements.timepicker_element": lambda: timepicker_element(
+        "Pick a time", "time", "09:30"),
+    "elements.escape_all[1000]": lambda: elements.escape_all(USER_TEXTS),
+    "elements.build_options[100]": lambda: elements.build_options(
+        ["Option {}".format(i) for i in range(100)], range(100)),
+    # section
+    "section.plain_text": lambda: section.plain_text(True, "Hello"),
+    "section.markdown_text": lambda: section.markdown_text("*Hello*"),
+    "section.markdown_text[escape]": lambda: section.markdown_text(
+        "*Hello* <you> & co", escape=True),
+    "section.text_fields": lambda: section.text_fields(
+        [elements.text_element("*Field*", MARKDOWN)["text"]] * 4),
+    "section.users_select": lambda: section.users_select(
+        "Pick a user", "user"),
+    "section.multi_conversations_select":
+        lambda: section.multi_conversations_select(
+            "Pick conversations", "conversations"),
+    "section.multi_static_select": lambda: section.multi_static_select(
+        "Pick options", OPTIONS, "options"),
+    "section.button_section": lambda: section.button_section(
+        "Approve", "approve", "primary", value="1"),
+    "section.image": lambda: section.image("An image", IMAGE_URL, "alt"),
+    "section.overflow_menu": lambda: section.overflow_menu(
+        "More", OPTIONS[:5], "overflow"),
+    "section.datepicker": lambda: section.datepicker(
+        "Due date", "due", "2024-01-31"),
+    "section.checkbox": lambda: section.checkbox(
+        "Pick", OPTIONS, action_id="checkbox"),
+    "section.table_sections[1000x2]": lambda: list(section.table_sections(
+        ((i, i * 1.5) for i in range(1000)), ["Build", "Minutes"],
+        [None, "{:.1f}"])),
+    # blocks
+    "blocks.context": lambda: context(
+        [elements.image_element(IMAGE_URL, "icon"),
+         elements.text_element("Footer", PLAIN)["text"]],
+        block_id="footer"),
+    "blocks.divider_node": lambda: divider_node(),
+    "blocks.file_node": lambda: file_node("ABC123", "remote"),
+    "blocks.header_block_node": lambda: header_block_node(
+        "Header", "header"),
+    "blocks.image_block_node": lambda: image_block_node(
+        IMAGE_URL, "alt", "Title", "image"),
+    "blocks.input_block_node": lambda: input_block_node(
+        "Name", elements.plain_text_input_element("name", "Your name"),
+        block_id="name", hint="Your full name"),
+    # composites
+    "composite.message[50]": lambda: message_blocks(50),
+    "composite.home_tab[100]": lambda: home_tab_view(100),
+    "composite.message[50]+to_json_bytes":
+        lambda: to_json_bytes(message_blocks(50)),
+    "composite.home_tab[100]+to_json_bytes":
+        lambda: to_json_bytes(home_tab_view(100)),
+    "composite.approval_rows[20]+FragmentCache[hit]+to_json_bytes":
+        lambda: to_json_bytes([
+            FRAGMENTS.block(section.button_section, "Approve", "approve",
+                            "primary", value="approve")
+            for _ in range(20)
+        ]),
+    "composite.approval_rows[20]+to_json_bytes": lambda: to_json_bytes([
+        section.button_section("Approve", "approve", "primary",
+                               value="approve")
+        for _ in range(20)
+    ]),
+    "composite.home_tab[100,OptionSet]+to_json_bytes":
+        lambda: to_json_bytes(home_tab_view(100, shared_options=PROJECTS)),
+    "composite.home_tab[5x20]+HomeTab[1 of 5 changed]":
+        home_tab_one_panel_changed,
+    "composite.home_tab[100]+ViewCache[hit]": lambda: to_json_bytes({
+        "trigger_id": "trigger",
+        "view": VIEWS.get_or_render("home", home_tab_view).fragment,
+    }),
+    # inbound
+    "interactions.parse_payload[40]":
+        lambda: parse_payload(VIEW_SUBMISSION),
+    "router.route[exact,1000]": lambda: ROUTER.route("action_500", "block"),
+    "router.route[prefix,1000]": lambda: ROUTER.route("prefix_500_row"),
+    "router.route[pattern,100]": lambda: ROUTER.route("pattern_50_12"),
+}
+
+
+def measure(case, min_time: float = 0.2, repeat: int = 5):
+    """Calls per second, best of `repeat` runs of at least `min_time`."""
+    timer = timeit.Timer(case)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return number / best
+
+
+def allocations(case, calls: int = 200):
+    """Memory blocks and bytes allocated per call, for the values built."""
+    case()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        results = [case() for _ in range(calls)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = [
+        stat for stat in after.compare_to(before, "filename")
+        if "tracemalloc" not in stat.traceback[0].filename
+    ]
+    del results
+    return (
+        sum(stat.count_diff for stat in stats) / calls,
+        sum(stat.size_diff for stat in stats) / calls,
+    )
+
+
+def run(names, min_time: float):
+    results = {}
+    for name in names:
+        case = CASES[name]
+        blocks, size = allocations(case)
+        results[name] = {
+            "calls_per_second": round(measure(case, min_time), 1),
+            "allocated_blocks_per_call": round(blocks, 2),
+            "allocated_bytes_per_call": round(size, 1),
+        }
+        print("{:<48} {:>14,.0f} calls/s {:>9.1f} blocks {:>11,.0f} B".format(
+            name, results[name]["calls_per_second"], blocks, size))
+    return {
+        "meta": {
+            "package_version": slack_blocks_wrapper.__version__,
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": datetime.datetime.now(
+                datetime.timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float):
+    """Prints the change against a baseline report; returns regressions."""
+    regressions = []
+    print("\nCompared to {} (Python {}):".format(
+        baseline["meta"]["package_version"], baseline["meta"]["python"]))
+    for name, result in report["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        ratio = result["calls_per_second"] / previous["calls_per_second"]
+        flag = ""
+        if ratio < 1 - threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print("{:<48} {:>7.2f}x{}".format(name, ratio, flag))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write the results to this file")
+    parser.add_argument("--compare", help="a previous results file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="the slowdown that counts as a regression (default: 0.1)")
+    parser.add_argument(
+        "--filter", default="",
+        help="only run cases whose name contains this text")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2,
+        help="the minimum duration of each timing run, in seconds")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if args.filter in name]
+    report = run(names, args.min_time)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline:
+            regressions = compare(report, json.load(baseline), args.threshold)
+        if regressions:
+            print("\n{} regression(s)".format(len(regressions)))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
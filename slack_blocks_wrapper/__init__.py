@@ -1,3 +1,16 @@
+import importlib
+
 __version__ = "0.2.6"
 __author__ = "Allan Mogusu"
 __license__ = "MIT"
+
+
+def __getattr__(name: str):
+    # Submodules are imported on first attribute access, so that
+    # `import slack_blocks_wrapper` stays cheap.
+    try:
+        return importlib.import_module("." + name, __name__)
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
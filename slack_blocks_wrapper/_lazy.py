@@ -0,0 +1,31 @@
+import importlib
+import sys
+
+
+def lazy_exports(package: str, exports: dict):
+    """
+    Summary: Module `__getattr__` and `__dir__` that load submodules on
+    first attribute access \n
+    Args:
+        package (str): The `__name__` of the package
+        exports (dict): The submodule each public name is defined in. A name
+            that maps to itself is the submodule.
+    Returns:
+        tuple: The `__getattr__` and `__dir__` functions of the package
+    """
+
+    def __getattr__(name: str):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}")
+        value = importlib.import_module("." + module, package)
+        if name != module:
+            value = getattr(value, name)
+            setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
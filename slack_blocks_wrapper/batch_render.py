@@ -0,0 +1,120 @@
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import count, islice
+from typing import Callable, Iterable, Iterator
+
+from .serialize import to_json_bytes
+from .template import BlockTemplate
+
+# The builds installed in a worker process, by the token of their batch, so
+# they are sent and, for templates, compiled once per worker instead of
+# once per chunk.
+_builds = {}
+_MAX_BUILDS = 8
+_tokens = count()
+
+
+def _install(token: int, build):
+    if len(_builds) >= _MAX_BUILDS:
+        _builds.clear()
+    _builds[token] = build
+
+
+def _render_chunk(
+        token: int,
+        build,
+        blocks,
+        records: list,
+        serialize: bool
+):
+    # `build` is sent with every chunk when it is not installed. A template
+    # is sent as its blocks instead, and compiled on the first chunk a
+    # worker gets.
+    if build is None:
+        build = _builds.get(token)
+        if build is None:
+            build = BlockTemplate(blocks)
+            _install(token, build)
+    if isinstance(build, BlockTemplate):
+        payloads = [build.render(**record) for record in records]
+    else:
+        payloads = [build(record) for record in records]
+    if serialize:
+        return [to_json_bytes(payload) for payload in payloads]
+    return payloads
+
+
+def render_batch(
+        build: Callable,
+        records: Iterable,
+        chunk_size: int = 256,
+        max_workers: int = None,
+        max_pending: int = None,
+        serialize: bool = True,
+        executor: Executor = None
+) -> Iterator:
+    """
+    Summary: Renders one payload per record on a pool of processes \n
+    Records are sent to the workers in chunks, and the rendered payloads
+    are yielded in the order of `records`. At most `max_pending` chunks are
+    in flight at a time, so records are read only as fast as the results
+    are consumed.
+
+    Args:
+        build (Callable): Builds the payload of one record. Must be
+            picklable, so a module level function, or a `BlockTemplate`,
+            which is rendered with the record as keyword arguments
+        records (Iterable): The per-recipient records
+        chunk_size (int): The number of records sent to a worker at once
+        max_workers (int): The number of worker processes. Defaults to the
+            number of CPUs
+        max_pending (int): The maximum number of chunks in flight. Defaults
+            to twice the number of workers
+        serialize (bool): Yield compact UTF-8 JSON bytes, which are cheaper
+            to send back from the workers than dicts
+        executor (Executor): A pool to reuse instead of starting one. The
+            pool started otherwise gets `build` once per worker; a reused
+            pool gets it with every chunk, except for a template, which is
+            compiled once per worker
+    Yields:
+        The payload of each record, as bytes or as built
+    Example:
+        >>> def announcement(user):
+        ...     return {"channel": user["id"], "blocks": [
+        ...         section.markdown_text(f"Hi {user['name']}!")]}
+        >>> for body in render_batch(announcement, users):
+        ...     queue.put(body)
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    token = next(_tokens)
+    owned = executor is None
+    if owned:
+        executor = ProcessPoolExecutor(
+            max_workers, initializer=_install, initargs=(token, build))
+        # Installed in every worker by the initializer.
+        build, blocks = None, None
+    elif isinstance(build, BlockTemplate):
+        build, blocks = None, build.blocks
+    else:
+        blocks = None
+    if max_pending is None:
+        max_pending = 2 * (getattr(executor, "_max_workers", None) or 1)
+    records = iter(records)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(
+                    _render_chunk, token, build, blocks, chunk, serialize))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            executor.shutdown(wait=True)
@@ -0,0 +1,69 @@
+from typing import Iterable, Iterator
+
+from .payload import MAX_BLOCKS, BlockList
+
+
+def batch_blocks(
+        blocks: Iterable[dict],
+        surface: str = "message",
+        max_blocks: int = None,
+        max_size: int = None,
+        header: dict = None,
+        continuation: dict = None
+) -> Iterator[list]:
+    """
+    Summary: Splits a stream of blocks into payload-sized batches \n
+    Blocks are read lazily, so a long report can be produced by a generator
+    and sent batch by batch without building the whole report first.
+
+    Args:
+        blocks (Iterable[dict]): The blocks, from any of the builders
+        surface (str): `message`, `modal` or `home`. Sets the default block
+            limit per batch
+        max_blocks (int): Overrides the block limit of the surface
+        max_size (int): The maximum size of a batch's `blocks` array,
+            in bytes of compact UTF-8 JSON
+        header (dict): A block placed at the start of every batch
+        continuation (dict): A block placed at the start of every batch
+            after the first, instead of `header`
+    Yields:
+        BlockList: The blocks of one payload
+    Example:
+        >>> for batch in batch_blocks(
+        ...         report_rows(),
+        ...         header=header_block_node("Daily report", "report"),
+        ...         continuation=context([...], block_id="report_cont")
+        ... ):
+        ...     client.chat_postMessage(channel=channel, blocks=batch)
+    """
+    if max_blocks is None:
+        if surface not in MAX_BLOCKS:
+            raise ValueError("surface must be `message`, `modal` or `home`")
+        max_blocks = MAX_BLOCKS[surface]
+    if continuation is None:
+        continuation = header
+
+    def start(lead: dict):
+        # Blocks are only encoded when there is a size limit.
+        batch = BlockList(
+            max_blocks=max_blocks, max_size=max_size, warn_ratio=None,
+            track_size=max_size is not None)
+        if lead is not None and not batch.try_append(lead):
+            raise ValueError("header block does not fit in an empty batch")
+        return batch
+
+    batch = start(header)
+    # The number of blocks in a batch that holds only its header.
+    floor = len(batch)
+    for block in blocks:
+        if batch.try_append(block):
+            continue
+        if len(batch) == floor:
+            raise ValueError("block does not fit in an empty batch")
+        yield batch
+        batch = start(continuation)
+        floor = len(batch)
+        if not batch.try_append(block):
+            raise ValueError("block does not fit in an empty batch")
+    if len(batch) > floor:
+        yield batch
@@ -0,0 +1,105 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from hashlib import blake2b
+from itertools import count
+
+from .serialize import Fragment
+
+_scope = ContextVar("slack_blocks_wrapper_block_ids", default=None)
+
+
+class _Scope:
+    __slots__ = ("namespace", "positions")
+
+    def __init__(self, namespace: bytes):
+        self.namespace = namespace
+        self.positions = count()
+
+
+@contextmanager
+def content_block_ids(namespace: str = ""):
+    """
+    Summary: Derives missing `block_id`s from block content \n
+    Within the `with` block, `context`, `divider_node`, `file_node`,
+    `header_block_node`, `image_block_node` and `input_block_node` fill in
+    a `block_id` that is not given with a hash of the block's content, its
+    position among the blocks built in the `with` block and `namespace`.
+    The same blocks built in the same order get the same ids in every
+    process, so caches and `diff_blocks` can key on them, and identical
+    blocks in one message still get different ids, as Slack needs.
+
+    A block inserted in the middle changes the ids of the blocks built
+    after it. Nested `with` blocks number their blocks on their own, under
+    the namespace of the enclosing one, so building each part of a message
+    in its own keeps the ids of the other parts as they are.
+
+    Args:
+        namespace (str): Mixed into every hash, to keep the ids of
+            different surfaces, apps or parts of a message apart
+
+    Example:
+        >>> with content_block_ids("weekly_report"):
+        ...     blocks = [header_block_node("Weekly report"), divider_node()]
+        ...     with content_block_ids("totals"):
+        ...         blocks += [section.markdown_text(...), divider_node()]
+        >>> blocks[0]["block_id"]
+        'a3f0c6b1e2d94f7a8c15e063'
+    """
+    namespace = namespace.encode("utf-8")
+    outer = _scope.get()
+    if outer is not None:
+        namespace = outer.namespace + b"\x00" + namespace
+    token = _scope.set(_Scope(namespace))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def _update(digest, part):
+    # Feeds `part` into `digest` piece by piece, rather than encoding all of
+    # it first. Every value is tagged and every string and container
+    # prefixed with its length, so different trees never feed the same
+    # bytes.
+    if isinstance(part, str):
+        data = part.encode("utf-8")
+        digest.update(b"s%d:" % len(data))
+        digest.update(data)
+    elif isinstance(part, dict):
+        digest.update(b"d%d:" % len(part))
+        for key in sorted(part):
+            _update(digest, key)
+            _update(digest, part[key])
+    elif isinstance(part, (list, tuple)):
+        digest.update(b"l%d:" % len(part))
+        for item in part:
+            _update(digest, item)
+    elif isinstance(part, Fragment):
+        digest.update(b"f%d:" % len(part.json))
+        digest.update(part.json)
+    else:
+        # Numbers, booleans and None.
+        digest.update(b"v" + repr(part).encode("ascii") + b";")
+
+
+def content_block_id(block_type: str, *parts):
+    """
+    Summary: The content-derived `block_id` for a block being built \n
+    Used by the block builders. Each call takes the next position in the
+    current `content_block_ids` block.
+
+    Args:
+        block_type (str): The `type` of the block
+        *parts: The content of the block that identifies it
+    Returns:
+        str: The `block_id`, or `None` outside of `content_block_ids`
+    """
+    scope = _scope.get()
+    if scope is None:
+        return None
+    digest = blake2b(scope.namespace, digest_size=12)
+    digest.update(b"%d\x00" % next(scope.positions))
+    digest.update(block_type.encode("utf-8"))
+    for part in parts:
+        _update(digest, part)
+    return digest.hexdigest()
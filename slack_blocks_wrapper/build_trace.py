@@ -0,0 +1,233 @@
+import functools
+import sys
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator, List, Tuple
+
+from .instrument import _patch
+from .serialize import to_json_bytes
+
+
+class TraceNode:
+    """
+    Summary: One builder call in a build trace \n
+    Attributes:
+        name (str): The builder, such as `section.button_section`
+        seconds (float): The wall time of the call, including its children
+        allocations (int): The memory blocks allocated by the call and
+            still alive when it returned, including its children
+        bytes (int): The size of the result, in bytes of compact UTF-8 JSON
+        children (List[TraceNode]): The builder calls made by this one
+    """
+    __slots__ = ("name", "seconds", "allocations", "bytes", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.allocations = 0
+        self.bytes = 0
+        self.children = []
+
+    @property
+    def self_seconds(self) -> float:
+        """
+        Summary: The wall time of the call, less that of its children
+        """
+        return self.seconds - sum(child.seconds for child in self.children)
+
+    def __repr__(self):
+        return "TraceNode({!r}, seconds={:.6f}, allocations={}, " \
+               "bytes={}, children={})".format(
+                   self.name, self.seconds, self.allocations, self.bytes,
+                   len(self.children))
+
+
+class BuildTrace:
+    """
+    Summary: The tree of builder calls recorded by `trace_build` \n
+    Attributes:
+        calls (List[TraceNode]): The builder calls made directly by the
+            traced code, in order
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def walk(self) -> Iterator[Tuple[Tuple[str, ...], TraceNode]]:
+        """
+        Summary: Every call in the trace, depth first \n
+        Returns:
+            Iterator[Tuple[Tuple[str, ...], TraceNode]]: The stack of
+            builder names down to each call, and the call
+        """
+        stack = [((node.name,), node) for node in reversed(self.calls)]
+        while stack:
+            names, node = stack.pop()
+            yield names, node
+            for child in reversed(node.children):
+                stack.append((names + (child.name,), child))
+
+    def collapsed(self, weight: str = "seconds") -> str:
+        """
+        Summary: The trace in the collapsed stack format of flame graphs \n
+        One line per distinct stack of builder names, with the summed
+        weight of the calls at the top of that stack, less that of their
+        children. Can be read by `flamegraph.pl`, speedscope and most
+        other flame graph tools.
+
+        Args:
+            weight (str): `seconds` (written as microseconds),
+                `allocations` or `bytes`
+        Returns:
+            str: The collapsed stacks
+        """
+        if weight not in ("seconds", "allocations", "bytes"):
+            raise ValueError(
+                "weight must be `seconds`, `allocations` or `bytes`")
+        scale = 1e6 if weight == "seconds" else 1
+        totals = {}
+        for names, node in self.walk():
+            value = getattr(node, weight) - sum(
+                getattr(child, weight) for child in node.children)
+            totals[names] = totals.get(names, 0) + value * scale
+        return "".join(
+            "{} {}\n".format(";".join(names), max(round(value), 0))
+            for names, value in totals.items()
+        )
+
+    def dump(self, path: str, weight: str = "seconds"):
+        """
+        Summary: Writes the collapsed stacks to a file \n
+        Args:
+            path (str): The file to write
+            weight (str): `seconds` (written as microseconds),
+                `allocations` or `bytes`
+        Example:
+            >>> trace.dump("home_tab.folded")
+            $ flamegraph.pl home_tab.folded > home_tab.svg
+        """
+        with open(path, "w") as output:
+            output.write(self.collapsed(weight))
+
+    def format(self, max_depth: int = None) -> str:
+        """
+        Summary: The trace as an indented tree, for reading \n
+        Args:
+            max_depth (int): The deepest level of calls to show
+        Returns:
+            str: One line per call, with its time, allocations and size
+        """
+        lines = []
+        for names, node in self.walk():
+            depth = len(names) - 1
+            if max_depth is not None and depth >= max_depth:
+                continue
+            lines.append("{:>10.1f} us {:>7} blocks {:>9} B  {}{}".format(
+                node.seconds * 1e6, node.allocations, node.bytes,
+                "  " * depth, node.name))
+        return "\n".join(lines)
+
+
+_CALIBRATION_CHILDREN = 8
+
+
+def _nothing():
+    return None
+
+
+def _calibrate(wrap, stack: List[list]):
+    # Traces builders that allocate nothing, with and without children, so
+    # whatever the wrapper counts for them is its own bias.
+    calls = []
+    stack.append(calls)
+    child = wrap("", _nothing)
+
+    def parent():
+        for _ in range(_CALIBRATION_CHILDREN):
+            child()
+
+    parent = wrap("", parent)
+    for _ in range(3):
+        calls.clear()
+        child()
+        parent()
+    stack.pop()
+    bias = calls[0].allocations
+    return bias, (bias - calls[1].allocations) / _CALIBRATION_CHILDREN
+
+
+@contextmanager
+def trace_build(measure_bytes: bool = True):
+    """
+    Summary: Records which builders produced which subtrees \n
+    While the block is running, every builder call made in its thread is
+    recorded in a tree, with its time, allocated memory blocks (from
+    `sys.getallocatedblocks`) and the encoded size of its result. The trace
+    itself is not included in the allocations, which are approximate:
+    objects reused from CPython's free lists, such as small dicts, are not
+    counted. Calls made in other threads are not traced. The builders are
+    patched as by `instrument.enable`, and put back when the block ends,
+    even when traces in other threads overlap it.
+
+    Args:
+        measure_bytes (bool): Whether to encode each result to record its
+            size. This is not included in the recorded times
+    Returns:
+        BuildTrace: The trace, complete once the block has ended
+    Example:
+        >>> with trace_build() as trace:
+        ...     home_tab(user)
+        >>> print(trace.format(max_depth=2))
+        >>> trace.dump("home_tab.folded")
+    """
+    trace = BuildTrace()
+    owner = threading.get_ident()
+    stack: List[list] = [trace.calls]
+    # The memory blocks held by the trace itself, so far.
+    overhead = [0]
+    # The blocks miscounted by the wrapper, for a call and for each child,
+    # from the temporary values it holds while measuring. Set by
+    # `_calibrate`, since they depend on the Python version.
+    bias = [0]
+    child_bias = [0.0]
+    blocks = sys.getallocatedblocks
+    get_ident = threading.get_ident
+
+    def wrap(name, builder):
+        @functools.wraps(builder)
+        def wrapper(*args, **kwargs):
+            if get_ident() != owner:
+                return builder(*args, **kwargs)
+            before_node = blocks()
+            node = TraceNode(name)
+            stack[-1].append(node)
+            stack.append(node.children)
+            overhead_before = overhead[0]
+            started = perf_counter()
+            start = blocks()
+            try:
+                result = builder(*args, **kwargs)
+            finally:
+                end = blocks()
+                node.seconds = perf_counter() - started
+                stack.pop()
+            node.allocations = round(
+                end - start - bias[0] - (overhead[0] - overhead_before))
+            if measure_bytes:
+                try:
+                    node.bytes = len(to_json_bytes(result))
+                except (TypeError, ValueError):
+                    pass
+            overhead[0] += (start - before_node) + (blocks() - end) \
+                - child_bias[0]
+            return result
+
+        return wrapper
+
+    bias[0], child_bias[0] = _calibrate(wrap, stack)
+    restore = _patch(wrap)
+    try:
+        yield trace
+    finally:
+        restore()
@@ -1,10 +1,14 @@
-def context(elements: list, block_id: str):
+from .block_id import content_block_id
+
+
+def context(elements: list, block_id: str = None):
     """
     Summary: Available in surfaces: `Modals`, `Messages` `Home tabs` \n
     Args:
     elements: An array of image elements and text objects. Max length: `10`\n
     block_id: A string acting as a unique identifier for a block. If not
-        specified, one will be generated. Maximum length for this field is
+        specified, one will be generated, or derived from the content
+        within `content_block_ids`. Maximum length for this field is
         255 characters. block_id should be unique for each message and each
         iteration of a message. If a message is updated, use a new block_id.
         Displays message context, which can include both images and text.
@@ -23,8 +27,12 @@ def context(elements: list, block_id: str):
     Gives you output similar to the JSON object here:
     https://api.slack.com/reference/block-kit/blocks#context_examples
     """
-    return {
+    node = {
         "type": "context",
-        "elements": elements,
-        "block_id": block_id
+        "elements": elements
     }
+    if block_id is None:
+        block_id = content_block_id("context", elements)
+    if block_id is not None:
+        node["block_id"] = block_id
+    return node
@@ -0,0 +1,118 @@
+from hashlib import blake2b
+from typing import List, NamedTuple, Tuple
+
+from .serialize import to_canonical_json_bytes
+
+
+def block_hash(block) -> bytes:
+    """
+    Summary: A structural hash of a block \n
+    Blocks that are equal as JSON get the same hash, in any process.
+
+    Args:
+        block (dict): The block
+    Returns:
+        bytes: A 16 byte digest
+    """
+    return blake2b(to_canonical_json_bytes(block), digest_size=16).digest()
+
+
+def block_hashes(blocks: list) -> List[Tuple[object, bytes]]:
+    """
+    Summary: The key and structural hash of each block \n
+    The key is the block's `block_id`. Blocks without one are keyed on
+    their content, so they still match when other blocks are inserted or
+    removed before them. The result can be kept instead of the blocks
+    themselves and passed to `diff_blocks` as `old`.
+
+    Args:
+        blocks (list): The blocks
+    Returns:
+        list: `(key, hash)` pairs, in block order
+    """
+    hashes = []
+    block_ids = set()
+    occurrences = {}
+    for block in blocks:
+        digest = block_hash(block)
+        key = block.get("block_id") if isinstance(block, dict) else None
+        if key is None or key in block_ids:
+            count = occurrences.get(digest, 0)
+            occurrences[digest] = count + 1
+            key = (digest, count)
+        else:
+            block_ids.add(key)
+        hashes.append((key, digest))
+    return hashes
+
+
+def _is_hash_pair(item) -> bool:
+    # A `(key, hash)` pair of `block_hashes`, rather than a block, which
+    # can be a dict, a node or a `Fragment`.
+    return type(item) is tuple and len(item) == 2 \
+        and isinstance(item[1], bytes)
+
+
+class BlockDiff(NamedTuple):
+    """
+    Summary: The difference between two block lists \n
+    Args:
+        added (list): `(index, block)` of blocks whose key is new
+        removed (list): The keys of blocks that are gone
+        changed (list): `(index, block)` of blocks whose key is kept but
+            whose content is different
+        moved (bool): Whether the kept blocks are in a different order
+        hashes (list): The `block_hashes` of the new blocks, to diff the
+            next update against
+    """
+    added: list
+    removed: list
+    changed: list
+    moved: bool
+    hashes: list
+
+    @property
+    def is_noop(self) -> bool:
+        """
+        Summary: Whether the new blocks are identical to the old ones, in
+        which case the update call can be skipped
+        """
+        return not (self.added or self.removed or self.changed or self.moved)
+
+
+def diff_blocks(old: list, new: list) -> BlockDiff:
+    """
+    Summary: Compares two block lists by `block_id` and structural hash \n
+    Args:
+        old (list): The blocks last sent, or their `block_hashes` (for
+            example `BlockDiff.hashes` from the previous update)
+        new (list): The blocks about to be sent
+    Returns:
+        BlockDiff: The added, removed and changed blocks
+    Example:
+        >>> diff = diff_blocks(previous_hashes, blocks)
+        >>> if not diff.is_noop:
+        ...     client.chat_update(channel=channel, ts=ts, blocks=blocks)
+        >>> previous_hashes = diff.hashes
+    """
+    if old and not _is_hash_pair(old[0]):
+        old = block_hashes(old)
+    new_hashes = block_hashes(new)
+    if old == new_hashes:
+        return BlockDiff([], [], [], False, new_hashes)
+    old_by_key = dict(old)
+    added = []
+    changed = []
+    kept = []
+    for index, (key, digest) in enumerate(new_hashes):
+        old_digest = old_by_key.get(key)
+        if old_digest is None:
+            added.append((index, new[index]))
+            continue
+        kept.append(key)
+        if old_digest != digest:
+            changed.append((index, new[index]))
+    new_keys = {key for key, _ in new_hashes}
+    removed = [key for key, _ in old if key not in new_keys]
+    old_order = [key for key, _ in old if key in new_keys]
+    return BlockDiff(added, removed, changed, old_order != kept, new_hashes)
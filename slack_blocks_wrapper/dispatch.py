@@ -0,0 +1,361 @@
+import asyncio
+import json
+import math
+import ssl
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, NamedTuple, Union
+from urllib.parse import urlsplit
+
+from .serialize import to_json_bytes
+
+SLACK_API_URL = "https://slack.com/api/"
+# The pause after a `429` whose `Retry-After` is missing or unreadable.
+DEFAULT_RETRY_AFTER = 1.0
+
+
+class Response(NamedTuple):
+    """
+    Summary: An HTTP response returned by a transport \n
+    Args:
+        status (int): The HTTP status code
+        headers (dict): The response headers, with lower case names
+        body (bytes): The response body
+    """
+    status: int
+    headers: dict
+    body: bytes
+
+
+class DispatchError(Exception):
+    """
+    Summary: Raised when a payload can't be delivered \n
+    Args:
+        message (str): What went wrong
+        response (Response): The last response received, if any
+    """
+
+    def __init__(self, message: str, response: Response = None):
+        super().__init__(message)
+        self.response = response
+
+
+class _Connection:
+    __slots__ = ("reader", "writer")
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def closed_by_peer(self) -> bool:
+        # Whether the server closed or reset the connection, as seen by the
+        # event loop while the connection was idle.
+        return (
+            self.reader.at_eof()
+            or self.reader.exception() is not None
+            or self.writer.is_closing()
+        )
+
+    def close(self):
+        self.writer.close()
+
+
+class HTTPTransport:
+    """
+    Summary: A minimal HTTP/1.1 client with a pool of keep-alive
+    connections \n
+    Implements the transport interface used by `Dispatcher`: an async
+    `request(method, body)` returning a `Response`, and an async `close()`.
+    Any object with these two methods can be used instead, for example to
+    send through another HTTP library or to a stub in tests.
+
+    Args:
+        token (str): The bot or user token sent as a bearer token
+        base_url (str): The Web API URL that method names are appended to
+        pool_size (int): The maximum number of open connections
+        timeout (float): Seconds to wait for each connection to open, and
+            for each response
+        ssl_context (ssl.SSLContext): The TLS settings for `https` URLs
+    """
+
+    def __init__(
+            self,
+            token: str = None,
+            base_url: str = SLACK_API_URL,
+            pool_size: int = 16,
+            timeout: float = 30,
+            ssl_context: ssl.SSLContext = None
+    ):
+        url = urlsplit(base_url)
+        if url.scheme not in ("http", "https"):
+            raise ValueError("base_url must be an http or https URL")
+        self.token = token
+        self.host = url.hostname
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.path = url.path if url.path.endswith("/") else url.path + "/"
+        self.ssl = (ssl_context or ssl.create_default_context()) \
+            if url.scheme == "https" else None
+        self.timeout = timeout
+        self._host_header = url.netloc.encode("ascii")
+        self.pool_size = pool_size
+        self._idle = []
+        self._slots = None
+
+    async def _connect(self):
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=self.ssl),
+            self.timeout)
+        return _Connection(reader, writer)
+
+    async def request(self, method: str, body: bytes) -> Response:
+        """
+        Summary: POSTs a JSON body to a Web API method \n
+        Args:
+            method (str): The Web API method, such as `chat.postMessage`
+            body (bytes): The JSON request body
+        Returns:
+            Response: The response
+        Raises:
+            ConnectionError: If the connection fails once the request was
+                sent. The request is not sent again, since Slack may have
+                received it
+            asyncio.TimeoutError: If the connection does not open, or the
+                response does not arrive, within `timeout`
+            asyncio.IncompleteReadError: If the connection is closed before
+                the whole response was read
+        """
+        head = [
+            b"POST " + (self.path + method).encode("ascii") + b" HTTP/1.1",
+            b"Host: " + self._host_header,
+            b"Content-Type: application/json; charset=utf-8",
+            b"Content-Length: " + str(len(body)).encode("ascii"),
+            b"Connection: keep-alive",
+        ]
+        if self.token:
+            head.append(b"Authorization: Bearer " + self.token.encode("ascii"))
+        message = b"\r\n".join(head) + b"\r\n\r\n" + body
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
+        async with self._slots:
+            connection = None
+            while self._idle:
+                connection = self._idle.pop()
+                if not connection.closed_by_peer():
+                    break
+                # Closed by the server while idle, before anything was sent
+                # on it, so the request goes on a new connection instead.
+                connection.close()
+                connection = None
+            if connection is None:
+                connection = await self._connect()
+            # A request that fails once it was sent is not sent again: the
+            # server may have acted on it, and posted a message twice.
+            return await self._exchange(connection, message)
+
+    async def _exchange(self, connection: _Connection, message: bytes):
+        try:
+            connection.writer.write(message)
+            await connection.writer.drain()
+            response, keep_alive = await asyncio.wait_for(
+                self._read_response(connection.reader), self.timeout)
+        except BaseException:
+            connection.close()
+            raise
+        if keep_alive:
+            self._idle.append(connection)
+        else:
+            connection.close()
+        return response
+
+    async def _read_response(self, reader: asyncio.StreamReader):
+        status_line = await reader.readuntil(b"\r\n")
+        version, status = status_line.split(b" ", 2)[:2]
+        headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0],
+                           16)
+                if size == 0:
+                    while await reader.readuntil(b"\r\n") != b"\r\n":
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+            delimited = True
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+            delimited = True
+        elif status in (b"204", b"304") or status.startswith(b"1"):
+            body = b""
+            delimited = True
+        else:
+            # Neither chunked nor sized: the body ends when the server
+            # closes the connection.
+            body = await reader.read()
+            delimited = False
+        keep_alive = (
+            delimited
+            and headers.get("connection", "").lower() != "close"
+            and version == b"HTTP/1.1"
+        )
+        return Response(int(status), headers, body), keep_alive
+
+    async def close(self):
+        """
+        Summary: Closes all pooled connections
+        """
+        while self._idle:
+            connection = self._idle.pop()
+            connection.close()
+            try:
+                await connection.writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):
+                pass
+
+
+def _retry_after(value: str) -> float:
+    # `Retry-After` is either a number of seconds or an HTTP date.
+    if value is None:
+        return DEFAULT_RETRY_AFTER
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        return max(seconds, 0.0) if math.isfinite(seconds) \
+            else DEFAULT_RETRY_AFTER
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return DEFAULT_RETRY_AFTER
+    if retry_at.tzinfo is None:
+        # HTTP dates are always in GMT.
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class Dispatcher:
+    """
+    Summary: Sends payloads built with this package concurrently \n
+    Payloads are sent over a pluggable transport with bounded
+    concurrency. A `429` response pauses every sender for the
+    `Retry-After` it gives, in seconds or as an HTTP date, since Slack rate
+    limits apply to the whole app, and the payload is then retried.
+
+    Args:
+        transport: An `HTTPTransport`, or any object with the same `request`
+            and `close` coroutines
+        concurrency (int): The maximum number of requests in flight
+        max_retries (int): How often a rate-limited payload is retried
+
+    Example:
+        >>> async def broadcast(payloads):
+        ...     async with Dispatcher(HTTPTransport(token)) as dispatcher:
+        ...         return await dispatcher.send_all(
+        ...             "chat.postMessage", payloads, return_exceptions=True)
+    """
+
+    def __init__(self, transport, concurrency: int = 16, max_retries: int = 5):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.transport = transport
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self._slots = None
+        self._resume_at = 0.0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.transport.close()
+
+    async def send(self, method: str, payload: Union[dict, bytes]) -> dict:
+        """
+        Summary: Sends one payload, retrying while rate limited \n
+        Args:
+            method (str): The Web API method, such as `chat.postMessage`
+            payload (Union[dict, bytes]): The request body, as a dict or
+                already serialized JSON
+        Returns:
+            dict: The decoded response body
+        Raises:
+            DispatchError: If the payload is still rate limited after
+                `max_retries` retries, or the response is not JSON
+        """
+        body = payload if isinstance(payload, bytes) \
+            else to_json_bytes(payload)
+        loop = asyncio.get_running_loop()
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.concurrency)
+        for _ in range(self.max_retries + 1):
+            async with self._slots:
+                delay = self._resume_at - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                response = await self.transport.request(method, body)
+            if response.status != 429:
+                break
+            retry_after = _retry_after(response.headers.get("retry-after"))
+            self._resume_at = max(self._resume_at, loop.time() + retry_after)
+        else:
+            raise DispatchError(
+                f"{method} still rate limited after "
+                f"{self.max_retries} retries", response)
+        try:
+            return json.loads(response.body)
+        except ValueError:
+            raise DispatchError(
+                f"{method} returned HTTP {response.status} with a non-JSON "
+                f"body", response) from None
+
+    async def send_all(
+            self,
+            method: str,
+            payloads: Iterable[Union[dict, bytes]],
+            return_exceptions: bool = False
+    ) -> list:
+        """
+        Summary: Sends many payloads concurrently \n
+        Payloads are read from the iterable only as senders become free, so
+        a generator of payloads is never fully materialized.
+
+        Args:
+            method (str): The Web API method, such as `chat.postMessage`
+            payloads (Iterable[Union[dict, bytes]]): The request bodies
+            return_exceptions (bool): Return the exception of a failed
+                payload in its place instead of raising it
+        Returns:
+            list: The decoded responses, in the order of `payloads`
+        """
+        results = {}
+        payloads = enumerate(payloads)
+
+        async def worker():
+            for index, payload in payloads:
+                try:
+                    results[index] = await self.send(method, payload)
+                except Exception as error:
+                    if not return_exceptions:
+                        raise
+                    results[index] = error
+
+        workers = [
+            asyncio.ensure_future(worker()) for _ in range(self.concurrency)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            raise
+        return [results[index] for index in range(len(results))]
@@ -1,3 +1,6 @@
+from .block_id import content_block_id
+
+
 def divider_node(block_id: str = None):
     """
     Available surfaces: `Modals` `Messages` `Home tabs`
@@ -5,7 +8,8 @@ def divider_node(block_id: str = None):
      The divider block is nice and neat, requiring only a `type`.
 
     Args: block_id (str): [optional] The unique identifier for this block.
-    One will be generated automatically if not specified.
+    One will be generated automatically if not specified, or derived from the
+    content within `content_block_ids`.
 
     Call to this function returns a dict with the following structure:
        {
@@ -15,6 +19,8 @@ def divider_node(block_id: str = None):
     node = {
         "type": "divider"
     }
+    if block_id is None:
+        block_id = content_block_id("divider")
     if block_id is not None:
         node["block_id"] = block_id
     return node
@@ -1,23 +1,46 @@
-from .button import button_element
-from .checkbox import checkbox_element
-from .datepicker import datepicker_element
-from .image import image_element
-from .datepicker import datepicker_element
-from .multiselect import (
-    multiconversations_select_element,
-    multiuser_select_element,
-    multichannels_select_element,
-    multiexternal_select_element,
-    multistatic_select_element
+from .._lazy import lazy_exports
+
+# Element modules are imported on first use of one of their names, to keep
+# importing the package cheap.
+_EXPORTS = {
+    "button_element": "button",
+    "TextCache": "cache",
+    "FrozenDict": "cache",
+    "FrozenList": "cache",
+    "checkbox_element": "checkbox",
+    "datepicker_element": "datepicker",
+    "image_element": "image",
+    "multiconversations_select_element": "multiselect",
+    "multiuser_select_element": "multiselect",
+    "multichannels_select_element": "multiselect",
+    "multiexternal_select_element": "multiselect",
+    "multistatic_select_element": "multiselect",
+    "plain_text_input_element": "plain_text_input",
+    "radio_button_group_element": "radio_button",
+    "conversations_select_element": "select",
+    "user_select_element": "select",
+    "channels_select_element": "select",
+    "external_select_element": "select",
+    "static_select_element": "select",
+    "escape": "mrkdwn",
+    "escape_all": "mrkdwn",
+    "user_mention": "mrkdwn",
+    "channel_mention": "mrkdwn",
+    "usergroup_mention": "mrkdwn",
+    "mentions": "mrkdwn",
+    "link": "mrkdwn",
+    "OptionIndex": "option_index",
+    "OptionSet": "option_set",
+    "build_options": "options",
+    "build_option_groups": "options",
+    "bulk_options": "options",
+    "overflow_menu_element": "overflow_menu",
+    "text_element": "text",
+    "TextType": "text",
+}
+
+__all__ = list(_EXPORTS)
+_EXPORTS.update(
+    (module, module) for module in set(_EXPORTS.values())
 )
-from .plain_text_input import plain_text_input_element
-from .radio_button import radio_button_group_element
-from .select import (
-    conversations_select_element,
-    user_select_element,
-    channels_select_element,
-    external_select_element,
-    static_select_element
-)
-from .overflow_menu import overflow_menu_element
-from .text import text_element, TextType
\ No newline at end of file
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
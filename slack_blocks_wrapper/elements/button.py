@@ -1,5 +1,6 @@
 from typing import Literal
 from .text import text_element, TextType
+from ..validation import check, validation_enabled
 
 
 def button_element(
@@ -11,8 +12,24 @@ def button_element(
         accessibility_label: str = None,
         confirm: dict = None
 ):
-    if style not in ["danger", "primary", None]:
-        raise ValueError("style must be `primary` or `danger`")
+    node = _button(
+        text, action_id, style, value, url, accessibility_label, confirm)
+    if validation_enabled():
+        check(node)
+    return node
+
+
+def _button(
+        text: str,
+        action_id: str,
+        style: str,
+        value: str,
+        url: str,
+        accessibility_label: str,
+        confirm: dict
+):
+    # Builds the node without validating it, for nodes that validated
+    # their fields when they were created.
     node = {
         "type": "button",
         **text_element(text, TextType.PLAIN_TEXT),
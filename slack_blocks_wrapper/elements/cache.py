@@ -0,0 +1,194 @@
+from functools import lru_cache
+
+from .text import text_element, TextType
+
+
+class FrozenDict(dict):
+    """
+    Summary: A read-only dict \n
+    Serializes like a regular dict and can be spread with `**`, but raises
+    `TypeError` on any attempt to change it, so cached objects can be shared
+    between messages safely.
+    """
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("cached text and option objects are immutable")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+class FrozenList(list):
+    """
+    Summary: A read-only list \n
+    The list counterpart of `FrozenDict`, for the lists inside cached
+    objects, such as the `options` of an option group.
+    """
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("cached text and option objects are immutable")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __iadd__ = _immutable
+    __imul__ = _immutable
+    append = _immutable
+    clear = _immutable
+    extend = _immutable
+    insert = _immutable
+    pop = _immutable
+    remove = _immutable
+    reverse = _immutable
+    sort = _immutable
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+
+def _freeze_value(value):
+    if type(value) is dict:
+        return _freeze(value)
+    if type(value) is list:
+        return FrozenList(_freeze_value(item) for item in value)
+    return value
+
+
+def _freeze(node: dict):
+    return FrozenDict(
+        (key, _freeze_value(value)) for key, value in node.items()
+    )
+
+
+def _text_element(
+        text: str,
+        text_type: TextType,
+        emoji: bool = True,
+        verbatim: bool = False,
+        value: str = None,
+        escape: bool = False
+):
+    return _freeze(
+        text_element(text, text_type, emoji, verbatim, value, escape))
+
+
+def _cacheable(*strings) -> bool:
+    # The slots of a template are `str` subclasses that compare and hash
+    # equal to their sample text, so a cached object would be shared
+    # between a slot, other slots and the plain string. They are built
+    # without the cache instead.
+    for string in strings:
+        if string is not None and type(string) is not str:
+            return False
+    return True
+
+
+def _option(text: str, value: str, description: str = None):
+    node = text_element(text, TextType.PLAIN_TEXT, value=value)
+    if description is not None:
+        node["description"] = text_element(
+            description, TextType.PLAIN_TEXT)["text"]
+    return _freeze(node)
+
+
+class TextCache:
+    """
+    Summary: A bounded LRU cache of text and option objects \n
+    Repeated labels, placeholders and options are built once and then
+    shared. Cached objects are `FrozenDict`s, so they can't be changed by
+    one message and leak into another. Objects with template slots are
+    built anew on every call, and not counted in `info`.
+
+    Args:
+        maxsize (int): The maximum number of text objects and, separately,
+            of option objects kept. Least recently used entries are evicted
+            first.
+
+    Example:
+        >>> cache = TextCache(maxsize=512)
+        >>> static_select_element(
+        ...     "Select a channel",
+        ...     "channel",
+        ...     options=[cache.option(name, name) for name in channels]
+        ... )
+        >>> cache.info()
+        {'hits': 49, 'misses': 1, 'maxsize': 512, 'currsize': 1}
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize is None or maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self._text_element = lru_cache(maxsize)(_text_element)
+        self._option = lru_cache(maxsize)(_option)
+
+    def text_element(
+            self,
+            text: str,
+            text_type: TextType,
+            emoji: bool = True,
+            verbatim: bool = False,
+            value: str = None,
+            escape: bool = False
+    ):
+        """
+        Summary: A cached, immutable `elements.text_element` \n
+        Args:
+            text (str): The text to display
+            text_type (TextType): The text type whether plain text or
+                markdown
+            emoji (bool): Whether to display emojis or not
+            verbatim (bool): Whether to display verbatim or not
+            value (str): The value to be passed down the app
+            escape (bool): Whether to escape `&`, `<` and `>` in markdown
+                text, for text from users
+        """
+        build = self._text_element if _cacheable(text, value) \
+            else _text_element
+        return build(text, text_type, emoji, verbatim, value, escape)
+
+    def option(self, text: str, value: str, description: str = None):
+        """
+        Summary: A cached, immutable option object \n
+        Args:
+            text (str): The label of the option
+            value (str): The value to be passed down the app
+            description (str): A plain text description shown below the
+                label
+        """
+        build = self._option if _cacheable(text, value, description) \
+            else _option
+        return build(text, value, description)
+
+    def info(self):
+        """
+        Summary: Hit and miss counters of the cache \n
+        Returns:
+            dict: `hits`, `misses` and `currsize`, summed over text and
+            option objects, and the `maxsize` of each
+        """
+        text = self._text_element.cache_info()
+        option = self._option.cache_info()
+        return {
+            "hits": text.hits + option.hits,
+            "misses": text.misses + option.misses,
+            "maxsize": self.maxsize,
+            "currsize": text.currsize + option.currsize
+        }
+
+    def clear(self):
+        """
+        Summary: Empties the cache and resets its counters
+        """
+        self._text_element.cache_clear()
+        self._option.cache_clear()
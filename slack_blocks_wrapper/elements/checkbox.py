@@ -11,7 +11,7 @@ def checkbox_element(
     Checkboxes are only supported in the following app surfaces: `Home tabs`, `Modals`, `Messages`
 
     Args:
-        options (list): A list of options that can be selected by the user.
+        options (list): A list of options that can be selected by the user, or an `OptionSet` shared with other elements.
         action_id (str): The action_id of the block.
         initial_options (list, optional): A list of options that are selected when the checkbox is loaded. Defaults to None.
         confirm (dict, optional): A dictionary containing the following fields:
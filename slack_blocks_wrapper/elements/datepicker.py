@@ -1,6 +1,5 @@
-import re
-
 from .text import text_element, TextType
+from ..validation import check, validation_enabled
 
 
 def datepicker_element(
@@ -15,14 +14,12 @@ def datepicker_element(
         "action_id": action_id,
         "focus_on_load": focus_on_load
     }
-    if initial_date and re.search(
-            "((?:19|20)\\d\\d)-(0?[1-9]|1[012])-([12][0-9]|3[01]|0?[1-9])",
-            initial_date):
+    if initial_date:
         node["initial_date"] = initial_date
-    else:
-        raise ValueError("`initial_date` must be a valid date")
     if placeholder:
         node["placeholder"] = text_element(placeholder, TextType.PLAIN_TEXT)
     if confirm:
         node["confirm"] = confirm
+    if validation_enabled():
+        check(node)
     return node
@@ -0,0 +1,129 @@
+# Slack reads `<...>` as a link, mention or command, and `&` starts an
+# entity, so these are the only characters that need escaping in mrkdwn.
+# https://api.slack.com/reference/surfaces/formatting#escaping
+_SEPARATOR = "\x00"
+
+
+def _column(values):
+    # As in `options`; not imported from there, since `text` imports this
+    # module.
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    return values
+
+
+def escape(text: str) -> str:
+    """
+    Summary: Escapes `&`, `<` and `>` for use in mrkdwn text \n
+    Args:
+        text (str): Text from users or other untrusted sources
+    Returns:
+        str: The escaped text
+    Example:
+        >>> escape("Q&A <today>")
+        'Q&amp;A &lt;today&gt;'
+    """
+    # Chained `str.replace` makes three passes in C, which is several times
+    # faster than one `str.translate` pass with multi-character
+    # replacements, and returns the string as is when there is nothing to
+    # escape.
+    return text.replace("&", "&amp;").replace("<", "&lt;") \
+        .replace(">", "&gt;")
+
+
+def escape_all(texts: list) -> list:
+    """
+    Summary: Escapes many strings for use in mrkdwn text at once \n
+    The strings are joined, escaped in one go and split again, instead of
+    being escaped one at a time.
+
+    Args:
+        texts (list): The strings. NumPy arrays and pandas series are
+            accepted too
+    Returns:
+        list: The escaped strings, in order
+    """
+    texts = _column(texts)
+    if not texts:
+        return []
+    joined = _SEPARATOR.join(texts)
+    if joined.count(_SEPARATOR) != len(texts) - 1:
+        # A string contains the separator itself.
+        return [escape(text) for text in texts]
+    return escape(joined).split(_SEPARATOR)
+
+
+def user_mention(user_id: str) -> str:
+    """
+    Summary: Mentions a user in mrkdwn text \n
+    Args:
+        user_id (str): The user ID, such as `U0123ABC`
+    Returns:
+        str: The mention, such as `<@U0123ABC>`
+    """
+    return "<@" + user_id + ">"
+
+
+def channel_mention(channel_id: str) -> str:
+    """
+    Summary: Links to a channel in mrkdwn text \n
+    Args:
+        channel_id (str): The channel ID, such as `C0123ABC`
+    Returns:
+        str: The channel link, such as `<#C0123ABC>`
+    """
+    return "<#" + channel_id + ">"
+
+
+def usergroup_mention(usergroup_id: str) -> str:
+    """
+    Summary: Mentions a user group in mrkdwn text \n
+    Args:
+        usergroup_id (str): The user group ID, such as `S0123ABC`
+    Returns:
+        str: The mention, such as `<!subteam^S0123ABC>`
+    """
+    return "<!subteam^" + usergroup_id + ">"
+
+
+_MENTIONS = {
+    "U": "<@", "W": "<@",
+    "C": "<#", "G": "<#",
+    "S": "<!subteam^",
+}
+
+
+def mentions(ids: list) -> list:
+    """
+    Summary: Formats many user, channel and user group mentions at once \n
+    The kind of each mention is taken from the first letter of the ID.
+
+    Args:
+        ids (list): User (`U`, `W`), channel (`C`, `G`) and user group
+            (`S`) IDs. NumPy arrays and pandas series are accepted too
+    Returns:
+        list: The mentions, in order
+    """
+    prefixes = _MENTIONS
+    formatted = []
+    append = formatted.append
+    for id_ in _column(ids):
+        prefix = prefixes.get(id_[:1])
+        if prefix is None:
+            raise ValueError(f"can't tell what kind of ID {id_!r} is")
+        append(prefix + id_ + ">")
+    return formatted
+
+
+def link(url: str, text: str = None) -> str:
+    """
+    Summary: A link in mrkdwn text \n
+    Args:
+        url (str): The URL
+        text (str): The text shown instead of the URL. It is escaped
+    Returns:
+        str: The link, such as `<https://example.com|Example>`
+    """
+    if text is None:
+        return "<" + escape(url) + ">"
+    return "<" + escape(url) + "|" + escape(text) + ">"
@@ -1,6 +1,7 @@
 from typing import List
 
 from .text import text_element, TextType
+from ..validation import check, validation_enabled
 
 
 def multiconversations_select_element(placeholder: str, action_id: str):
@@ -46,7 +47,7 @@ def multistatic_select_element(
 
     Args:
         placeholder (str): The placeholder text to be displayed in the input
-        options (list): The list of options to be displayed in the select menu
+        options (list): The list of options to be displayed in the select menu, or an `OptionSet` shared with other elements
         action_id (str): The action id of the input
         option_groups (list): The list of option groups to be displayed in the select menu
         initial_options (str): The initial options to be selected in the select menu
@@ -59,9 +60,6 @@ def multistatic_select_element(
 
     Ref: https://api.slack.com/reference/block-kit/block-elements#static_multi_select
     """
-    if options and option_groups:
-        raise ValueError(
-            "`options` and `option_groups` cannot be used together")
     node = {
         "type": "multi_static_select",
         "placeholder": text_element(placeholder, TextType.PLAIN_TEXT)['text'],
@@ -78,6 +76,8 @@ def multistatic_select_element(
         node["max_selected_items"] = max_selected_items
     if focus_on_load:
         node["focus_on_load"] = focus_on_load
+    if validation_enabled():
+        check(node)
     return node
 
 
@@ -153,10 +153,6 @@ def multiuser_select_element(
 
     Ref: https://api.slack.com/reference/block-kit/block-elements#multi_users_select
     """
-    if not placeholder:
-        raise ValueError("Placeholder is required")
-    if not action_id:
-        raise ValueError("Action ID is required")
     node = {
         "type": "multi_users_select",
         "placeholder": text_element(placeholder, TextType.PLAIN_TEXT)['text'],
@@ -170,6 +166,8 @@ def multiuser_select_element(
         node["max_selected_items"] = max_selected_items
     if focus_on_load:
         node["focus_on_load"] = focus_on_load
+    if validation_enabled():
+        check(node)
     return node
 
 
@@ -199,10 +197,6 @@ def multichannels_select_element(
 
     Ref: https://api.slack.com/reference/block-kit/block-elements#multi_channels_select
     """
-    if not placeholder:
-        raise ValueError("Placeholder is required")
-    if not action_id:
-        raise ValueError("Action ID is required")
     node = {
         "type": "multi_channels_select",
         "placeholder": text_element(placeholder, TextType.PLAIN_TEXT)['text'],
@@ -216,4 +210,6 @@ def multichannels_select_element(
         node["max_selected_items"] = max_selected_items
     if focus_on_load:
         node["focus_on_load"] = focus_on_load
+    if validation_enabled():
+        check(node)
     return node
@@ -0,0 +1,164 @@
+from bisect import bisect_left
+from typing import Sequence
+
+from .options import MAX_OPTIONS, _column
+from .text import TextType
+
+_PLAIN_TEXT = TextType.PLAIN_TEXT.value
+# Separates the searchable text from the option value in index keys. Sorts
+# before any printable character, so every key starting with a query sits
+# in one contiguous range of the sorted keys.
+_SEPARATOR = "\x00"
+
+
+def _value(value) -> str:
+    # As in `build_options`, values such as the int ids of a NumPy column
+    # are sent as strings.
+    return value if type(value) is str else str(value)
+
+
+class OptionIndex:
+    """
+    Summary: A prefix search index for `external_select_element` and
+    `multiexternal_select_element` option requests \n
+    Options are kept in a sorted array, so a query is a binary search for
+    the start of its prefix range followed by reading at most `limit`
+    entries, whatever the size of the index. Matching is case insensitive.
+
+    Args:
+        labels (Sequence[str]): The text of each option
+        values (Sequence[str]): The value of each option. Values identify
+            options for `remove`. Values that are not `str` are converted
+            with `str`
+        descriptions (Sequence[str], optional): A description of each option
+        min_query_length (int): Queries shorter than this return no options.
+            Use the same value as on the select element.
+        match_words (bool): Also match the start of every word of a label,
+            not only the start of the label
+
+    Example:
+        >>> index = OptionIndex(names, ids, min_query_length=2)
+        >>> @bolt_app.options("project")
+        ... def project_options(ack, payload):
+        ...     ack(index.response(payload["value"]))
+    """
+
+    def __init__(
+            self,
+            labels: Sequence[str] = (),
+            values: Sequence[str] = (),
+            descriptions: Sequence[str] = None,
+            min_query_length: int = None,
+            match_words: bool = False
+    ):
+        self.min_query_length = min_query_length or 0
+        self.match_words = match_words
+        self._keys = []
+        self._options = {}
+        labels = _column(labels, "labels")
+        values = _column(values, "values", len(labels))
+        if descriptions is None:
+            descriptions = [None] * len(labels)
+        else:
+            descriptions = _column(descriptions, "descriptions", len(labels))
+        for label, value, description in zip(labels, values, descriptions):
+            value = _value(value)
+            if value in self._options:
+                raise ValueError(f"duplicate option value: {value!r}")
+            self._options[value] = (label, description)
+            self._keys.extend(self._index_keys(label, value))
+        self._keys.sort()
+
+    def __len__(self):
+        return len(self._options)
+
+    def __contains__(self, value: str):
+        return _value(value) in self._options
+
+    def _index_keys(self, label: str, value: str):
+        words = label.casefold().split()
+        suffix = _SEPARATOR + value
+        if not self.match_words:
+            return [" ".join(words) + suffix]
+        return [
+            " ".join(words[i:]) + suffix for i in range(len(words))
+        ] or [suffix]
+
+    def add(self, label: str, value: str, description: str = None):
+        """
+        Summary: Adds an option, replacing any option with the same value \n
+        Args:
+            label (str): The text of the option
+            value (str): The value of the option
+            description (str, optional): A description of the option
+        """
+        value = _value(value)
+        if value in self._options:
+            self.remove(value)
+        self._options[value] = (label, description)
+        keys = self._keys
+        for key in self._index_keys(label, value):
+            keys.insert(bisect_left(keys, key), key)
+
+    def remove(self, value: str):
+        """
+        Summary: Removes the option with the given value \n
+        Args:
+            value (str): The value of the option
+        Raises:
+            KeyError: If there is no option with this value
+        """
+        value = _value(value)
+        label, _ = self._options.pop(value)
+        keys = self._keys
+        for key in self._index_keys(label, value):
+            del keys[bisect_left(keys, key)]
+
+    def search(self, query: str, limit: int = MAX_OPTIONS):
+        """
+        Summary: Finds the options whose label starts with `query` \n
+        Args:
+            query (str): The text typed by the user
+            limit (int): The maximum number of options returned
+        Returns:
+            list: Option objects, in label order
+        """
+        if len(query) < self.min_query_length:
+            return []
+        prefix = " ".join(query.casefold().split())
+        keys = self._keys
+        options = self._options
+        position = bisect_left(keys, prefix)
+        seen = set()
+        found = []
+        while position < len(keys) and len(found) < limit:
+            key = keys[position]
+            position += 1
+            if not key.startswith(prefix):
+                break
+            value = key[key.index(_SEPARATOR) + 1:]
+            if value in seen:
+                continue
+            seen.add(value)
+            label, description = options[value]
+            option = {
+                "text": {"type": _PLAIN_TEXT, "text": label, "emoji": True},
+                "value": value
+            }
+            if description is not None:
+                option["description"] = {
+                    "type": _PLAIN_TEXT, "text": description, "emoji": True
+                }
+            found.append(option)
+        return found
+
+    def response(self, query: str, limit: int = MAX_OPTIONS):
+        """
+        Summary: The body to send back to Slack for an options request \n
+        Args:
+            query (str): The `value` of the options request payload
+            limit (int): The maximum number of options returned
+        Returns:
+            dict: `{"options": [...]}`
+        """
+        return {"options": self.search(query, limit)}
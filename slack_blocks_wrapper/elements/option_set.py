@@ -0,0 +1,50 @@
+from .. import serialize
+from ..serialize import Fragment, to_json_bytes
+from .cache import _freeze
+
+
+class OptionSet(tuple):
+    """
+    Summary: An immutable list of options, shared between elements \n
+    Pass an option set as the `options` (or `option_groups`) of any number
+    of select, checkbox, radio button or overflow elements. Its options,
+    down to those of its option groups, are frozen and encoded once, and
+    `to_json_bytes` splices that encoding into every element using it, so
+    memory and encoding time grow with the number of distinct option sets
+    rather than with the number of elements.
+
+    An option set is a `tuple`, so it can also be serialized by any other
+    JSON encoder, as a plain list.
+
+    Args:
+        options (Iterable[dict]): The options, as built by `text_element`,
+            `build_options` or `TextCache.option`, or option groups
+    Attributes:
+        fragment (Fragment): The encoded options
+
+    Example:
+        >>> PROJECTS = OptionSet(build_options(names, ids))
+        >>> blocks = [
+        ...     section.multi_static_select(name, PROJECTS, name)
+        ...     for name in teams
+        ... ]
+        >>> to_json_bytes(blocks)
+    """
+
+    def __new__(cls, options=()):
+        node = super().__new__(cls, (
+            _freeze(option) if type(option) is dict else option
+            for option in options
+        ))
+        node.fragment = Fragment(to_json_bytes(list(node)))
+        return node
+
+    def __reduce__(self):
+        return type(self), (tuple(self),)
+
+    def __repr__(self):
+        return "OptionSet({})".format(tuple.__repr__(self))
+
+
+# Turns on the scan for option sets in `to_json_bytes`.
+serialize._OptionSet = OptionSet
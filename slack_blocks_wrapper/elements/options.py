@@ -0,0 +1,147 @@
+from typing import Sequence
+
+from .text import TextType
+
+MAX_OPTIONS = 100
+MAX_OPTION_GROUPS = 100
+
+_PLAIN_TEXT = TextType.PLAIN_TEXT.value
+
+
+def _column(values: Sequence, name: str, length: int = None):
+    # NumPy arrays (and pandas series) convert to plain python lists in C,
+    # which is much faster to iterate than the array itself.
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+    if length is not None and len(values) != length:
+        raise ValueError(f"`{name}` must be as long as `labels`")
+    return values
+
+
+def build_options(
+        labels: Sequence[str],
+        values: Sequence[str],
+        descriptions: Sequence[str] = None
+):
+    """
+    Summary: Builds a list of option objects from parallel columns \n
+    Gives the same options as calling
+    `text_element(label, TextType.PLAIN_TEXT, value=value)` per item, in one
+    pass.
+
+    Args:
+        labels (Sequence[str]): The text of each option
+        values (Sequence[str]): The value of each option. Non-string values
+            are converted with `str`
+        descriptions (Sequence[str], optional): A plain text description
+            shown below each option
+    Returns:
+        list: The option objects
+    Example:
+        >>> build_options(["Red", "Green"], ["red", "green"])
+    """
+    labels = _column(labels, "labels")
+    values = _column(values, "values", len(labels))
+    if descriptions is None:
+        return [
+            {
+                "text": {"type": _PLAIN_TEXT, "text": label, "emoji": True},
+                "value": value if type(value) is str else str(value)
+            }
+            for label, value in zip(labels, values)
+        ]
+    descriptions = _column(descriptions, "descriptions", len(labels))
+    return [
+        {
+            "text": {"type": _PLAIN_TEXT, "text": label, "emoji": True},
+            "value": value if type(value) is str else str(value),
+            "description": {
+                "type": _PLAIN_TEXT, "text": description, "emoji": True
+            }
+        }
+        for label, value, description in zip(labels, values, descriptions)
+    ]
+
+
+def build_option_groups(
+        labels: Sequence[str],
+        values: Sequence[str],
+        descriptions: Sequence[str] = None,
+        group_size: int = MAX_OPTIONS,
+        group_label: str = "Options {start}-{end}"
+):
+    """
+    Summary: Builds option groups of at most `group_size` options each \n
+    Args:
+        labels (Sequence[str]): The text of each option
+        values (Sequence[str]): The value of each option
+        descriptions (Sequence[str], optional): A description of each option
+        group_size (int): The number of options per group. Max: `100`
+        group_label (str): A format string for the label of each group. Can
+            use `{start}`, `{end}`, `{first}` and `{last}`: the 1-based
+            positions and the labels of the first and last option in the
+            group.
+    Returns:
+        list: The option groups
+    """
+    if not 0 < group_size <= MAX_OPTIONS:
+        raise ValueError(f"group_size must be between 1 and {MAX_OPTIONS}")
+    options = build_options(labels, values, descriptions)
+    if len(options) > group_size * MAX_OPTION_GROUPS:
+        raise ValueError(
+            f"at most {group_size * MAX_OPTION_GROUPS} options fit in "
+            f"{MAX_OPTION_GROUPS} groups of {group_size}"
+        )
+    groups = []
+    for start in range(0, len(options), group_size):
+        chunk = options[start:start + group_size]
+        groups.append({
+            "label": {
+                "type": _PLAIN_TEXT,
+                "text": group_label.format(
+                    start=start + 1,
+                    end=start + len(chunk),
+                    first=chunk[0]["text"]["text"],
+                    last=chunk[-1]["text"]["text"]
+                ),
+                "emoji": True
+            },
+            "options": chunk
+        })
+    return groups
+
+
+def bulk_options(
+        labels: Sequence[str],
+        values: Sequence[str],
+        descriptions: Sequence[str] = None,
+        group_label: str = "Options {start}-{end}"
+):
+    """
+    Summary: Builds `options`, or `option_groups` past Slack's 100-option
+    limit \n
+    The result is meant to be passed as keyword arguments to
+    `static_select_element` or `multistatic_select_element`.
+
+    Args:
+        labels (Sequence[str]): The text of each option
+        values (Sequence[str]): The value of each option
+        descriptions (Sequence[str], optional): A description of each option
+        group_label (str): A format string for the label of each group, see
+            `build_option_groups`
+    Returns:
+        dict: Either `{"options": [...]}` or `{"option_groups": [...]}`
+    Example:
+        >>> static_select_element(
+        ...     "Select a project",
+        ...     "project",
+        ...     **bulk_options(df["name"].values, df["id"].values)
+        ... )
+    """
+    if len(labels) <= MAX_OPTIONS:
+        return {"options": build_options(labels, values, descriptions)}
+    return {
+        "option_groups": build_option_groups(
+            labels, values, descriptions, group_label=group_label
+        )
+    }
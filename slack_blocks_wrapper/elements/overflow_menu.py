@@ -1,3 +1,6 @@
+from ..validation import check, validation_enabled
+
+
 def overflow_menu_element(
         options: list,
         action_id: str,
@@ -25,10 +28,6 @@ def overflow_menu_element(
 
     Ref: https://api.slack.com/reference/block-kit/block-elements#overflow
     """
-    if not action_id:
-        raise Exception("action_id is required")
-    if not options:
-        raise Exception("options is required")
     node = {
         "type": "overflow",
         "action_id": action_id
@@ -37,4 +36,6 @@ def overflow_menu_element(
         node["confirm"] = confirm
     if options:
         node["options"] = options
+    if validation_enabled():
+        check(node)
     return node
@@ -1,5 +1,7 @@
 from typing import Literal
 
+from ..validation import check, validation_enabled
+
 
 def plain_text_input_element(
         action_id: str,
@@ -40,8 +42,6 @@ def plain_text_input_element(
         dict: A plain-text input block
     Ref: https://api.slack.com/reference/block-kit/block-elements#input
     """
-    if not action_id:
-        raise Exception('action_id is required')
     node = {
         "type": "plain_text_input",
         "action_id": action_id,
@@ -61,4 +61,6 @@ def plain_text_input_element(
         }
     if focus_on_load:
         node['focus_on_load'] = focus_on_load
+    if validation_enabled():
+        check(node)
     return node
@@ -1,3 +1,6 @@
+from ..validation import check, validation_enabled
+
+
 def radio_button_group_element(
         action_id: str,
         options: list,
@@ -24,10 +27,6 @@ def radio_button_group_element(
         dict: A radio button group element.
     Ref: https://api.slack.com/reference/block-kit/block-elements#radio_button_group
     """
-    if not action_id:
-        raise Exception('Action ID is required')
-    if not options:
-        raise Exception('Options are required')
     node = {
         "type": "radio_button_group",
         "action_id": action_id,
@@ -39,4 +38,6 @@ def radio_button_group_element(
         node['confirm'] = confirm
     if focus_on_load:
         node['focus_on_load'] = focus_on_load
+    if validation_enabled():
+        check(node)
     return node
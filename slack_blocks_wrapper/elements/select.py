@@ -1,6 +1,7 @@
 from typing import List, Literal
 
 from .text import text_element, TextType
+from ..validation import check, validation_enabled
 
 
 def user_select_element(
@@ -27,20 +28,33 @@ def static_select_element(
         confirm: dict = None,
         focus_on_load: bool = False
 ):
-    if not action_id:
-        raise ValueError("action_id is required")
-    if not options and not option_groups:
-        raise ValueError("options or option_groups is required")
-    if options and option_groups:
-        raise ValueError("options and option_groups cannot be used together")
+    node = _static_select(
+        placeholder, action_id, options, option_groups, initial_option,
+        confirm, focus_on_load)
+    if validation_enabled():
+        check(node)
+    return node
+
+
+def _static_select(
+        placeholder: str,
+        action_id: str,
+        options: list,
+        option_groups: list,
+        initial_option: str,
+        confirm: dict,
+        focus_on_load: bool
+):
+    # Builds the node without validating it, for nodes that validated
+    # their fields when they were created.
     node = {
         "type": "static_select",
         "placeholder": text_element(placeholder, TextType.PLAIN_TEXT),
         "action_id": action_id
     }
-    if options and not option_groups:
+    if options:
         node["options"] = options
-    if option_groups and not options:
+    if option_groups:
         node["option_groups"] = option_groups
     if initial_option:
         node["initial_option"] = initial_option
@@ -59,10 +73,6 @@ def external_select_element(
         confirm: dict = None,
         focus_on_load: bool = False
 ):
-    if not placeholder:
-        raise ValueError("placeholder is required")
-    if not action_id:
-        raise ValueError("action_id is required")
     node = {
         "type": "external_select",
         "placeholder": text_element(placeholder, TextType.PLAIN_TEXT),
@@ -76,6 +86,8 @@ def external_select_element(
         node["confirm"] = confirm
     if focus_on_load:
         node["focus_on_load"] = True
+    if validation_enabled():
+        check(node)
     return node
 
 
@@ -89,10 +101,6 @@ def conversations_select_element(
         response_url_enabled: bool = False,
         filter: str = None,
 ):
-    if not placeholder:
-        raise ValueError("placeholder is required")
-    if not action_id:
-        raise ValueError("action_id is required")
     node = {
         "type": "conversations_select",
         "placeholder": text_element(placeholder, TextType.PLAIN_TEXT),
@@ -110,6 +118,8 @@ def conversations_select_element(
         node["response_url_enabled"] = True
     if filter:
         node["filter"] = filter
+    if validation_enabled():
+        check(node)
     return node
 
 
@@ -121,10 +131,6 @@ def channels_select_element(
         response_url_enabled: bool = False,
         focus_on_load: bool = False
 ):
-    if not placeholder:
-        raise ValueError("placeholder is required")
-    if not action_id:
-        raise ValueError("action_id is required")
     node = {
         "type": "channels_select",
         "placeholder": text_element(placeholder, TextType.PLAIN_TEXT),
@@ -138,6 +144,8 @@ def channels_select_element(
         node["focus_on_load"] = True
     if response_url_enabled:
         node["response_url_enabled"] = True
+    if validation_enabled():
+        check(node)
     return node
 
 
@@ -171,12 +179,11 @@ def filtered_conversations_select(
 
     Returns:
         A filtered conversations select action.
+    Raises:
+        ValidationError: If `placeholder` or `action_id` is empty, as for
+            `conversations_select_element`, or `conversations` holds an
+            unknown conversation type.
     """
-    if conversations and conversations not in [
-        'im', 'mpim', 'private', 'public'
-    ]:
-        raise ValueError(f'conversations must be one of: im, mpim, private, '
-                         f'public')
     node = {
         "type": "conversations_select",
         "placeholder": placeholder,
@@ -203,4 +210,6 @@ def filtered_conversations_select(
         node.pop('initial_conversation')
     if not confirm_text:
         node.pop('confirm')
+    if validation_enabled():
+        check(node)
     return node
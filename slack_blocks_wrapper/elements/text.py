@@ -1,5 +1,7 @@
 from enum import Enum
 
+from .mrkdwn import escape as _escape
+
 
 class TextType(Enum):
     PLAIN_TEXT = "plain_text"
@@ -11,7 +13,8 @@ def text_element(
         text_type: TextType,
         emoji: bool = True,
         verbatim: bool = False,
-        value: str = None
+        value: str = None,
+        escape: bool = False
 ):
     """
     Summary: A slack block text node \n
@@ -21,12 +24,21 @@ def text_element(
         emoji (bool): Whether to display emojis or not
         verbatim (bool): Whether to display verbatim or not
         value (str): The value to be passed down the app
+        escape (bool): Whether to escape `&`, `<` and `>` in markdown text,
+            for text from users. Mentions and links must then be added
+            after escaping
     """
     if (
-            text_type.value != TextType.PLAIN_TEXT.value
-            and text_type.value != TextType.MARKDOWN_TEXT.value
+            text_type is not TextType.PLAIN_TEXT
+            and text_type is not TextType.MARKDOWN_TEXT
     ):
         raise ValueError("text_type must be `plain_text` or `mrkdwn`")
+    if escape and text_type is TextType.MARKDOWN_TEXT:
+        # A slot of a template is escaped when the template renders. Looked
+        # up by its `escaped` method, so the builders need not import the
+        # template module.
+        escaped = getattr(text, "escaped", None)
+        text = escaped() if escaped is not None else _escape(text)
     node = {
         "text": {
             "type": text_type.value,
@@ -1,4 +1,5 @@
 from .text import text_element, TextType
+from ..validation import check, validation_enabled
 
 
 def timepicker_element(
@@ -8,10 +9,6 @@ def timepicker_element(
         confirm: object = None,
         focus_on_load: bool = False
 ):
-    if not placeholder:
-        raise ValueError("Placeholder is required")
-    if not action_id:
-        raise ValueError("Action ID is required")
     node = {
         "type": "timepicker",
         "placeholder": text_element(placeholder, TextType.PLAIN_TEXT),
@@ -23,4 +20,6 @@ def timepicker_element(
         node["confirm"] = confirm
     if focus_on_load:
         node["focus_on_load"] = focus_on_load
+    if validation_enabled():
+        check(node)
     return node
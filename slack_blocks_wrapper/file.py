@@ -1,3 +1,6 @@
+from .block_id import content_block_id
+
+
 def file_node(external_id: str, source: str, block_id: str = None):
     """
     Supported surfaces: `Messages`
@@ -8,13 +11,16 @@ def file_node(external_id: str, source: str, block_id: str = None):
     Args:
         external_id (str): The external unique ID of the file.
         source (str): The source of the file. Is always `remote`.
-        block_id (str): The block ID of the file. Should be unique.
+        block_id (str): The block ID of the file. Should be unique. Derived
+            from the content within `content_block_ids` if not given.
     """
     node = {
         "type": "file",
         "external_id": external_id,
         "source": source
     }
+    if block_id is None:
+        block_id = content_block_id("file", external_id, source)
     if block_id:
         node["block_id"] = block_id
     return node
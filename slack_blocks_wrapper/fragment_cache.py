@@ -0,0 +1,143 @@
+import threading
+from typing import Callable, Hashable
+
+from .serialize import Fragment, fragment
+
+
+class FragmentCache:
+    """
+    Summary: A cache of encoded subtrees, bounded by their total size \n
+    Maps a key to the `Fragment` of a subtree, such as a footer, banner or
+    button row that is the same in many messages. `to_json_bytes` splices
+    fragments in as they are, so a cached subtree is built and encoded once
+    while it stays in the cache.
+
+    Keys are given by the caller, or derived from a builder and its
+    arguments by `block`: a key taken from the built subtree itself would
+    cost as much to compute as encoding it.
+
+    Lookups take no lock. Eviction is an approximation of LRU (the CLOCK,
+    or second chance, algorithm): a hit only marks its entry as used, and
+    when the cache is over `max_bytes` the oldest entries are evicted,
+    except for those used since they were last looked at, which are moved
+    to the back instead. The counters are not locked either, so under heavy
+    contention between threads they may miss a few lookups.
+
+    Args:
+        max_bytes (int): The maximum total size of the cached fragments
+
+    Example:
+        >>> cache = FragmentCache(max_bytes=256 * 1024)
+        >>> blocks = [
+        ...     section.markdown_text(report),
+        ...     cache.block(divider_node),
+        ...     cache.fragment(("footer", team_id),
+        ...                    lambda: context(footer_elements(team_id))),
+        ... ]
+        >>> to_json_bytes(blocks)
+    """
+
+    def __init__(self, max_bytes: int = 1 << 20):
+        if max_bytes is None or max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+        self.max_bytes = max_bytes
+        # key -> [fragment, used since last looked at by eviction]
+        self._entries = {}
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable):
+        return key in self._entries
+
+    def fragment(self, key: Hashable, factory: Callable) -> Fragment:
+        """
+        Summary: The cached fragment for a key, built on a miss \n
+        Args:
+            key (Hashable): Identifies the subtree
+            factory (Callable): Builds the subtree. Called without the lock
+                held, so two threads missing the same key at once may both
+                call it
+        Returns:
+            Fragment: The encoded subtree
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[1] = True
+            self._hits += 1
+            return entry[0]
+        self._misses += 1
+        encoded = fragment(factory())
+        if len(encoded) > self.max_bytes:
+            return encoded
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry[0]
+            self._entries[key] = [encoded, False]
+            self._nbytes += len(encoded)
+            if self._nbytes > self.max_bytes:
+                self._evict()
+        return encoded
+
+    def block(self, builder: Callable, *args, **kwargs) -> Fragment:
+        """
+        Summary: The cached fragment of `builder(*args, **kwargs)` \n
+        Args:
+            builder (Callable): A block or element builder
+            *args: The builder's arguments. Must be hashable
+            **kwargs: The builder's keyword arguments. Must be hashable
+        Returns:
+            Fragment: The encoded subtree
+        Example:
+            >>> cache.block(button_section, "Approve", "approve", "primary",
+            ...             value="approve")
+        """
+        key = (builder, args, tuple(sorted(kwargs.items()))) \
+            if kwargs else (builder, args)
+        return self.fragment(key, lambda: builder(*args, **kwargs))
+
+    def _evict(self):
+        # Called with the lock held. Dicts keep insertion order, so the
+        # first entries are the oldest.
+        entries = self._entries
+        while self._nbytes > self.max_bytes:
+            key = next(iter(entries))
+            entry = entries.pop(key)
+            if entry[1]:
+                entry[1] = False
+                entries[key] = entry
+            else:
+                self._nbytes -= len(entry[0])
+                self._evictions += 1
+
+    def info(self):
+        """
+        Summary: Counters of the cache \n
+        Returns:
+            dict: `hits`, `misses` and `evictions` since the cache was
+            created or cleared, the number of fragments (`currsize`) and
+            their total size (`nbytes`), and `max_bytes`
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "currsize": len(self._entries),
+            "nbytes": self._nbytes,
+            "max_bytes": self.max_bytes
+        }
+
+    def clear(self):
+        """
+        Summary: Empties the cache and resets its counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self._hits = self._misses = self._evictions = 0
@@ -1,4 +1,7 @@
-def header_block_node(text: str, block_id: str):
+from .block_id import content_block_id
+
+
+def header_block_node(text: str, block_id: str = None):
     """
     Supported surfaces:  `Modals`, `Messages`, `Home tabs`
     A header is a plain-text block that displays in a larger, bold font.
@@ -6,7 +9,8 @@ def header_block_node(text: str, block_id: str):
 
     Args:
         text (str): The text to display in the header.
-        block_id (str): The ID of the block.
+        block_id (str): The ID of the block. Derived from the content
+            within `content_block_ids` if not given.
     Example:
        >>> header_block_node("My header", "my_header")
     Returns a JSON object with format as follows:
@@ -16,6 +20,8 @@ def header_block_node(text: str, block_id: str):
         "type": "header",
         "text": text
     }
+    if block_id is None:
+        block_id = content_block_id("header", text)
     if block_id:
         node["block_id"] = block_id
     return node
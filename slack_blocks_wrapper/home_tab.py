@@ -0,0 +1,205 @@
+import threading
+import warnings
+from collections import OrderedDict
+from typing import Callable, Hashable, Mapping, NamedTuple, Tuple
+
+from .payload import MAX_BLOCKS, PayloadLimitWarning
+from .serialize import Fragment, to_json_bytes
+from .view_cache import CachedView
+
+
+class Panel(NamedTuple):
+    """
+    Summary: A part of a home tab, rendered and cached on its own \n
+    Args:
+        name (str): Identifies the panel
+        render (Callable): Called with the context given to
+            `HomeTab.render`, returns the panel's list of blocks
+        depends_on (Tuple[str, ...]): The names of the data the panel is
+            built from. The panel is rendered again only when the version
+            of one of them changes
+        shared (bool): Whether the panel is the same for every user, so it
+            is cached once instead of once per user
+    """
+    name: str
+    render: Callable
+    depends_on: Tuple[str, ...] = ()
+    shared: bool = False
+
+
+class HomeTab:
+    """
+    Summary: A home tab composed of panels that are rendered incrementally \n
+    Each panel declares the data it depends on. On `render`, the caller
+    gives the current version of each piece of data, such as a row count,
+    an update timestamp or an ETag, and only the panels whose versions
+    changed since they were last rendered for that user are rendered
+    again. The other panels reuse their blocks and their encoded JSON,
+    which is concatenated into the view's JSON as is.
+
+    Args:
+        panels (Iterable[Panel]): The panels, top to bottom
+        maxsize (int): The maximum number of rendered panels kept, counting
+            each user's copy of a panel that is not shared. Least recently
+            used panels are evicted first
+        **view_fields: Other fields of the view, such as `callback_id`
+
+    Example:
+        >>> home = HomeTab(callback_id="home")
+        >>> @home.panel("tasks", depends_on=("tasks",))
+        ... def tasks_panel(user):
+        ...     return [section.markdown_text(task.title)
+        ...             for task in user.tasks]
+        >>> @home.panel("news", depends_on=("news",), shared=True)
+        ... def news_panel(user):
+        ...     return [header_block_node("News"), ...]
+        >>> view = home.render(
+        ...     {"tasks": user.tasks_version, "news": news_version},
+        ...     context=user, key=user.id)
+        >>> body = to_json_bytes({"user_id": user.id, "view": view.fragment})
+    """
+
+    def __init__(self, panels=(), maxsize: int = 4096, **view_fields):
+        if maxsize is None or maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.panels = []
+        self.maxsize = maxsize
+        self.view_fields = view_fields
+        # (panel name, user key) -> (versions, blocks, encoded blocks)
+        self._rendered = OrderedDict()
+        self._lock = threading.Lock()
+        self._renders = 0
+        self._reuses = 0
+        for panel in panels:
+            self.add(panel)
+
+    def add(self, panel: Panel):
+        """
+        Summary: Adds a panel below the others \n
+        Args:
+            panel (Panel): The panel
+        """
+        if any(other.name == panel.name for other in self.panels):
+            raise ValueError(f"there is already a panel named {panel.name!r}")
+        self.panels.append(panel)
+
+    def panel(self, name: str, depends_on: Tuple[str, ...] = (),
+              shared: bool = False):
+        """
+        Summary: Adds the decorated function as a panel below the others \n
+        Args:
+            name (str): Identifies the panel
+            depends_on (Tuple[str, ...]): The names of the data the panel
+                is built from
+            shared (bool): Whether the panel is the same for every user
+        """
+        def decorator(render: Callable):
+            self.add(Panel(name, render, tuple(depends_on), shared))
+            return render
+
+        return decorator
+
+    def render(
+            self,
+            versions: Mapping[str, Hashable],
+            context=None,
+            key: Hashable = None
+    ) -> CachedView:
+        """
+        Summary: Renders the home tab, reusing unchanged panels \n
+        Args:
+            versions (Mapping[str, Hashable]): The current version of every
+                piece of data the panels depend on
+            context: Passed to the render function of each panel that is
+                rendered
+            key (Hashable): Identifies the user, for panels that are not
+                shared. Required when any panel is not shared
+        Returns:
+            CachedView: The view and its encoded JSON, ready to be placed
+            in a `views.publish` payload
+        """
+        if key is None and not all(panel.shared for panel in self.panels):
+            raise ValueError(
+                "key is required to render panels that are not shared")
+        blocks = []
+        encoded = []
+        for panel in self.panels:
+            try:
+                panel_versions = tuple(
+                    versions[name] for name in panel.depends_on)
+            except KeyError as error:
+                raise ValueError(
+                    f"no version given for {error.args[0]!r}, which panel "
+                    f"{panel.name!r} depends on") from None
+            cache_key = (panel.name, None if panel.shared else key)
+            with self._lock:
+                entry = self._rendered.get(cache_key)
+                if entry is not None and entry[0] == panel_versions:
+                    self._rendered.move_to_end(cache_key)
+                    self._reuses += 1
+                else:
+                    entry = None
+            if entry is None:
+                panel_blocks = list(panel.render(context))
+                # The blocks without the brackets of the list, so panels
+                # can be joined with commas.
+                entry = (panel_versions, panel_blocks,
+                         to_json_bytes(panel_blocks)[1:-1])
+                with self._lock:
+                    self._renders += 1
+                    self._rendered[cache_key] = entry
+                    self._rendered.move_to_end(cache_key)
+                    while len(self._rendered) > self.maxsize:
+                        self._rendered.popitem(last=False)
+            blocks.extend(entry[1])
+            if entry[2]:
+                encoded.append(entry[2])
+        if len(blocks) > MAX_BLOCKS["home"]:
+            warnings.warn(
+                f"home tab is over its limit of {MAX_BLOCKS['home']} "
+                f"blocks: {len(blocks)}",
+                PayloadLimitWarning,
+                stacklevel=2
+            )
+        view = {"type": "home", **self.view_fields, "blocks": blocks}
+        return CachedView(view, Fragment(to_json_bytes({
+            **view, "blocks": Fragment(b"[" + b",".join(encoded) + b"]")
+        })))
+
+    def invalidate(self, name: str = None, key: Hashable = None):
+        """
+        Summary: Drops rendered panels, so they are rendered again \n
+        Args:
+            name (str): Only drop this panel
+            key (Hashable): Only drop the panels of this user. Shared
+                panels are only dropped when `key` is not given
+        """
+        with self._lock:
+            for cache_key in list(self._rendered):
+                if (name is None or cache_key[0] == name) and \
+                        (key is None or cache_key[1] == key):
+                    del self._rendered[cache_key]
+
+    def info(self):
+        """
+        Summary: Counters of the renderer \n
+        Returns:
+            dict: The number of panels rendered (`renders`) and reused
+            (`reuses`) since the renderer was created or cleared, and the
+            `maxsize` and `currsize` of its cache
+        """
+        with self._lock:
+            return {
+                "renders": self._renders,
+                "reuses": self._reuses,
+                "maxsize": self.maxsize,
+                "currsize": len(self._rendered)
+            }
+
+    def clear(self):
+        """
+        Summary: Drops every rendered panel and resets the counters
+        """
+        with self._lock:
+            self._rendered.clear()
+            self._renders = self._reuses = 0
@@ -1,3 +1,4 @@
+from .block_id import content_block_id
 from .elements.text import text_element, TextType
 
 
@@ -5,7 +6,7 @@ def image_block_node(
         image_url: str,
         alt_text: str,
         title: str,
-        block_id: str
+        block_id: str = None
 ):
     """
     Supported surfaces: `Modals`, `Messages`, `Home tabs`
@@ -16,17 +17,22 @@ def image_block_node(
     :param alt_text: The alt text of the image.
     :param title: The title of the image.
     :param block_id: A string acting as a unique identifier for a block.
-                    If not specified, one will be generated.
+                    If not specified, one will be generated, or derived
+                    from the content within `content_block_ids`.
     :return: A block node for an image.
 
     Example:
         Returned JSON is similar to the following example:
       https://api.slack.com/reference/block-kit/blocks#image_example
     """
-    return {
-        "type": "image",
-        "block_id": block_id,
-        "image_url": image_url,
-        "alt_text": alt_text,
-        "title": text_element(title, TextType.PLAIN_TEXT)
+    node = {
+        "type": "image"
     }
+    if block_id is None:
+        block_id = content_block_id("image", image_url, alt_text, title)
+    if block_id is not None:
+        node["block_id"] = block_id
+    node["image_url"] = image_url
+    node["alt_text"] = alt_text
+    node["title"] = text_element(title, TextType.PLAIN_TEXT)
+    return node
@@ -1,4 +1,6 @@
+from .block_id import content_block_id
 from .elements.text import text_element, TextType
+from .validation import check, validation_enabled
 
 
 def input_block_node(
@@ -25,7 +27,8 @@ input blocks pass information to your app.
     element (dict): The element of the input block.
     dispatch_action (str): The action to be dispatched when the input block is
         submitted.
-    block_id (str): The ID of the input block.
+    block_id (str): The ID of the input block. Derived from the content
+        within `content_block_ids` if not given.
     hint (str): A hint to be displayed below the input block.
     optional (bool): Whether the input block is optional.
 
@@ -61,8 +64,6 @@ input blocks pass information to your app.
             },
     Can view more here:
     """
-    if not element:
-        raise ValueError("element is required")
     node = {
         "type": "input",
         "label": text_element(label, TextType.PLAIN_TEXT),
@@ -74,6 +75,11 @@ input blocks pass information to your app.
         node["hint"] = text_element(hint, TextType.PLAIN_TEXT)
     if optional:
         node["optional"] = optional
+    if block_id is None:
+        block_id = content_block_id(
+            "input", label, element, hint or "", "1" if optional else "0")
     if block_id:
         node["block_id"] = block_id
+    if validation_enabled():
+        check(node)
     return node
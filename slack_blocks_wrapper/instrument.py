@@ -0,0 +1,404 @@
+import functools
+import importlib
+import inspect
+import sys
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from .serialize import to_json_bytes
+
+# The modules whose public functions are instrumented, relative to the
+# package.
+BUILDER_MODULES = (
+    "elements.button",
+    "elements.checkbox",
+    "elements.datepicker",
+    "elements.image",
+    "elements.multiselect",
+    "elements.options",
+    "elements.overflow_menu",
+    "elements.plain_text_input",
+    "elements.radio_button",
+    "elements.select",
+    "elements.text",
+    "elements.timepicker",
+    "section.section_elements",
+    "context",
+    "divider",
+    "file",
+    "header",
+    "image",
+    "input",
+)
+
+# Upper bounds of the duration histogram buckets, in seconds.
+DEFAULT_BUCKETS = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005, 0.0001,
+    0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01
+)
+
+_PACKAGE = __name__.rpartition(".")[0]
+
+
+def builders() -> Dict[str, Callable]:
+    """
+    Summary: The public builders of the package \n
+    Imports every builder module first, since the package loads them
+    lazily.
+
+    Returns:
+        Dict[str, Callable]: The builders, by name relative to the package,
+        such as `section.button_section`
+    """
+    found = {}
+    for name in BUILDER_MODULES:
+        module = importlib.import_module("." + name, _PACKAGE)
+        # Named as they are imported: `elements.text_element`, but
+        # `divider.divider_node`.
+        prefix = name.partition(".")[0]
+        for attribute, value in vars(module).items():
+            if (
+                    not attribute.startswith("_")
+                    and inspect.isfunction(value)
+                    and value.__module__ == module.__name__
+                    and not inspect.isgeneratorfunction(value)
+            ):
+                found[prefix + "." + attribute] = value
+    return found
+
+
+class _Layer:
+    __slots__ = ("wrap", "modules")
+
+    def __init__(self, wrap: Callable[[str, Callable], Callable], modules):
+        self.wrap = wrap
+        self.modules = modules
+
+
+# The patches in effect, oldest first, and what they replaced. Guarded by
+# `_patch_lock`, since patches are applied and removed from any thread.
+_patch_lock = threading.Lock()
+_layers: List[_Layer] = []
+# The original builders, by name, while any patch is in effect.
+_originals: Dict[str, Callable] = {}
+# (namespace id, attribute) -> (namespace, attribute, original, wrapper)
+_installed: Dict[Tuple[int, str], tuple] = {}
+
+
+def _patch(wrap: Callable[[str, Callable], Callable], modules=()):
+    """
+    Replaces every reference to a builder in the package's modules, and in
+    `modules`, with `wrap(name, builder)`, and returns a function that
+    removes the patch again.
+
+    The builders are imported under other names by the modules that use
+    them, and are cached on the lazy `elements` and `section` packages, so
+    the globals of every loaded module of the package are patched, whatever
+    the name. `modules` are modules or module names.
+
+    Patches can be stacked, and removed in any order and from any thread:
+    the original of every patched global is kept, and each time a patch is
+    applied or removed, the globals are set again to the originals wrapped
+    by the patches still in effect.
+    """
+    resolved = []
+    for module in modules:
+        if isinstance(module, str):
+            module = importlib.import_module(module)
+        resolved.append(module)
+    layer = _Layer(wrap, tuple(resolved))
+    with _patch_lock:
+        if not _layers:
+            _originals.update(builders())
+            for package in ("elements", "section"):
+                # Resolves the lazy names now, so they are patched (and
+                # restored) below instead of being resolved to a wrapper
+                # later.
+                module = importlib.import_module("." + package, _PACKAGE)
+                for name in module.__all__:
+                    getattr(module, name)
+        _layers.append(layer)
+        _apply()
+
+    def restore():
+        with _patch_lock:
+            if layer in _layers:
+                _layers.remove(layer)
+                _apply()
+
+    return restore
+
+
+def _apply():
+    # Called with `_patch_lock` held. Puts the originals back, then wraps
+    # them again in the patches in effect.
+    for namespace, attribute, original, wrapper in _installed.values():
+        # A global that was set to something else since is left alone.
+        if namespace.get(attribute) is wrapper:
+            namespace[attribute] = original
+    _installed.clear()
+    if not _layers:
+        _originals.clear()
+        return
+    names = {id(builder): name for name, builder in _originals.items()}
+    package = [
+        module for module_name, module in list(sys.modules.items())
+        if module is not None and (
+            module_name == _PACKAGE
+            or module_name.startswith(_PACKAGE + ".")
+        )
+    ]
+    targets = {id(module): module for module in package}
+    for layer in _layers:
+        for module in layer.modules:
+            targets.setdefault(id(module), module)
+    chains = {}
+    for module in targets.values():
+        # The package's modules get every patch, other modules only those
+        # that named them.
+        layers = tuple(
+            layer for layer in _layers
+            if any(module is other for other in package)
+            or any(module is other for other in layer.modules)
+        )
+        if not layers:
+            continue
+        namespace = vars(module)
+        for attribute, value in list(namespace.items()):
+            name = names.get(id(value))
+            if name is None or _originals[name] is not value:
+                continue
+            wrapper = chains.get((name, layers))
+            if wrapper is None:
+                wrapper = value
+                for layer in layers:
+                    wrapper = layer.wrap(name, wrapper)
+                chains[name, layers] = wrapper
+            namespace[attribute] = wrapper
+            _installed[id(namespace), attribute] = (
+                namespace, attribute, value, wrapper)
+
+
+class BuilderStats:
+    """
+    Summary: The recorded calls of one builder \n
+    Times include the builders called by this one.
+
+    Args:
+        buckets (Tuple[float, ...]): The upper bounds of the duration
+            histogram buckets, in seconds
+    Attributes:
+        calls (int): The number of calls
+        seconds (float): The total wall time of the calls
+        bytes (int): The total size of the results, in bytes of compact
+            UTF-8 JSON
+        bucket_counts (List[int]): The number of calls per duration bucket,
+            not cumulative, with a last bucket for longer calls
+    """
+    __slots__ = ("buckets", "calls", "seconds", "bytes", "bucket_counts")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.calls = 0
+        self.seconds = 0.0
+        self.bytes = 0
+        self.bucket_counts = [0] * (len(buckets) + 1)
+
+    def __repr__(self):
+        return "BuilderStats(calls={}, seconds={:.6f}, bytes={})".format(
+            self.calls, self.seconds, self.bytes)
+
+
+_lock = threading.Lock()
+_stats: Dict[str, BuilderStats] = {}
+_restore = None
+
+
+def _instrumented(
+        name: str,
+        builder: Callable,
+        buckets: Tuple[float, ...],
+        measure_bytes: bool
+):
+    stats = _stats.setdefault(name, BuilderStats(buckets))
+
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        result = builder(*args, **kwargs)
+        elapsed = perf_counter() - start
+        size = 0
+        if measure_bytes:
+            try:
+                size = len(to_json_bytes(result))
+            except (TypeError, ValueError):
+                pass
+        with _lock:
+            stats.calls += 1
+            stats.seconds += elapsed
+            stats.bytes += size
+            stats.bucket_counts[bisect_left(stats.buckets, elapsed)] += 1
+        return result
+
+    return wrapper
+
+
+def enable(
+        measure_bytes: bool = True,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        modules: Iterable = ()
+):
+    """
+    Summary: Starts recording the calls of every builder \n
+    Every builder is replaced by a recording wrapper in the modules of the
+    package, and in `modules`. While instrumentation is disabled, no
+    wrapper is left in the call path.
+
+    Builders that other modules imported by name before instrumentation
+    was enabled, for example by `from slack_blocks_wrapper.section import
+    button_section`, are only recorded if those modules are given in
+    `modules`. Calls made through the module, such as
+    `section.button_section(...)`, are always recorded. References taken
+    while instrumentation is enabled keep the wrapper.
+
+    Args:
+        measure_bytes (bool): Whether to encode each result to record its
+            size. This is not included in the recorded times, but slows
+            down instrumented code
+        buckets (Tuple[float, ...]): The upper bounds of the duration
+            histogram buckets, in seconds
+        modules (Iterable): Other modules, or module names, whose imported
+            builders are instrumented too, such as `__name__`
+    Example:
+        >>> instrument.enable(modules=[__name__, "app.views"])
+    """
+    global _restore
+    if _restore is not None:
+        raise ValueError("instrumentation is already enabled")
+    buckets = tuple(sorted(buckets))
+    for stats in _stats.values():
+        if stats.buckets != buckets:
+            raise ValueError(
+                "buckets differ from those recorded; call reset() first")
+    _restore = _patch(
+        lambda name, builder: _instrumented(
+            name, builder, buckets, measure_bytes),
+        modules
+    )
+
+
+def disable():
+    """
+    Summary: Stops recording and puts the original builders back \n
+    The recorded stats are kept until `reset`.
+    """
+    global _restore
+    if _restore is not None:
+        _restore()
+        _restore = None
+
+
+def enabled() -> bool:
+    """
+    Summary: Whether instrumentation is enabled
+    """
+    return _restore is not None
+
+
+def reset():
+    """
+    Summary: Clears the recorded stats
+    """
+    with _lock:
+        for stats in _stats.values():
+            stats.calls = 0
+            stats.seconds = 0.0
+            stats.bytes = 0
+            stats.bucket_counts = [0] * (len(stats.buckets) + 1)
+        if _restore is None:
+            _stats.clear()
+
+
+def stats() -> Dict[str, BuilderStats]:
+    """
+    Summary: The recorded stats of the builders that were called \n
+    Returns:
+        Dict[str, BuilderStats]: Stats by builder name, such as
+        `elements.button_element`, most time first
+    """
+    with _lock:
+        recorded = [
+            (name, _copy(stats)) for name, stats in _stats.items()
+            if stats.calls
+        ]
+    recorded.sort(key=lambda item: item[1].seconds, reverse=True)
+    return dict(recorded)
+
+
+def _copy(stats: BuilderStats) -> BuilderStats:
+    copy = BuilderStats(stats.buckets)
+    copy.calls = stats.calls
+    copy.seconds = stats.seconds
+    copy.bytes = stats.bytes
+    copy.bucket_counts = list(stats.bucket_counts)
+    return copy
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"') \
+        .replace("\n", "\\n")
+
+
+def openmetrics(prefix: str = "slack_blocks_builder") -> str:
+    """
+    Summary: The recorded stats in the OpenMetrics text format \n
+    Can be served as is from a `/metrics` endpoint, with the content type
+    `application/openmetrics-text; version=1.0.0; charset=utf-8`.
+
+    Args:
+        prefix (str): The prefix of the metric names
+    Returns:
+        str: The calls, duration histogram and bytes of every builder that
+        was called, by `builder` label
+    Example:
+        >>> print(openmetrics())
+        # TYPE slack_blocks_builder_calls counter
+        # HELP slack_blocks_builder_calls Calls of each block builder.
+        slack_blocks_builder_calls_total{builder="divider.divider_node"} 3
+        ...
+        # EOF
+    """
+    recorded = sorted(stats().items())
+    calls: List[str] = [
+        f"# TYPE {prefix}_calls counter",
+        f"# HELP {prefix}_calls Calls of each block builder.",
+    ]
+    seconds: List[str] = [
+        f"# TYPE {prefix}_seconds histogram",
+        f"# UNIT {prefix}_seconds seconds",
+        f"# HELP {prefix}_seconds Wall time of each call, including the "
+        f"builders it calls.",
+    ]
+    size: List[str] = [
+        f"# TYPE {prefix}_bytes counter",
+        f"# UNIT {prefix}_bytes bytes",
+        f"# HELP {prefix}_bytes Size of the results, as compact JSON.",
+    ]
+    for name, builder in recorded:
+        label = 'builder="{}"'.format(_label(name))
+        calls.append(f"{prefix}_calls_total{{{label}}} {builder.calls}")
+        cumulative = 0
+        for bound, count in zip(builder.buckets, builder.bucket_counts):
+            cumulative += count
+            seconds.append(
+                f'{prefix}_seconds_bucket{{{label},le="{bound!r}"}} '
+                f'{cumulative}')
+        seconds.append(
+            f'{prefix}_seconds_bucket{{{label},le="+Inf"}} {builder.calls}')
+        seconds.append(f"{prefix}_seconds_count{{{label}}} {builder.calls}")
+        seconds.append(
+            f"{prefix}_seconds_sum{{{label}}} {builder.seconds!r}")
+        size.append(f"{prefix}_bytes_total{{{label}}} {builder.bytes}")
+    return "\n".join(calls + seconds + size + ["# EOF", ""])
@@ -0,0 +1,164 @@
+import json
+from typing import List, NamedTuple, Union
+
+
+class InputValue(NamedTuple):
+    """
+    Summary: The value of one interactive element in an inbound payload \n
+    Args:
+        block_id (str): The block the element is in
+        action_id (str): The element's action_id
+        type (str): The element type, such as `static_select`
+        value: The selected value, typed by element: a `str` for single
+            selects, pickers and text inputs, a `list` of `str` for multi
+            selects and checkboxes, and `None` when nothing is selected.
+            Unknown element types give their state dict as is
+    """
+    block_id: str
+    action_id: str
+    type: str
+    value: object
+
+
+class Interaction(NamedTuple):
+    """
+    Summary: A parsed `block_actions` or `view_submission` payload \n
+    Args:
+        type (str): The payload type
+        user_id (str): The user who interacted
+        callback_id (str): The callback_id of the view, if any
+        private_metadata (str): The private_metadata of the view, if any
+        values (List[InputValue]): The values of the view's input state
+        actions (List[InputValue]): The actions of a `block_actions`
+            payload
+    """
+    type: str
+    user_id: str
+    callback_id: str
+    private_metadata: str
+    values: List[InputValue]
+    actions: List[InputValue]
+
+
+def _selected_option(state: dict):
+    option = state.get("selected_option")
+    return None if option is None else option["value"]
+
+
+def _selected_options(state: dict):
+    return [option["value"] for option in state.get("selected_options", ())]
+
+
+def _key(name: str):
+    return lambda state: state.get(name)
+
+
+# How the value of each element type is read from its state.
+EXTRACTORS = {
+    "button": _key("value"),
+    "static_select": _selected_option,
+    "external_select": _selected_option,
+    "overflow": _selected_option,
+    "radio_buttons": _selected_option,
+    "radio_button_group": _selected_option,
+    "multi_static_select": _selected_options,
+    "multi_external_select": _selected_options,
+    "checkboxes": _selected_options,
+    "users_select": _key("selected_user"),
+    "multi_users_select": _key("selected_users"),
+    "conversations_select": _key("selected_conversation"),
+    "multi_conversations_select": _key("selected_conversations"),
+    "channels_select": _key("selected_channel"),
+    "multi_channels_select": _key("selected_channels"),
+    "datepicker": _key("selected_date"),
+    "timepicker": _key("selected_time"),
+    "plain_text_input": _key("value"),
+}
+
+
+def parse_state(values: dict) -> List[InputValue]:
+    """
+    Summary: Flattens the `state.values` of a view into typed values \n
+    Args:
+        values (dict): The `state.values` mapping of
+            `block_id -> action_id -> element state`
+    Returns:
+        List[InputValue]: One value per element, in payload order
+    """
+    extractors = EXTRACTORS
+    parsed = []
+    for block_id, elements in values.items():
+        for action_id, state in elements.items():
+            element_type = state.get("type")
+            extract = extractors.get(element_type)
+            parsed.append(InputValue(
+                block_id,
+                action_id,
+                element_type,
+                state if extract is None else extract(state)
+            ))
+    return parsed
+
+
+def parse_actions(actions: list) -> List[InputValue]:
+    """
+    Summary: Flattens the `actions` of a `block_actions` payload \n
+    Args:
+        actions (list): The `actions` list of the payload
+    Returns:
+        List[InputValue]: One value per action, in payload order
+    """
+    extractors = EXTRACTORS
+    parsed = []
+    for action in actions:
+        element_type = action.get("type")
+        extract = extractors.get(element_type)
+        parsed.append(InputValue(
+            action.get("block_id"),
+            action.get("action_id"),
+            element_type,
+            action if extract is None else extract(action)
+        ))
+    return parsed
+
+
+def parse_payload(payload: Union[dict, str, bytes]) -> Interaction:
+    """
+    Summary: Parses a `block_actions` or `view_submission` payload \n
+    Args:
+        payload (Union[dict, str, bytes]): The payload, decoded or as the
+            JSON in the `payload` form field of the request
+    Returns:
+        Interaction: The parsed payload
+    Example:
+        >>> interaction = parse_payload(request.form["payload"])
+        >>> {value.action_id: value.value for value in interaction.values}
+        {'due': '2024-01-31', 'assignees': ['U123', 'U456']}
+    """
+    if not isinstance(payload, dict):
+        payload = json.loads(payload)
+    view = payload.get("view") or {}
+    state = payload.get("state") or view.get("state") or {}
+    user = payload.get("user") or {}
+    return Interaction(
+        payload.get("type"),
+        user.get("id"),
+        view.get("callback_id"),
+        view.get("private_metadata"),
+        parse_state(state.get("values") or {}),
+        parse_actions(payload.get("actions") or ())
+    )
+
+
+def values_by_action_id(interaction: Interaction) -> dict:
+    """
+    Summary: The view values of an interaction, keyed by action_id \n
+    Assumes action_ids are unique within the view, as they usually are;
+    with duplicates, the last one wins.
+
+    Args:
+        interaction (Interaction): A parsed payload
+    Returns:
+        dict: `action_id -> value`
+    """
+    return {value.action_id: value.value for value in interaction.values}
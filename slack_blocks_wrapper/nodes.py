@@ -0,0 +1,252 @@
+from abc import ABC, abstractmethod
+from typing import Literal
+
+from .elements.button import _button
+from .elements.select import _static_select
+from .elements.text import TextType
+from .validation import check, validation_enabled
+
+
+class Node(ABC):
+    """
+    Summary: Base class for the compact, typed block nodes \n
+    Nodes hold the same data as the dicts returned by the builders in
+    `__slots__`, which takes a fraction of the memory of nested dicts.
+    They are turned into the regular dict form only when needed, either with
+    `to_dict` or by `serialize.to_json_bytes`, which accepts nodes anywhere
+    in a block tree. Nodes validate their fields when they are created, so
+    `to_dict` does not validate them again.
+    """
+    __slots__ = ()
+
+    @abstractmethod
+    def to_dict(self) -> dict:
+        """
+        Summary: The node in the dict form returned by the builders
+        """
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__slots__
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                "{}={!r}".format(name, getattr(self, name))
+                for name in self.__slots__
+            )
+        )
+
+
+def _to_dict(value):
+    if isinstance(value, Node):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_dict(item) for item in value]
+    return value
+
+
+class TextNode(Node):
+    """
+    Summary: A text object, as in `text_element(...)["text"]` \n
+    Args:
+        text (str): The text to display
+        text_type (TextType): The text type whether plain text or markdown
+        emoji (bool): Whether to display emojis or not
+        verbatim (bool): Whether to display verbatim or not
+    """
+    __slots__ = ("text", "text_type", "emoji", "verbatim")
+
+    def __init__(
+            self,
+            text: str,
+            text_type: TextType = TextType.PLAIN_TEXT,
+            emoji: bool = True,
+            verbatim: bool = False
+    ):
+        if (
+                text_type is not TextType.PLAIN_TEXT
+                and text_type is not TextType.MARKDOWN_TEXT
+        ):
+            raise ValueError("text_type must be `plain_text` or `mrkdwn`")
+        self.text = text
+        self.text_type = text_type
+        self.emoji = emoji
+        self.verbatim = verbatim
+
+    def to_dict(self):
+        node = {
+            "type": self.text_type.value,
+            "text": self.text,
+            "emoji": self.emoji
+        }
+        if self.verbatim:
+            node["verbatim"] = True
+        return node
+
+
+class OptionNode(Node):
+    """
+    Summary: An option object, as in `text_element(text, TextType.PLAIN_TEXT,
+    value=value)` \n
+    Args:
+        text (str): The label of the option
+        value (str): The value passed down to the app
+        description (str): A plain text description shown below the label
+    """
+    __slots__ = ("text", "value", "description")
+
+    def __init__(self, text: str, value: str, description: str = None):
+        self.text = text
+        self.value = value
+        self.description = description
+
+    def to_dict(self):
+        node = {
+            "text": {
+                "type": TextType.PLAIN_TEXT.value,
+                "text": self.text,
+                "emoji": True
+            },
+            "value": self.value
+        }
+        if self.description is not None:
+            node["description"] = {
+                "type": TextType.PLAIN_TEXT.value,
+                "text": self.description,
+                "emoji": True
+            }
+        return node
+
+
+class ButtonNode(Node):
+    """
+    Summary: A button element, see `elements.button_element` \n
+    Args:
+        text (str): The text to display on the button
+        action_id (str): The action id
+        style (str): The style of the button
+        value (str): The value of the button
+        url (str): The url to navigate to
+        accessibility_label (str): The accessibility label
+        confirm (dict): The confirm object
+    """
+    __slots__ = (
+        "text", "action_id", "style", "value", "url",
+        "accessibility_label", "confirm"
+    )
+
+    def __init__(
+            self,
+            text: str,
+            action_id: str,
+            style: Literal["primary", "danger", "link"],
+            value: str = "",
+            url: str = None,
+            accessibility_label: str = None,
+            confirm: dict = None
+    ):
+        if validation_enabled():
+            check({"type": "button", "style": style})
+        self.text = text
+        self.action_id = action_id
+        self.style = style
+        self.value = value
+        self.url = url
+        self.accessibility_label = accessibility_label
+        self.confirm = confirm
+
+    def to_dict(self):
+        return _button(
+            self.text, self.action_id, self.style, self.value, self.url,
+            self.accessibility_label, _to_dict(self.confirm)
+        )
+
+
+class StaticSelectNode(Node):
+    """
+    Summary: A static select element, see `elements.static_select_element` \n
+    Args:
+        placeholder (str): The placeholder text
+        action_id (str): The action id
+        options (list): The options, as option dicts or `OptionNode`s
+        option_groups (list): The option groups
+        initial_option: The initially selected option
+        confirm (dict): The confirm object
+        focus_on_load (bool): Whether to focus element on load or not
+    """
+    __slots__ = (
+        "placeholder", "action_id", "options", "option_groups",
+        "initial_option", "confirm", "focus_on_load"
+    )
+
+    def __init__(
+            self,
+            placeholder: str,
+            action_id: str,
+            options: list = None,
+            option_groups: list = None,
+            initial_option=None,
+            confirm: dict = None,
+            focus_on_load: bool = False
+    ):
+        if validation_enabled():
+            check({
+                "type": "static_select",
+                "action_id": action_id,
+                "options": options,
+                "option_groups": option_groups
+            })
+        self.placeholder = placeholder
+        self.action_id = action_id
+        self.options = options
+        self.option_groups = option_groups
+        self.initial_option = initial_option
+        self.confirm = confirm
+        self.focus_on_load = focus_on_load
+
+    def to_dict(self):
+        return _static_select(
+            self.placeholder, self.action_id, _to_dict(self.options),
+            _to_dict(self.option_groups), _to_dict(self.initial_option),
+            _to_dict(self.confirm), self.focus_on_load
+        )
+
+
+class SectionNode(Node):
+    """
+    Summary: A section block, see `section` \n
+    `SectionNode(TextNode("Approve"), accessory=ButtonNode(...))` gives the
+    same dict as `section.button_section(...)`, and
+    `SectionNode(fields=[...])` the same as `section.text_fields(...)`.
+
+    Args:
+        text (TextNode): The text of the section
+        accessory: The accessory element, as a dict or a node
+        fields (list): The text fields, as dicts or `TextNode`s
+    """
+    __slots__ = ("text", "accessory", "fields")
+
+    def __init__(self, text: TextNode = None, accessory=None, fields=None):
+        if text is None and not fields:
+            raise ValueError("text or fields is required")
+        self.text = text
+        self.accessory = accessory
+        self.fields = fields
+
+    def to_dict(self):
+        node = {"type": "section"}
+        if self.text is not None:
+            node["text"] = _to_dict(self.text)
+        if self.text is not None or self.accessory is not None:
+            node["accessory"] = _to_dict(self.accessory)
+        if self.fields:
+            node["fields"] = _to_dict(self.fields)
+        return node
@@ -0,0 +1,233 @@
+import warnings
+
+from .serialize import to_json_bytes
+
+# Maximum number of blocks per surface.
+MAX_BLOCKS = {
+    "message": 50,
+    "modal": 100,
+    "home": 100
+}
+
+
+class PayloadLimitWarning(UserWarning):
+    """
+    Summary: Warns that a block list is close to or over a Slack limit
+    """
+
+
+def encoded_size(node) -> int:
+    """
+    Summary: The size of a node in bytes of compact UTF-8 JSON \n
+    Args:
+        node: A block, element or any other JSON value
+    Returns:
+        int: The encoded size
+    """
+    return len(to_json_bytes(node))
+
+
+class BlockList(list):
+    """
+    Summary: A list of blocks that keeps count of its encoded size \n
+    Each block is encoded once when it is added, so `size` and `len` are
+    O(1) however many blocks are appended, instead of calling
+    `len(json.dumps(blocks))` after every block. A `PayloadLimitWarning` is
+    issued once the list reaches `warn_ratio` of a limit, and again if it
+    goes over. `BlockList` is a `list`, so it can be passed as `blocks` to
+    any API call directly.
+
+    Args:
+        blocks (Iterable[dict]): The initial blocks
+        surface (str): `message`, `modal` or `home`. Sets `max_blocks`
+        max_blocks (int): Overrides the block limit of the surface
+        max_size (int): The maximum size of the list, in bytes of compact
+            UTF-8 JSON
+        warn_ratio (float): The share of a limit at which to warn. `None`
+            turns warnings off
+        track_size (bool): Whether to encode the blocks to keep count of
+            the size. Without it, only the number of blocks is limited, and
+            `size` and `max_size` cannot be used
+
+    Example:
+        >>> blocks = BlockList(surface="message", max_size=40000)
+        >>> for row in rows:
+        ...     if not blocks.try_append(section.markdown_text(row)):
+        ...         break
+        >>> blocks.size
+        38114
+    """
+
+    def __init__(
+            self,
+            blocks=(),
+            surface: str = "message",
+            max_blocks: int = None,
+            max_size: int = None,
+            warn_ratio: float = 0.9,
+            track_size: bool = True
+    ):
+        if max_size is not None and not track_size:
+            raise ValueError("max_size requires track_size")
+        if max_blocks is None:
+            if surface not in MAX_BLOCKS:
+                raise ValueError(
+                    "surface must be `message`, `modal` or `home`")
+            max_blocks = MAX_BLOCKS[surface]
+        super().__init__()
+        self.max_blocks = max_blocks
+        self.max_size = max_size
+        self.warn_ratio = warn_ratio
+        self.track_size = track_size
+        # The encoded size of each block, or 0 when the size is not
+        # tracked.
+        self._sizes = []
+        self._total = 0
+        self._warned = set()
+        self.extend(blocks)
+
+    def __reduce_ex__(self, protocol):
+        # The default for list subclasses restores `__dict__` and then
+        # appends every block again, which counts each block twice. The
+        # copy is built empty, and counts its blocks as they are appended.
+        return (
+            type(self),
+            ((), "message", self.max_blocks, self.max_size, None,
+             self.track_size),
+            {"warn_ratio": self.warn_ratio, "_warned": set(self._warned)},
+            iter(self)
+        )
+
+    @property
+    def size(self) -> int:
+        """
+        Summary: The size of the list, in bytes of compact UTF-8 JSON
+        """
+        if not self.track_size:
+            raise ValueError("the size of this block list is not tracked")
+        return self._total + max(len(self._sizes) - 1, 0) + 2
+
+    def fits(self, block: dict) -> bool:
+        """
+        Summary: Whether `block` can be appended without crossing a limit
+        """
+        return self._fits(self._measure(block))
+
+    def _measure(self, block) -> int:
+        return encoded_size(block) if self.track_size else 0
+
+    def _fits(self, block_size: int) -> bool:
+        if len(self._sizes) >= self.max_blocks:
+            return False
+        if self.max_size is None:
+            return True
+        return self.size + block_size + (1 if self._sizes else 0) \
+            <= self.max_size
+
+    def try_append(self, block: dict) -> bool:
+        """
+        Summary: Appends `block` only if it fits within the limits \n
+        Returns:
+            bool: Whether the block was appended
+        """
+        block_size = self._measure(block)
+        if not self._fits(block_size):
+            return False
+        self._add(len(self._sizes), block, block_size)
+        return True
+
+    def append(self, block: dict):
+        self._add(len(self._sizes), block, self._measure(block))
+
+    def extend(self, blocks):
+        for block in blocks:
+            self.append(block)
+
+    def __iadd__(self, blocks):
+        self.extend(blocks)
+        return self
+
+    def insert(self, index: int, block: dict):
+        length = len(self._sizes)
+        if index < 0:
+            index = max(index + length, 0)
+        self._add(min(index, length), block, self._measure(block))
+
+    def _add(self, index: int, block: dict, block_size: int):
+        super().insert(index, block)
+        self._sizes.insert(index, block_size)
+        self._total += block_size
+        self._check()
+
+    def pop(self, index: int = -1):
+        block = super().pop(index)
+        self._total -= self._sizes.pop(index)
+        return block
+
+    def remove(self, block: dict):
+        self.pop(self.index(block))
+
+    def clear(self):
+        super().clear()
+        self._sizes.clear()
+        self._total = 0
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        if isinstance(index, slice):
+            self._recount()
+            return
+        block_size = self._measure(value)
+        self._total += block_size - self._sizes[index]
+        self._sizes[index] = block_size
+        self._check()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        if isinstance(index, slice):
+            self._recount()
+            return
+        self._total -= self._sizes.pop(index)
+
+    def __imul__(self, count: int):
+        super().__imul__(count)
+        self._recount()
+        return self
+
+    def reverse(self):
+        super().reverse()
+        self._sizes.reverse()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._recount()
+
+    def _recount(self):
+        self._sizes = [self._measure(block) for block in self]
+        self._total = sum(self._sizes)
+        self._check()
+
+    def _check(self):
+        if self.warn_ratio is None:
+            return
+        self._warn("blocks", len(self._sizes), self.max_blocks)
+        if self.max_size is not None:
+            self._warn("bytes", self.size, self.max_size)
+
+    def _warn(self, unit: str, used: int, limit: int):
+        if used > limit and (unit, "over") not in self._warned:
+            # Going straight over the limit also passes the warning that
+            # it is close.
+            self._warned.update(((unit, "over"), unit))
+            warnings.warn(
+                f"block list is over its limit of {limit} {unit}: {used}",
+                PayloadLimitWarning,
+                stacklevel=5
+            )
+        elif used >= limit * self.warn_ratio and unit not in self._warned:
+            self._warned.add(unit)
+            warnings.warn(
+                f"block list is close to its limit of {limit} {unit}: {used}",
+                PayloadLimitWarning,
+                stacklevel=5
+            )
@@ -0,0 +1,274 @@
+import re
+from typing import Callable, Iterator, NamedTuple, Tuple, Union
+
+# The flags that can be scoped to one alternative of the combined pattern,
+# as `(?i:...)`.
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"),
+                 (re.DOTALL, "s"), (re.ASCII, "a"))
+# Inline global flags, such as `(?i)`, and numbered backreferences or
+# conditionals, which refer to the wrong group once patterns are combined.
+_UNCOMBINABLE = re.compile(
+    r"(?<!\\)(?:\\\\)*(?:\(\?[aiLmsux]+\)|\\[1-9]|\(\?\([0-9])")
+
+
+class Route(NamedTuple):
+    """
+    Summary: The handler an action was routed to \n
+    Args:
+        handler (Callable): The registered handler
+        match (re.Match): The match of the pattern the action_id matched,
+            or `None` for an exact or prefix route
+    """
+    handler: Callable
+    match: object
+
+
+def action_ids(blocks) -> Iterator[Tuple[str, str]]:
+    """
+    Summary: The action_ids of the interactive elements in a block tree \n
+    Args:
+        blocks: A block, a list of blocks or a whole view or message payload
+    Returns:
+        Iterator[Tuple[str, str]]: `(block_id, action_id)` pairs, in tree
+        order. `block_id` is the id of the enclosing block, or `None`
+    """
+    stack = [(blocks, None)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node, block_id = pop()
+        if isinstance(node, dict):
+            if "block_id" in node:
+                block_id = node["block_id"]
+            action_id = node.get("action_id")
+            if isinstance(action_id, str):
+                yield block_id, action_id
+            for value in reversed(node.values()):
+                if isinstance(value, (dict, list)):
+                    push((value, block_id))
+        elif isinstance(node, list):
+            for index in range(len(node) - 1, -1, -1):
+                value = node[index]
+                if isinstance(value, (dict, list)):
+                    push((value, block_id))
+
+
+def _alternative(pattern: "re.Pattern", index: int):
+    # The pattern as a named alternative of the combined expression, so
+    # `lastgroup` tells which one matched: the outer group is the last one
+    # to close. Its flags are scoped to the alternative. `None` if it cannot
+    # be combined.
+    flags = pattern.flags & ~re.UNICODE
+    scoped = ""
+    for flag, letter in _SCOPED_FLAGS:
+        if flags & flag:
+            scoped += letter
+            flags &= ~flag
+    if flags or _UNCOMBINABLE.search(pattern.pattern):
+        return None
+    body = "(?{}:{})".format(scoped, pattern.pattern) if scoped \
+        else pattern.pattern
+    return "(?P<_route{}>{})".format(index, body)
+
+
+class ActionRouter:
+    """
+    Summary: Routes interactions to handlers by action_id \n
+    Exact action_ids are looked up in a dict, first scoped to the block_id
+    and then for any block. Prefixes are looked up in a dict too, once per
+    distinct prefix length, and patterns are combined into a single
+    compiled regular expression. Routing an action therefore costs a few
+    dict lookups plus at most one regex match, whatever the number of
+    exact and prefix routes. Exact routes take precedence over prefixes,
+    the longest prefix wins, and patterns come last, tried in the order
+    they were added.
+
+    Patterns with inline global flags such as `(?i)`, numbered
+    backreferences or the `re.VERBOSE` or `re.LOCALE` flags cannot be
+    combined with the others, so they are matched on their own.
+
+    Args:
+        default (Callable): The handler for actions that match no route. By
+            default, dispatching such an action raises `KeyError`
+
+    Example:
+        >>> router = ActionRouter()
+        >>> router.add("approve", on_approve)
+        >>> router.add_prefix("project_", on_project)
+        >>> router.add_blocks(home_tab_view["blocks"], on_home_tab)
+        >>> for action in parse_payload(payload).actions:
+        ...     router.dispatch(action, client)
+    """
+
+    def __init__(self, default: Callable = None):
+        self.default = default
+        self._exact = {}
+        self._prefixes = {}
+        self._prefix_lengths = ()
+        self._patterns = []
+        self._group_names = set()
+        self._matchers = None
+
+    def __len__(self):
+        return len(self._exact) + len(self._prefixes) + len(self._patterns)
+
+    def add(self, action_id: str, handler: Callable, block_id: str = None):
+        """
+        Summary: Routes an exact action_id to a handler \n
+        Args:
+            action_id (str): The action_id
+            handler (Callable): Called with the action and the extra
+                arguments given to `dispatch`
+            block_id (str): Only route the action_id within this block
+        """
+        self._exact[block_id, action_id] = handler
+
+    def add_pattern(
+            self,
+            pattern: Union[str, "re.Pattern"],
+            handler: Callable
+    ):
+        """
+        Summary: Routes every action_id that fully matches a pattern \n
+        Args:
+            pattern (Union[str, re.Pattern]): A regular expression. Its
+                named groups must be unique across the router's patterns
+            handler (Callable): Called with the action and the extra
+                arguments given to `dispatch`
+        """
+        compiled = re.compile(pattern)
+        if not isinstance(compiled.pattern, str):
+            raise ValueError("pattern must match str action_ids")
+        names = set(compiled.groupindex)
+        if names & self._group_names:
+            raise ValueError(
+                "pattern group names must be unique across patterns")
+        index = len(self._patterns)
+        alternative = _alternative(compiled, index)
+        if alternative is not None:
+            # Compiled on its own now, so an invalid alternative fails here
+            # rather than in every later `route`.
+            re.compile(alternative)
+        self._group_names |= names
+        self._patterns.append((compiled, handler, alternative))
+        self._matchers = None
+
+    def add_prefix(self, prefix: str, handler: Callable):
+        """
+        Summary: Routes every action_id that starts with a prefix \n
+        Args:
+            prefix (str): The action_id prefix
+            handler (Callable): Called with the action and the extra
+                arguments given to `dispatch`
+        """
+        self._prefixes[prefix] = handler
+        self._prefix_lengths = tuple(sorted(
+            {len(prefix) for prefix in self._prefixes}, reverse=True))
+
+    def add_blocks(self, blocks, handler: Callable, scoped: bool = False):
+        """
+        Summary: Routes the action_ids of a block tree to a handler \n
+        Args:
+            blocks: A block, a list of blocks or a whole view or message
+                payload
+            handler (Callable): Called with the action and the extra
+                arguments given to `dispatch`
+            scoped (bool): Only route each action_id within its block
+        """
+        for block_id, action_id in action_ids(blocks):
+            self.add(action_id, handler, block_id if scoped else None)
+
+    def unrouted(self, blocks) -> list:
+        """
+        Summary: The action_ids of a block tree that have no route \n
+        Args:
+            blocks: A block, a list of blocks or a whole view or message
+                payload
+        Returns:
+            list: The `(block_id, action_id)` pairs without a route
+        """
+        return [
+            (block_id, action_id)
+            for block_id, action_id in action_ids(blocks)
+            if self.route(action_id, block_id) is None
+        ]
+
+    def _compile(self):
+        # Consecutive patterns that can be combined share one expression,
+        # the others are matched on their own, in the order they were
+        # added. An expression of a single pattern is mapped to its index.
+        matchers = []
+        run = []
+        for index, (pattern, _, alternative) in enumerate(self._patterns):
+            if alternative is not None:
+                run.append(alternative)
+                continue
+            if run:
+                matchers.append((re.compile("|".join(run)), None))
+                run = []
+            matchers.append((pattern, index))
+        if run:
+            matchers.append((re.compile("|".join(run)), None))
+        self._matchers = matchers
+        return matchers
+
+    def route(self, action_id: str, block_id: str = None):
+        """
+        Summary: Finds the route of an action \n
+        Args:
+            action_id (str): The action_id of the action
+            block_id (str): The block_id of the action
+        Returns:
+            Route: The route, or `None` if no route matches
+        """
+        exact = self._exact
+        handler = exact.get((block_id, action_id))
+        if handler is None and block_id is not None:
+            handler = exact.get((None, action_id))
+        if handler is None:
+            prefixes = self._prefixes
+            for length in self._prefix_lengths:
+                handler = prefixes.get(action_id[:length])
+                if handler is not None:
+                    break
+        if handler is not None:
+            return Route(handler, None)
+        if not self._patterns:
+            return None
+        for matcher, index in self._matchers or self._compile():
+            match = matcher.fullmatch(action_id)
+            if match is None:
+                continue
+            if index is not None:
+                return Route(self._patterns[index][1], match)
+            pattern, handler, _ = self._patterns[int(match.lastgroup[6:])]
+            # The groups of the combined match are numbered across every
+            # pattern, so the action_id is matched again by its own
+            # pattern, for a match of that pattern alone.
+            return Route(handler, pattern.fullmatch(action_id))
+        return None
+
+    def dispatch(self, action, *args, **kwargs):
+        """
+        Summary: Calls the handler of an action \n
+        Args:
+            action: An `InputValue` or a raw action dict
+            *args: Passed on to the handler after the action
+            **kwargs: Passed on to the handler
+        Returns:
+            The handler's return value
+        Raises:
+            KeyError: If no route matches and there is no default handler
+        """
+        if isinstance(action, dict):
+            action_id = action.get("action_id")
+            block_id = action.get("block_id")
+        else:
+            action_id = action.action_id
+            block_id = action.block_id
+        route = self.route(action_id, block_id)
+        if route is not None:
+            return route.handler(action, *args, **kwargs)
+        if self.default is None:
+            raise KeyError(action_id)
+        return self.default(action, *args, **kwargs)
@@ -1,13 +1,24 @@
-from .section_elements import (
-    plain_text,
-    markdown_text,
-    text_fields,
-    users_select,
-    multi_conversations_select,
-    multi_static_select,
-    button_section,
-    image,
-    overflow_menu,
-    datepicker,
-    checkbox
+from .._lazy import lazy_exports
+
+# The section builders are imported on first use, to keep importing the
+# package cheap.
+_EXPORTS = {
+    "plain_text": "section_elements",
+    "markdown_text": "section_elements",
+    "text_fields": "section_elements",
+    "users_select": "section_elements",
+    "multi_conversations_select": "section_elements",
+    "multi_static_select": "section_elements",
+    "button_section": "section_elements",
+    "image": "section_elements",
+    "overflow_menu": "section_elements",
+    "datepicker": "section_elements",
+    "checkbox": "section_elements",
+    "table_sections": "table",
+}
+
+__all__ = list(_EXPORTS)
+_EXPORTS.update(
+    (module, module) for module in set(_EXPORTS.values())
 )
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -8,7 +8,7 @@ from ..elements import (
     image_element as _image,
     datepicker_element as _datepicker,
     checkbox_element as _checkbox,
-    overflow_menu as _overflow_menu_element,
+    overflow_menu_element as _overflow_menu_element,
     text_element as _text_element,
     TextType
 )
@@ -34,16 +34,18 @@ def plain_text(emoji: bool, text: str, accessory: dict = None):
     }
 
 
-def markdown_text(text: str, accessory: dict = None):
+def markdown_text(text: str, accessory: dict = None, escape: bool = False):
     """
     Summary: A markdown text section \n
     Args:
         text (str): The text to display
         accessory (dict): The accessory to display
+        escape (bool): Whether to escape `&`, `<` and `>` in the text
     Returns:
         dict: a markdown text section dictionary
     """
-    return {**SECTION_TYPE, **_text_element(text, TextType.MARKDOWN_TEXT),
+    return {**SECTION_TYPE,
+            **_text_element(text, TextType.MARKDOWN_TEXT, escape=escape),
             **{"accessory": accessory}}
 
 
@@ -0,0 +1,151 @@
+from itertools import chain
+from typing import Callable, Iterable, Iterator, Sequence, Union
+
+from ..divider import divider_node
+from ..elements.mrkdwn import escape as _escape
+from ..elements.text import TextType, text_element
+from ..header import header_block_node
+from .section_elements import text_fields
+
+# Slack's limits for the fields of a section.
+MAX_FIELDS = 10
+MAX_FIELD_LENGTH = 2000
+# The length of the characters that `escape` replaces, once escaped.
+_ESCAPED_LENGTHS = {"&": 5, "<": 4, ">": 4}
+
+
+def _formatter(format: Union[str, Callable, None]):
+    # Resolved once per column, so formatting a cell is a single call.
+    if format is None:
+        return str
+    if isinstance(format, str):
+        return format.format
+    return format
+
+
+def _fit(text: str, max_length: int, escape: bool) -> str:
+    # Escapes the text, and cuts it to `max_length` with an ellipsis. The
+    # text is cut before it is escaped, so no entity is cut in half.
+    if not escape:
+        if len(text) <= max_length:
+            return text
+        return text[:max_length - 1] + "…"
+    escaped = _escape(text)
+    if len(escaped) <= max_length:
+        return escaped
+    # The longest start of the text whose escaped form leaves room for the
+    # ellipsis.
+    length = 0
+    cut = 0
+    for char in text:
+        length += _ESCAPED_LENGTHS.get(char, 1)
+        if length > max_length - 1:
+            break
+        cut += 1
+    return _escape(text[:cut]) + "…"
+
+
+def _field(text: str):
+    # The same text object as `text_element(text, MARKDOWN_TEXT)["text"]`.
+    return {"type": "mrkdwn", "text": text, "emoji": True}
+
+
+def table_sections(
+        rows: Iterable[Sequence],
+        labels: Sequence[str] = None,
+        formats: Sequence[Union[str, Callable, None]] = None,
+        title: str = None,
+        divider: bool = False,
+        escape: bool = False,
+        empty: str = "-",
+        max_field_length: int = MAX_FIELD_LENGTH
+) -> Iterator[dict]:
+    """
+    Summary: Renders table rows as `text_fields` sections, lazily \n
+    Each cell becomes one markdown field, and each section holds as many
+    whole rows as fit in its 10 fields, so a two column table shows as a
+    grid of up to five rows per section. Rows are read from `rows` only as
+    sections are yielded, so a CSV reader or database cursor is never
+    loaded into memory at once.
+
+    Args:
+        rows (Iterable[Sequence]): The rows, each with one value per column
+        labels (Sequence[str]): Column labels, shown in bold at the top of
+            every section
+        formats (Sequence[Union[str, Callable, None]]): One formatter per
+            column: a format string such as `"{:,.2f}"`, a function
+            returning a `str`, or `None` for `str`
+        title (str): The text of a header block yielded first
+        divider (bool): Whether to yield a divider between sections
+        escape (bool): Whether to escape `&`, `<` and `>` in labels and
+            formatted cells, for text from users
+        empty (str): The text of cells that are `None` or format to an
+            empty string, since Slack rejects empty fields
+        max_field_length (int): Longer cells are cut to this length, ending
+            with an ellipsis
+    Returns:
+        Iterator[dict]: The blocks
+    Example:
+        >>> with open("report.csv", newline="") as report:
+        ...     rows = csv.reader(report)
+        ...     labels = next(rows)
+        ...     blocks = table_sections(rows, labels, title="Daily report")
+        ...     for batch in batch_blocks(blocks):
+        ...         client.chat_postMessage(channel=channel, blocks=batch)
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if title is not None:
+        yield header_block_node(
+            text_element(title, TextType.PLAIN_TEXT)["text"])
+    if first is None:
+        return
+    if labels is not None:
+        columns = len(labels)
+    elif formats is not None:
+        columns = len(formats)
+    else:
+        columns = len(first)
+    if not columns:
+        raise ValueError("a table must have at least one column")
+    if formats is None:
+        formats = (None,) * columns
+    elif len(formats) != columns:
+        raise ValueError("`formats` must have one formatter per column")
+    formatters = [_formatter(format) for format in formats]
+    label_fields = [] if labels is None else [
+        _field("*" + (_escape(label) if escape else label) + "*")
+        for label in labels
+    ]
+    rows_per_section = (MAX_FIELDS - len(label_fields)) // columns
+    if rows_per_section < 1:
+        raise ValueError(
+            f"a section holds {MAX_FIELDS} fields, too few for the labels "
+            f"and one row of {columns} columns")
+
+    fields = list(label_fields)
+    count = 0
+    sections = 0
+    for row in chain((first,), rows):
+        if len(row) != columns:
+            raise ValueError(
+                f"expected rows of {columns} values, got {len(row)}")
+        for format, value in zip(formatters, row):
+            text = empty if value is None else format(value)
+            if not text:
+                text = empty
+            elif escape or len(text) > max_field_length:
+                text = _fit(text, max_field_length, escape)
+            fields.append(_field(text))
+        count += 1
+        if count == rows_per_section:
+            if divider and sections:
+                yield divider_node()
+            yield text_fields(fields)
+            sections += 1
+            fields = list(label_fields)
+            count = 0
+    if count:
+        if divider and sections:
+            yield divider_node()
+        yield text_fields(fields)
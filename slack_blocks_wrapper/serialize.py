@@ -0,0 +1,219 @@
+import json
+import re
+import secrets
+import threading
+
+# Fragments are spliced in after encoding. While encoding, each one is
+# written as a placeholder string that carries a per-process nonce, so user
+# text can't be mistaken for a placeholder.
+_NONCE = secrets.token_hex(8)
+_PLACEHOLDER = "\x00" + _NONCE + ":{}\x00"
+_PLACEHOLDER_PATTERN = re.compile(
+    ('"\\\\u0000' + _NONCE + ':(\\d+)\\\\u0000"').encode("ascii")
+)
+_local = threading.local()
+
+
+class Fragment:
+    """
+    Summary: A pre-encoded piece of JSON \n
+    A fragment can be placed anywhere in a block tree in place of the value
+    it encodes. `to_json_bytes` splices its bytes into the output as is, so
+    constant subtrees are encoded once instead of on every message.
+
+    Args:
+        json (bytes): The UTF-8 encoded JSON of the value.
+    """
+    __slots__ = ("json",)
+
+    def __init__(self, json: bytes):
+        self.json = json
+
+    def __len__(self):
+        return len(self.json)
+
+    def __eq__(self, other):
+        return isinstance(other, Fragment) and other.json == self.json
+
+    def __hash__(self):
+        return hash(self.json)
+
+    def __repr__(self):
+        return "Fragment({!r})".format(self.json)
+
+
+def _default(node):
+    if isinstance(node, Fragment):
+        fragments = _local.fragments
+        fragments.append(node.json)
+        return _PLACEHOLDER.format(len(fragments) - 1)
+    to_dict = getattr(node, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    raise TypeError(
+        "Object of type {} is not JSON serializable".format(
+            type(node).__name__
+        )
+    )
+
+
+_ENCODER = json.JSONEncoder(
+    ensure_ascii=False,
+    check_circular=False,
+    separators=(",", ":"),
+    default=_default
+)
+
+
+# Set to `elements.OptionSet` once it is imported, since only then can a
+# tree hold option sets.
+_OptionSet = None
+
+
+def _splice_element(element):
+    options = element.get("options")
+    groups = element.get("option_groups")
+    if type(options) is not _OptionSet and type(groups) is not _OptionSet:
+        return element
+    element = dict(element)
+    if type(options) is _OptionSet:
+        element["options"] = options.fragment
+    if type(groups) is _OptionSet:
+        element["option_groups"] = groups.fragment
+    return element
+
+
+def _splice_block(block):
+    copy = None
+    for key in ("accessory", "element"):
+        element = block.get(key)
+        if isinstance(element, dict):
+            spliced = _splice_element(element)
+            if spliced is not element:
+                if copy is None:
+                    copy = dict(block)
+                copy[key] = spliced
+    elements = block.get("elements")
+    if isinstance(elements, list):
+        spliced = _splice_blocks(elements, _splice_element)
+        if spliced is not elements:
+            if copy is None:
+                copy = dict(block)
+            copy["elements"] = spliced
+    return block if copy is None else copy
+
+
+def _splice_blocks(blocks: list, splice=_splice_block):
+    copy = None
+    for index, block in enumerate(blocks):
+        if isinstance(block, dict):
+            spliced = splice(block)
+            if spliced is not block:
+                if copy is None:
+                    copy = list(blocks)
+                copy[index] = spliced
+    return blocks if copy is None else copy
+
+
+def _splice_option_sets(node):
+    # Returns the node, or a shallow copy of it with the option sets of its
+    # elements replaced by their fragments. Only the levels where elements
+    # can be are looked at: a payload, its view, its blocks and the
+    # accessory, element or elements of each block.
+    if isinstance(node, list):
+        return _splice_blocks(node)
+    view = node.get("view")
+    if isinstance(view, dict):
+        spliced = _splice_option_sets(view)
+        if spliced is not view:
+            node = dict(node)
+            node["view"] = spliced
+        return node
+    blocks = node.get("blocks")
+    if isinstance(blocks, list):
+        spliced = _splice_blocks(blocks)
+        if spliced is not blocks:
+            node = dict(node)
+            node["blocks"] = spliced
+        return node
+    return _splice_element(_splice_block(node))
+
+
+def to_json_bytes(blocks):
+    """
+    Summary: Serializes a block tree to compact UTF-8 JSON bytes \n
+    Equivalent to `json.dumps(blocks, separators=(",", ":"),
+    ensure_ascii=False).encode()`, but reuses one encoder for every call and
+    splices in `Fragment` values and the encoded form of `OptionSet`s
+    without re-encoding them.
+
+    Args:
+        blocks: A block, a list of blocks or a whole payload.
+    Returns:
+        bytes: The encoded JSON
+    Example:
+        >>> to_json_bytes([divider_node()])
+        b'[{"type":"divider"}]'
+    """
+    if _OptionSet is not None and isinstance(blocks, (dict, list)):
+        blocks = _splice_option_sets(blocks)
+    # Saved and restored, since encoding a node can build blocks that are
+    # encoded in turn, for example by an instrumented builder.
+    outer = getattr(_local, "fragments", None)
+    fragments = _local.fragments = []
+    try:
+        encoded = _ENCODER.encode(blocks).encode("utf-8")
+    finally:
+        _local.fragments = outer
+    if not fragments:
+        return encoded
+    return _PLACEHOLDER_PATTERN.sub(
+        lambda match: fragments[int(match.group(1))], encoded
+    )
+
+
+def _canonical_default(node):
+    if isinstance(node, Fragment):
+        return node.json.decode("utf-8")
+    return _default(node)
+
+
+# Encodes equal trees to equal bytes, whatever the order of their keys.
+_CANONICAL_ENCODER = json.JSONEncoder(
+    ensure_ascii=False,
+    check_circular=False,
+    separators=(",", ":"),
+    sort_keys=True,
+    default=_canonical_default
+)
+
+
+def to_canonical_json_bytes(node):
+    """
+    Summary: Serializes a tree to canonical JSON bytes, for hashing \n
+    Trees that are equal as JSON give equal bytes, whatever the order of
+    their keys. Fragments are included as their encoded text, so this is
+    not meant to be sent to Slack.
+
+    Args:
+        node: A block, a list of blocks or any other JSON value
+    Returns:
+        bytes: The encoded JSON, with sorted keys
+    """
+    return _CANONICAL_ENCODER.encode(node).encode("utf-8")
+
+
+def fragment(node):
+    """
+    Summary: Encodes a constant subtree once \n
+    Args:
+        node: A block, element or any other JSON value.
+    Returns:
+        Fragment: The pre-encoded value, ready to be placed in block trees
+    Example:
+        >>> FOOTER = fragment(context([...], block_id="footer"))
+        >>> to_json_bytes([section.markdown_text("Hi"), FOOTER])
+    """
+    if isinstance(node, Fragment):
+        return node
+    return Fragment(to_json_bytes(node))
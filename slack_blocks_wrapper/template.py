@@ -0,0 +1,145 @@
+import keyword
+
+from .elements.mrkdwn import escape as _escape
+
+
+class Slot(str):
+    """
+    Summary: A named placeholder for a string value in a block template \n
+    A slot is a `str`, so it can be passed to any builder in place of a real
+    value. The builders see the slot's sample text, which is what they
+    validate against while the template is being built. A builder that
+    escapes its text, such as `text_element(..., escape=True)`, replaces
+    the slot by an `escaped` one, whose value is escaped on render.
+    """
+    __slots__ = ("name", "escape")
+
+    def __new__(cls, name: str, sample: str = None, escape: bool = False):
+        node = super().__new__(cls, name if sample is None else sample)
+        node.name = name
+        node.escape = escape
+        return node
+
+    def escaped(self) -> "Slot":
+        """
+        Summary: The slot, with its value escaped as mrkdwn on render
+        """
+        return Slot(self.name, _escape(str(self)), True)
+
+    def __repr__(self):
+        return "slot({!r})".format(self.name)
+
+
+def slot(name: str, sample: str = None):
+    """
+    Summary: Creates a named slot to be filled in when a template renders \n
+    Args:
+        name (str): The name of the slot. Used as the keyword argument to
+            `BlockTemplate.render`.
+        sample (str): The text the builders validate against while the
+            template is built. Defaults to the slot name.
+    Returns:
+        Slot: The slot placeholder
+    Example:
+        >>> button_section(
+        ...     text=slot("text"),
+        ...     action_id=slot("action_id"),
+        ...     style="primary",
+        ...     value=slot("value")
+        ... )
+    """
+    if not name.isidentifier() or keyword.iskeyword(name):
+        raise ValueError("slot name must be a valid python identifier")
+    if name.startswith("_"):
+        raise ValueError("slot name must not start with an underscore")
+    return Slot(name, sample)
+
+
+class BlockTemplate:
+    """
+    Summary: A block tree built once and rendered by slot substitution \n
+    The tree is built (and validated) by the regular builders with `slot`
+    values in place of the per-message strings. It is then compiled into a
+    single function that returns a fresh copy of the tree with the slots
+    filled in, so rendering skips validation, `text_element` construction
+    and the dict merges done by the builders.
+
+    Args:
+        blocks: A block, a list of blocks, or any other tree of dicts and
+            lists returned by the builders.
+
+    Example:
+        >>> approve = BlockTemplate([
+        ...     button_section(
+        ...         text=slot("text"),
+        ...         action_id=slot("action_id"),
+        ...         style="primary",
+        ...         value=slot("value")
+        ...     ),
+        ...     divider_node()
+        ... ])
+        >>> approve.render(text="Approve", action_id="approve", value="42")
+    """
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self.slots = ()
+        self._render = _compile(blocks, self)
+
+    def render(self, **values):
+        """
+        Summary: Renders the template with the given slot values \n
+        Args:
+            **values: One keyword argument per slot name.
+        Returns:
+            A new tree, equal to what the builders return for these values.
+        """
+        return self._render(**values)
+
+    __call__ = render
+
+    def __reduce__(self):
+        # The compiled function can't be pickled; it is compiled again from
+        # the blocks, for example in the worker processes of `render_batch`.
+        return type(self), (self.blocks,)
+
+
+def _compile(blocks, template: BlockTemplate):
+    namespace = {}
+    slots = {}
+    expression = _expression(blocks, namespace, slots)
+    template.slots = tuple(slots)
+    arguments = "*, " + ", ".join(slots) if slots else ""
+    source = "def _render({}):\n    return {}\n".format(arguments, expression)
+    exec(compile(source, "<block template>", "exec"), namespace)
+    return namespace["_render"]
+
+
+def _expression(node, namespace: dict, slots: dict):
+    if isinstance(node, Slot):
+        slots.setdefault(node.name, None)
+        if node.escape:
+            namespace["_escape"] = _escape
+            return "_escape({})".format(node.name)
+        return node.name
+    if isinstance(node, dict):
+        return "{" + ", ".join(
+            "{}: {}".format(
+                _expression(key, namespace, slots),
+                _expression(value, namespace, slots)
+            )
+            for key, value in node.items()
+        ) + "}"
+    if isinstance(node, list):
+        return "[" + ", ".join(
+            _expression(item, namespace, slots) for item in node
+        ) + "]"
+    if type(node) is tuple:
+        return "(" + "".join(
+            _expression(item, namespace, slots) + ", " for item in node
+        ) + ")"
+    if node is None or type(node) in (str, bool, int):
+        return repr(node)
+    name = "_c{}".format(len(namespace))
+    namespace[name] = node
+    return name
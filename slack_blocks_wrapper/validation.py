@@ -0,0 +1,292 @@
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, NamedTuple, Tuple
+
+# Compiled by `re` on the first date checked rather than on import.
+DATE_PATTERN = \
+    "((?:19|20)\\d\\d)-(0?[1-9]|1[012])-([12][0-9]|3[01]|0?[1-9])"
+CONVERSATION_TYPES = frozenset(("im", "mpim", "private", "public"))
+BUTTON_STYLES = frozenset(("primary", "danger"))
+
+
+class Rule(NamedTuple):
+    """
+    Summary: One validation rule of an element or block type \n
+    Args:
+        fields (Tuple[str, ...]): The fields passed to `check`, in order.
+            Missing fields are passed as `None`
+        check (Callable): Returns whether the values are valid
+        message (str): The error message when they are not
+    """
+    fields: Tuple[str, ...]
+    check: Callable[..., bool]
+    message: str
+
+
+class Violation(NamedTuple):
+    """
+    Summary: A broken rule, and where in the block tree it was found
+    """
+    path: str
+    type: str
+    message: str
+
+
+class ValidationError(ValueError):
+    """
+    Summary: Raised with every violation found in a node or block tree
+    """
+
+    def __init__(self, violations: list):
+        super().__init__("; ".join(
+            violation.message if not violation.path
+            else f"{violation.path}: {violation.message}"
+            for violation in violations
+        ))
+        self.violations = violations
+
+
+def _required(value):
+    # Text may be given as a string, a text object or a `text_element`.
+    while isinstance(value, dict) and "text" in value:
+        value = value["text"]
+    return bool(value)
+
+
+def _either(first, second):
+    return bool(first or second)
+
+
+def _not_both(first, second):
+    return not (first and second)
+
+
+def _valid_date(value):
+    return value is None or re.search(DATE_PATTERN, value) is not None
+
+
+def _button_style(value):
+    return value is None or value in BUTTON_STYLES
+
+
+def _conversation_filter(value):
+    if not isinstance(value, dict) or not value.get("include"):
+        return True
+    include = value["include"]
+    if isinstance(include, str):
+        include = [include]
+    return CONVERSATION_TYPES.issuperset(include)
+
+
+def _required_rules(placeholder: str, action_id: str):
+    return (
+        Rule(("placeholder",), _required, placeholder),
+        Rule(("action_id",), _required, action_id),
+    )
+
+
+# The validation rules of every element and block type, by `type`.
+RULES = {
+    "button": (
+        Rule(("style",), _button_style,
+             "style must be `primary` or `danger`"),
+    ),
+    "datepicker": (
+        Rule(("initial_date",), _valid_date,
+             "`initial_date` must be a valid date"),
+    ),
+    "static_select": (
+        Rule(("action_id",), _required, "action_id is required"),
+        Rule(("options", "option_groups"), _either,
+             "options or option_groups is required"),
+        Rule(("options", "option_groups"), _not_both,
+             "options and option_groups cannot be used together"),
+    ),
+    "multi_static_select": (
+        Rule(("options", "option_groups"), _not_both,
+             "`options` and `option_groups` cannot be used together"),
+    ),
+    "external_select": _required_rules(
+        "placeholder is required", "action_id is required"),
+    # Also applies to `filtered_conversations_select`, which builds the same
+    # type but did not require a placeholder or action_id before.
+    "conversations_select": _required_rules(
+        "placeholder is required", "action_id is required") + (
+        Rule(("filter",), _conversation_filter,
+             "conversations must be one of: im, mpim, private, public"),
+    ),
+    "channels_select": _required_rules(
+        "placeholder is required", "action_id is required"),
+    "multi_users_select": _required_rules(
+        "Placeholder is required", "Action ID is required"),
+    "multi_channels_select": _required_rules(
+        "Placeholder is required", "Action ID is required"),
+    "timepicker": _required_rules(
+        "Placeholder is required", "Action ID is required"),
+    "overflow": (
+        Rule(("action_id",), _required, "action_id is required"),
+        Rule(("options",), _required, "options is required"),
+    ),
+    "radio_button_group": (
+        Rule(("action_id",), _required, "Action ID is required"),
+        Rule(("options",), _required, "Options are required"),
+    ),
+    "plain_text_input": (
+        Rule(("action_id",), _required, "action_id is required"),
+    ),
+    "input": (
+        Rule(("element",), _required, "element is required"),
+    ),
+}
+
+_enabled = True
+_override = ContextVar("slack_blocks_wrapper_validation", default=None)
+
+
+def validation_enabled() -> bool:
+    """
+    Summary: Whether the builders validate their arguments
+    """
+    override = _override.get()
+    return _enabled if override is None else override
+
+
+def set_validation(enabled: bool):
+    """
+    Summary: Turns validation in the builders on or off for the process \n
+    Turning it off makes sense once the block trees a service sends are
+    checked with `validate` in CI.
+
+    Args:
+        enabled (bool): Whether the builders validate their arguments
+    """
+    global _enabled
+    _enabled = enabled
+
+
+@contextmanager
+def validation_disabled():
+    """
+    Summary: Skips validation in the builders within a `with` block \n
+    Only affects the current thread or asyncio task.
+
+    Example:
+        >>> with validation_disabled():
+        ...     blocks = build_home_tab(user)
+    """
+    token = _override.set(False)
+    try:
+        yield
+    finally:
+        _override.reset(token)
+
+
+def compile_rules(rules: dict):
+    """
+    Summary: Compiles a rule table for `check` and `validate` 
+
+    Call again after changing `RULES`.
+
+    Args:
+        rules (dict): Rules by element or block type, like `RULES`
+    """
+    global _compiled
+    _compiled = {
+        node_type: tuple(
+            (rule.fields[0] if len(rule.fields) == 1 else None,
+             rule.fields, rule.check, rule.message)
+            for rule in node_rules
+        )
+        for node_type, node_rules in rules.items()
+    }
+
+
+compile_rules(RULES)
+
+
+def _check(node: dict, rules: tuple, path, violations: list):
+    get = node.get
+    for field, fields, rule, message in rules:
+        if field is not None:
+            valid = rule(get(field))
+        else:
+            valid = rule(*[get(name) for name in fields])
+        if not valid:
+            violations.append(Violation(path, node["type"], message))
+
+
+def check(node: dict):
+    """
+    Summary: Validates a single element or block against `RULES` 
+
+    Args:
+        node (dict): The node, with its `type`
+    Raises:
+        ValidationError: With every rule the node breaks
+    """
+    rules = _compiled.get(node.get("type"))
+    if rules is None:
+        return
+    violations = []
+    _check(node, rules, "", violations)
+    if violations:
+        raise ValidationError(violations)
+
+
+def _path(parent):
+    parts = []
+    while parent is not None:
+        parent, key = parent
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return "".join(reversed(parts)).lstrip(".")
+
+
+def validate(blocks) -> list:
+    """
+    Summary: Checks a whole block tree in one pass \n
+    Unlike the builders, which stop at the first error, this reports every
+    violation in the tree.
+
+    Args:
+        blocks: A block, a list of blocks or a whole view or message payload
+    Returns:
+        list: The `Violation`s found, empty if the tree is valid
+    Example:
+        >>> validate(view["blocks"])
+        [Violation(path='[3].accessory', type='static_select',
+                   message='options or option_groups is required')]
+    """
+    violations = []
+    stack = [(blocks, None)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node, path = pop()
+        if isinstance(node, dict):
+            rules = _compiled.get(node.get("type"))
+            if rules is not None:
+                _check(node, rules, path, violations)
+            for key, value in reversed(node.items()):
+                if isinstance(value, (dict, list)):
+                    push((value, (path, key)))
+        elif isinstance(node, list):
+            for index in range(len(node) - 1, -1, -1):
+                value = node[index]
+                if isinstance(value, (dict, list)):
+                    push((value, (path, index)))
+    return [
+        violation._replace(path=_path(violation.path))
+        for violation in violations
+    ]
+
+
+def assert_valid(blocks):
+    """
+    Summary: Raises if a block tree has any violation, for use in CI \n
+    Raises:
+        ValidationError: With every violation in the tree
+    """
+    violations = validate(blocks)
+    if violations:
+        raise ValidationError(violations)
@@ -0,0 +1,181 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple
+
+from .serialize import Fragment, to_json_bytes
+
+
+class CachedView(NamedTuple):
+    """
+    Summary: A rendered view and its serialized JSON \n
+    The view is shared by every caller that gets it from the cache, so it
+    must not be changed.
+
+    Args:
+        view (dict): The view, as returned by the render function
+        fragment (Fragment): The encoded view, ready to be placed in a
+            `views.open` or `views.update` payload
+    """
+    view: dict
+    fragment: Fragment
+
+    @property
+    def json(self) -> bytes:
+        """
+        Summary: The view as compact UTF-8 JSON bytes
+        """
+        return self.fragment.json
+
+
+class ViewCache:
+    """
+    Summary: A bounded cache of rendered and serialized views \n
+    Views are keyed by a fingerprint the caller derives from everything the
+    view depends on, such as a data version and the user's locale. Entries
+    expire `ttl` seconds after they were rendered, and the least recently
+    used entry is evicted once `maxsize` are held.
+
+    Rendering happens outside the cache's lock, so two threads missing the
+    same fingerprint at once may both render it; the last one is kept.
+
+    Args:
+        maxsize (int): The maximum number of views kept
+        ttl (float): Seconds a view is kept for. `None` keeps views until
+            they are evicted
+        clock (Callable): Returns the current time in seconds
+
+    Example:
+        >>> views = ViewCache(maxsize=128, ttl=300)
+        >>> cached = views.get_or_render(
+        ...     ("settings", data_version, user["locale"]),
+        ...     lambda: settings_modal(data, user["locale"])
+        ... )
+        >>> body = to_json_bytes({"trigger_id": trigger_id,
+        ...                       "view": cached.fragment})
+        >>> await dispatcher.send("views.open", body)
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 256,
+            ttl: float = None,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        if maxsize is None or maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, fingerprint: Hashable):
+        return self.get(fingerprint, count=False) is not None
+
+    def get(self, fingerprint: Hashable, count: bool = True):
+        """
+        Summary: The cached view for a fingerprint \n
+        Args:
+            fingerprint (Hashable): The fingerprint of the view's inputs
+            count (bool): Whether to count the lookup as a hit or miss
+        Returns:
+            CachedView: The cached view, or `None` if it is missing or
+            expired
+        """
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is not None:
+                cached, expires = entry
+                if expires is None or expires > self._clock():
+                    self._entries.move_to_end(fingerprint)
+                    if count:
+                        self._hits += 1
+                    return cached
+                del self._entries[fingerprint]
+                self._expired += 1
+            if count:
+                self._misses += 1
+            return None
+
+    def put(self, fingerprint: Hashable, view: dict) -> CachedView:
+        """
+        Summary: Serializes and caches a view \n
+        Args:
+            fingerprint (Hashable): The fingerprint of the view's inputs
+            view (dict): The rendered view
+        Returns:
+            CachedView: The cached view
+        """
+        cached = CachedView(view, Fragment(to_json_bytes(view)))
+        expires = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._entries[fingerprint] = (cached, expires)
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return cached
+
+    def get_or_render(
+            self,
+            fingerprint: Hashable,
+            render: Callable[[], dict]
+    ) -> CachedView:
+        """
+        Summary: The cached view for a fingerprint, rendered on a miss \n
+        Args:
+            fingerprint (Hashable): The fingerprint of the view's inputs
+            render (Callable[[], dict]): Builds the view
+        Returns:
+            CachedView: The cached or newly rendered view
+        """
+        cached = self.get(fingerprint)
+        if cached is None:
+            cached = self.put(fingerprint, render())
+        return cached
+
+    def invalidate(self, fingerprint: Hashable):
+        """
+        Summary: Drops the cached view for a fingerprint, if any
+        """
+        with self._lock:
+            self._entries.pop(fingerprint, None)
+
+    def info(self):
+        """
+        Summary: Counters of the cache \n
+        Returns:
+            dict: `hits`, `misses`, `hit_rate`, `expired` and `evictions`
+            since the cache was created or cleared, and the `maxsize` and
+            `currsize` of the cache
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "expired": self._expired,
+                "evictions": self._evictions,
+                "maxsize": self.maxsize,
+                "currsize": len(self._entries)
+            }
+
+    def clear(self):
+        """
+        Summary: Empties the cache and resets its counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+            self._expired = self._evictions = 0
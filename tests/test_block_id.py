@@ -0,0 +1,65 @@
+import unittest
+
+from slack_blocks_wrapper.block_id import content_block_ids
+from slack_blocks_wrapper.context import context
+from slack_blocks_wrapper.divider import divider_node
+from slack_blocks_wrapper.elements import TextType, text_element
+from slack_blocks_wrapper.header import header_block_node
+
+
+def report():
+    return [
+        header_block_node("Report"),
+        divider_node(),
+        context([text_element("Footer", TextType.PLAIN_TEXT)["text"]]),
+        divider_node(),
+    ]
+
+
+def block_ids(blocks):
+    return [block["block_id"] for block in blocks]
+
+
+class ContentBlockIdsTest(unittest.TestCase):
+
+    def test_ids_are_only_derived_within_the_block(self):
+        self.assertNotIn("block_id", divider_node())
+        with content_block_ids():
+            self.assertIn("block_id", divider_node())
+        self.assertEqual(divider_node(block_id="given")["block_id"], "given")
+
+    def test_same_blocks_get_same_unique_ids(self):
+        with content_block_ids("report"):
+            first = block_ids(report())
+        with content_block_ids("report"):
+            second = block_ids(report())
+        self.assertEqual(first, second)
+        self.assertEqual(len(set(first)), len(first))
+
+    def test_namespace_and_content_change_the_ids(self):
+        with content_block_ids("report"):
+            first = block_ids(report())
+        with content_block_ids("other"):
+            other = block_ids(report())
+        with content_block_ids("report"):
+            renamed = block_ids([header_block_node("Renamed")])
+        self.assertTrue(set(first).isdisjoint(other))
+        self.assertNotEqual(first[0], renamed[0])
+
+    def test_nested_blocks_keep_the_ids_of_other_parts(self):
+        with content_block_ids("report"):
+            with content_block_ids("top"):
+                top = block_ids(report())
+            with content_block_ids("bottom"):
+                bottom = block_ids(report())
+        with content_block_ids("report"):
+            with content_block_ids("top"):
+                extended = block_ids(report() + [divider_node()])
+            with content_block_ids("bottom"):
+                self.assertEqual(block_ids(report()), bottom)
+        self.assertEqual(extended[:len(top)], top)
+        self.assertTrue(set(top).isdisjoint(bottom))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import threading
+import unittest
+
+from slack_blocks_wrapper import section
+from slack_blocks_wrapper.build_trace import trace_build
+from slack_blocks_wrapper.elements import button as button_module
+from slack_blocks_wrapper.section import section_elements
+
+
+class BuildTraceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.button_element = button_module.button_element
+        self.button_section = section_elements.button_section
+
+    def assert_restored(self):
+        self.assertIs(button_module.button_element, self.button_element)
+        self.assertIs(section_elements.button_section, self.button_section)
+        self.assertIs(section.button_section, self.button_section)
+
+    def test_records_nested_builder_calls(self):
+        with trace_build() as trace:
+            section.button_section("Approve", "approve", "primary")
+        self.assert_restored()
+        [call] = trace.calls
+        self.assertEqual(call.name, "section.button_section")
+        self.assertIn("elements.button_element",
+                      [child.name for child in call.children])
+        self.assertGreater(call.bytes, 0)
+        self.assertIn("section.button_section;elements.button_element",
+                      trace.collapsed("bytes"))
+
+    def test_overlapping_traces_in_threads_restore_the_builders(self):
+        first_started = threading.Event()
+        second_started = threading.Event()
+        first_ended = threading.Event()
+        traces = {}
+
+        def first():
+            with trace_build() as trace:
+                first_started.set()
+                second_started.wait()
+                section.button_section("Approve", "approve", "primary")
+            traces["first"] = trace
+            first_ended.set()
+
+        def second():
+            first_started.wait()
+            with trace_build() as trace:
+                second_started.set()
+                first_ended.wait()
+                section.button_section("Approve", "approve", "primary")
+            traces["second"] = trace
+
+        threads = [threading.Thread(target=first),
+                   threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assert_restored()
+        for trace in traces.values():
+            self.assertEqual([call.name for call in trace.calls],
+                             ["section.button_section"])
+
+
+if __name__ == "__main__":
+    unittest.main()
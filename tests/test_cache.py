@@ -0,0 +1,45 @@
+import unittest
+
+from slack_blocks_wrapper.elements.cache import TextCache
+from slack_blocks_wrapper.elements.text import TextType
+from slack_blocks_wrapper.template import BlockTemplate, slot
+
+
+class TextCacheTest(unittest.TestCase):
+
+    def test_repeated_objects_are_shared_and_frozen(self):
+        cache = TextCache(maxsize=8)
+        first = cache.option("One", "1")
+        self.assertIs(cache.option("One", "1"), first)
+        self.assertEqual(cache.info(), {
+            "hits": 1, "misses": 1, "maxsize": 8, "currsize": 1})
+        with self.assertRaises(TypeError):
+            first["value"] = "2"
+        with self.assertRaises(TypeError):
+            first["text"]["text"] = "Two"
+
+    def test_slots_are_not_shared_with_equal_strings(self):
+        cache = TextCache()
+        plain = cache.text_element("name", TextType.PLAIN_TEXT)
+        slotted = cache.text_element(slot("name"), TextType.PLAIN_TEXT)
+        self.assertIsNot(slotted, plain)
+        self.assertIs(type(plain["text"]["text"]), str)
+        self.assertEqual(slotted["text"]["text"].name, "name")
+        other = cache.option(slot("label", "Label"), slot("value", "Label"))
+        self.assertIsNot(
+            cache.option(slot("other", "Label"), "Label"), other)
+        self.assertEqual(cache.info()["currsize"], 1)
+
+    def test_cached_slot_renders(self):
+        cache = TextCache()
+        cache.text_element("name", TextType.PLAIN_TEXT)
+        template = BlockTemplate([{
+            "type": "section",
+            **cache.text_element(slot("name"), TextType.PLAIN_TEXT),
+        }])
+        self.assertEqual(
+            template.render(name="Ada")[0]["text"]["text"], "Ada")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,242 @@
+import asyncio
+import json
+import time
+import unittest
+from email.utils import formatdate
+from unittest import mock
+
+from slack_blocks_wrapper.dispatch import (
+    DEFAULT_RETRY_AFTER,
+    Dispatcher,
+    HTTPTransport,
+    _retry_after,
+)
+
+
+class StubServer:
+    """
+    A local Web API stand-in. Every request is recorded, and answered by
+    `respond(request)`, which returns the response bytes, or `None` to drop
+    the connection without answering. A response without a
+    `Content-Length` or chunked body is ended by closing the connection.
+    """
+
+    def __init__(self, respond=None):
+        self.respond = respond or self.ok
+        self.requests = []
+        self.connections = 0
+        self._writers = []
+        self._server = None
+
+    @staticmethod
+    def ok(request):
+        body = json.dumps({"ok": True, "echo": request["body"]}).encode()
+        return b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n" \
+            b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" \
+            + body
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(
+            self._serve, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._server.close()
+        for writer in self._writers:
+            writer.close()
+        await self._server.wait_closed()
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:{}/api/".format(self.port)
+
+    def close_idle(self):
+        for writer in self._writers:
+            writer.close()
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        self._writers.append(writer)
+        try:
+            while True:
+                line = await reader.readuntil(b"\r\n")
+                method, path, _ = line.decode().split(" ")
+                headers = {}
+                while True:
+                    line = await reader.readuntil(b"\r\n")
+                    if line == b"\r\n":
+                        break
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(
+                    int(headers["content-length"]))
+                request = {
+                    "method": method,
+                    "path": path,
+                    "headers": headers,
+                    "body": json.loads(body)
+                }
+                self.requests.append(request)
+                response = self.respond(request)
+                if response is None:
+                    break
+                writer.write(response)
+                await writer.drain()
+                head = response.partition(b"\r\n\r\n")[0].lower()
+                if b"content-length" not in head and b"chunked" not in head:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def chunked(request):
+    body = json.dumps({"ok": True, "echo": request["body"]}).encode()
+    middle = len(body) // 2
+    return b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n" + b"".join(
+        "{:x}\r\n".format(len(part)).encode() + part + b"\r\n"
+        for part in (body[:middle], body[middle:])
+    ) + b"0\r\n\r\n"
+
+
+def unsized(request):
+    body = json.dumps({"ok": True, "echo": request["body"]}).encode()
+    return b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n" \
+        + body
+
+
+class DispatchTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_send_all_reuses_pooled_connections(self):
+        async with StubServer() as server:
+            transport = HTTPTransport("xoxb-test", server.url, pool_size=8)
+            async with Dispatcher(transport, concurrency=8) as dispatcher:
+                results = await dispatcher.send_all(
+                    "chat.postMessage", ({"n": n} for n in range(200)))
+        self.assertEqual([result["echo"]["n"] for result in results],
+                         list(range(200)))
+        self.assertEqual(len(server.requests), 200)
+        self.assertLessEqual(server.connections, 8)
+        request = server.requests[0]
+        self.assertEqual(request["path"], "/api/chat.postMessage")
+        self.assertEqual(request["headers"]["authorization"],
+                         "Bearer xoxb-test")
+
+    async def test_chunked_response(self):
+        async with StubServer(chunked) as server:
+            transport = HTTPTransport(base_url=server.url)
+            async with Dispatcher(transport) as dispatcher:
+                result = await dispatcher.send("chat.postMessage", {"n": 1})
+        self.assertEqual(result, {"ok": True, "echo": {"n": 1}})
+
+    async def test_response_without_length_is_read_to_eof(self):
+        async with StubServer(unsized) as server:
+            transport = HTTPTransport(base_url=server.url)
+            async with Dispatcher(transport) as dispatcher:
+                first = await dispatcher.send("chat.postMessage", {"n": 1})
+                second = await dispatcher.send("chat.postMessage", {"n": 2})
+        self.assertEqual(first, {"ok": True, "echo": {"n": 1}})
+        self.assertEqual(second, {"ok": True, "echo": {"n": 2}})
+        # The connection ended with the body, so it was not reused.
+        self.assertEqual(server.connections, 2)
+
+    async def test_connect_times_out(self):
+        async def never_connects(*args, **kwargs):
+            await asyncio.sleep(3600)
+
+        transport = HTTPTransport(base_url="http://127.0.0.1:9/api/",
+                                  timeout=0.05)
+        with mock.patch("asyncio.open_connection", never_connects):
+            with self.assertRaises(asyncio.TimeoutError):
+                await transport.request("chat.postMessage", b"{}")
+        await transport.close()
+
+    async def test_rate_limited_with_http_date_is_retried(self):
+        limited = []
+
+        def respond(request):
+            if not limited:
+                limited.append(request)
+                return b"HTTP/1.1 429 Too Many Requests\r\n" \
+                    b"Retry-After: " + formatdate(usegmt=True).encode() \
+                    + b"\r\nContent-Length: 0\r\n\r\n"
+            return StubServer.ok(request)
+
+        async with StubServer(respond) as server:
+            transport = HTTPTransport(base_url=server.url)
+            async with Dispatcher(transport) as dispatcher:
+                result = await dispatcher.send("chat.postMessage", {"n": 1})
+        self.assertEqual(result["echo"], {"n": 1})
+        self.assertEqual(len(server.requests), 2)
+
+    async def test_rate_limited_payload_is_retried(self):
+        limited = []
+
+        def respond(request):
+            if not limited:
+                limited.append(request)
+                return b"HTTP/1.1 429 Too Many Requests\r\n" \
+                    b"Retry-After: 0\r\nContent-Length: 0\r\n\r\n"
+            return StubServer.ok(request)
+
+        async with StubServer(respond) as server:
+            transport = HTTPTransport(base_url=server.url)
+            async with Dispatcher(transport) as dispatcher:
+                result = await dispatcher.send("chat.postMessage", b'{"n":1}')
+        self.assertEqual(result["echo"], {"n": 1})
+        self.assertEqual(len(server.requests), 2)
+
+    async def test_connection_closed_while_idle_is_replaced(self):
+        async with StubServer() as server:
+            transport = HTTPTransport(base_url=server.url)
+            async with Dispatcher(transport) as dispatcher:
+                await dispatcher.send("chat.postMessage", {"n": 1})
+                server.close_idle()
+                # Lets the event loop see the connection close.
+                await asyncio.sleep(0.05)
+                result = await dispatcher.send("chat.postMessage", {"n": 2})
+        self.assertEqual(result["echo"], {"n": 2})
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(server.connections, 2)
+
+    async def test_request_failing_after_it_was_sent_is_not_resent(self):
+        def respond(request):
+            # Answers the first request, then drops the pooled connection
+            # once the second one has been received.
+            if request["body"]["n"] == 1:
+                return StubServer.ok(request)
+            return None
+
+        async with StubServer(respond) as server:
+            transport = HTTPTransport(base_url=server.url)
+            async with Dispatcher(transport) as dispatcher:
+                await dispatcher.send("chat.postMessage", {"n": 1})
+                with self.assertRaises(
+                        (ConnectionError, asyncio.IncompleteReadError)):
+                    await dispatcher.send("chat.postMessage", {"n": 2})
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(server.connections, 1)
+
+
+class RetryAfterTest(unittest.TestCase):
+
+    def test_seconds(self):
+        self.assertEqual(_retry_after("2"), 2.0)
+        self.assertEqual(_retry_after("0.5"), 0.5)
+        self.assertEqual(_retry_after("-1"), 0.0)
+
+    def test_http_date(self):
+        self.assertEqual(_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        delay = _retry_after(formatdate(time.time() + 30, usegmt=True))
+        self.assertTrue(28 <= delay <= 30, delay)
+
+    def test_missing_or_unreadable(self):
+        for value in (None, "", "soon", "inf", "Wed, 32 Oct 2015"):
+            with self.subTest(value=value):
+                self.assertEqual(_retry_after(value), DEFAULT_RETRY_AFTER)
+
+
+if __name__ == "__main__":
+    unittest.main()
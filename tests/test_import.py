@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Prints the modules an import statement loads, in a fresh interpreter.
+SCRIPT = (
+    "import json, sys\n"
+    "before = set(sys.modules)\n"
+    "{}\n"
+    "print(json.dumps(sorted(set(sys.modules) - before)))\n"
+)
+
+
+def loaded_by(statement: str) -> list:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (ROOT, env.get("PYTHONPATH"))))
+    output = subprocess.check_output(
+        [sys.executable, "-c", SCRIPT.format(statement)], env=env)
+    return json.loads(output)
+
+
+class LazyImportTest(unittest.TestCase):
+
+    def assertNotLoaded(self, modules, names):
+        self.assertFalse(set(modules) & set(names), modules)
+
+    def test_package_import_loads_no_submodule(self):
+        modules = loaded_by("import slack_blocks_wrapper")
+        self.assertNotLoaded(modules, (
+            "re",
+            "slack_blocks_wrapper.validation",
+            "slack_blocks_wrapper.template",
+            "slack_blocks_wrapper.elements",
+            "slack_blocks_wrapper.section",
+        ))
+
+    def test_namespace_imports_load_no_builder(self):
+        modules = loaded_by(
+            "import slack_blocks_wrapper.elements, "
+            "slack_blocks_wrapper.section")
+        self.assertNotLoaded(modules, (
+            "re",
+            "slack_blocks_wrapper.validation",
+            "slack_blocks_wrapper.template",
+            "slack_blocks_wrapper.elements.text",
+            "slack_blocks_wrapper.section.section_elements",
+        ))
+
+    def test_builders_load_on_first_use(self):
+        modules = loaded_by(
+            "import slack_blocks_wrapper.section as section\n"
+            "section.button_section('Deploy', 'deploy', 'primary')")
+        self.assertIn("slack_blocks_wrapper.section.section_elements",
+                      modules)
+        self.assertIn("slack_blocks_wrapper.validation", modules)
+        self.assertNotIn("slack_blocks_wrapper.template", modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
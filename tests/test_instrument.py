@@ -0,0 +1,61 @@
+import unittest
+
+from slack_blocks_wrapper import instrument, section
+from slack_blocks_wrapper.build_trace import trace_build
+from slack_blocks_wrapper.elements import button as button_module
+from slack_blocks_wrapper.section import section_elements
+
+
+class InstrumentTest(unittest.TestCase):
+
+    def setUp(self):
+        self.button_element = button_module.button_element
+        self.button_section = section_elements.button_section
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+
+    def assert_restored(self):
+        self.assertIs(button_module.button_element, self.button_element)
+        self.assertIs(section_elements.button_section, self.button_section)
+        self.assertIs(section.button_section, self.button_section)
+
+    def test_enable_records_and_disable_restores(self):
+        instrument.enable()
+        section.button_section("Approve", "approve", "primary")
+        instrument.disable()
+        self.assertEqual(
+            instrument.stats()["section.button_section"].calls, 1)
+        self.assertIn(
+            'calls_total{builder="section.button_section"} 1',
+            instrument.openmetrics())
+        self.assert_restored()
+
+    def test_disable_inside_trace_removes_the_wrapper(self):
+        instrument.enable()
+        with trace_build() as trace:
+            instrument.disable()
+            instrument.reset()
+            section.button_section("Approve", "approve", "primary")
+            # Only the trace's wrappers are left in the call path.
+            self.assertEqual(instrument.stats(), {})
+        self.assert_restored()
+        self.assertEqual(
+            [call.name for call in trace.calls], ["section.button_section"])
+
+    def test_modules_patches_builders_imported_by_name(self):
+        namespace = {"button_section": self.button_section}
+        module = type(unittest)("imported_builders")
+        vars(module).update(namespace)
+        instrument.enable(modules=[module])
+        module.button_section("Approve", "approve", "primary")
+        module.button_section("Approve", "approve", "primary")
+        instrument.disable()
+        self.assertEqual(
+            instrument.stats()["section.button_section"].calls, 2)
+        self.assertIs(module.button_section, self.button_section)
+
+
+if __name__ == "__main__":
+    unittest.main()
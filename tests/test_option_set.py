@@ -0,0 +1,53 @@
+import pickle
+import unittest
+
+from slack_blocks_wrapper.elements.option_set import OptionSet
+from slack_blocks_wrapper.elements.text import TextType, text_element
+from slack_blocks_wrapper.serialize import to_json_bytes
+
+
+def option(name):
+    return text_element(name, TextType.PLAIN_TEXT, value=name.lower())
+
+
+class OptionSetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.groups = OptionSet([{
+            "label": text_element("Colors", TextType.PLAIN_TEXT)["text"],
+            "options": [option("Red"), option("Green")],
+        }])
+
+    def test_options_of_groups_are_frozen(self):
+        options = self.groups[0]["options"]
+        for change in (
+                lambda: options.append(option("Blue")),
+                lambda: options.__setitem__(0, option("Blue")),
+                lambda: options.pop(),
+                lambda: options.sort(),
+                lambda: options[0].__setitem__("value", "blue"),
+                lambda: options[0]["text"].__setitem__("text", "Blue"),
+        ):
+            with self.assertRaises(TypeError):
+                change()
+
+    def test_encoding_matches_the_options(self):
+        element = {"type": "static_select", "option_groups": self.groups}
+        self.assertEqual(
+            to_json_bytes(element),
+            to_json_bytes({"type": "static_select",
+                           "option_groups": pickle.loads(
+                               pickle.dumps(list(self.groups)))}))
+        self.assertEqual(self.groups[0]["options"],
+                         [option("Red"), option("Green")])
+
+    def test_pickles(self):
+        copy = pickle.loads(pickle.dumps(self.groups))
+        self.assertEqual(copy, self.groups)
+        self.assertEqual(copy.fragment, self.groups.fragment)
+        with self.assertRaises(TypeError):
+            copy[0]["options"].append(option("Blue"))
+
+
+if __name__ == "__main__":
+    unittest.main()
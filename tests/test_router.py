@@ -0,0 +1,65 @@
+import re
+import unittest
+
+from slack_blocks_wrapper.router import ActionRouter
+
+
+def handler(name):
+    def handle(action, *args):
+        return name, action, args
+    return handle
+
+
+class ActionRouterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.router = ActionRouter()
+        self.router.add("approve", handler("approve"))
+        self.router.add("approve", handler("approve_in_block"), "block")
+        self.router.add_prefix("project_", handler("project"))
+        self.router.add_pattern(r"item_\d+", handler("item"))
+        self.router.add_pattern(r"user_(?P<user>U\w+)", handler("user"))
+        # Backreferences cannot be combined, so this one is matched alone.
+        self.router.add_pattern(r"(\w)_\1", handler("double"))
+
+    def test_exact_and_prefix_routes_have_no_match(self):
+        route = self.router.route("approve")
+        self.assertEqual(route.handler(None)[0], "approve")
+        self.assertIsNone(route.match)
+        self.assertEqual(
+            self.router.route("approve", "block").handler(None)[0],
+            "approve_in_block")
+        self.assertEqual(
+            self.router.route("approve", "other").handler(None)[0],
+            "approve")
+        route = self.router.route("project_42")
+        self.assertEqual(route.handler(None)[0], "project")
+        self.assertIsNone(route.match)
+
+    def test_pattern_routes_always_have_a_match(self):
+        route = self.router.route("item_7")
+        self.assertEqual(route.handler(None)[0], "item")
+        self.assertIsInstance(route.match, re.Match)
+        self.assertEqual(route.match.group(), "item_7")
+        self.assertEqual(route.match.re.pattern, r"item_\d+")
+
+        route = self.router.route("user_U123")
+        self.assertEqual(route.match["user"], "U123")
+        self.assertEqual(route.match.groups(), ("U123",))
+
+        route = self.router.route("a_a")
+        self.assertEqual(route.handler(None)[0], "double")
+        self.assertEqual(route.match.group(1), "a")
+
+    def test_unrouted_action(self):
+        self.assertIsNone(self.router.route("item_x"))
+        with self.assertRaises(KeyError):
+            self.router.dispatch({"action_id": "unknown"})
+        self.router.default = handler("default")
+        self.assertEqual(
+            self.router.dispatch({"action_id": "unknown"}, 1)[::2],
+            ("default", (1,)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from slack_blocks_wrapper.elements.text import TextType, text_element
+from slack_blocks_wrapper.template import BlockTemplate, slot
+
+
+class BlockTemplateTest(unittest.TestCase):
+
+    def test_escaped_slot_is_escaped_on_render(self):
+        template = BlockTemplate([{
+            "type": "section",
+            **text_element(slot("name"), TextType.MARKDOWN_TEXT, escape=True),
+        }])
+        self.assertEqual(
+            template.render(name="<b> & co")[0]["text"]["text"],
+            "&lt;b&gt; &amp; co")
+
+    def test_plain_text_is_escaped_when_built(self):
+        self.assertEqual(
+            text_element("<b>", TextType.MARKDOWN_TEXT,
+                         escape=True)["text"]["text"],
+            "&lt;b&gt;")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+import unittest
+
+from slack_blocks_wrapper.elements.button import button_element
+from slack_blocks_wrapper.elements.datepicker import datepicker_element
+from slack_blocks_wrapper.elements.multiselect import (
+    multichannels_select_element,
+    multistatic_select_element,
+    multiuser_select_element,
+)
+from slack_blocks_wrapper.elements.overflow_menu import overflow_menu_element
+from slack_blocks_wrapper.elements.plain_text_input import (
+    plain_text_input_element,
+)
+from slack_blocks_wrapper.elements.radio_button import (
+    radio_button_group_element,
+)
+from slack_blocks_wrapper.elements.select import (
+    channels_select_element,
+    conversations_select_element,
+    external_select_element,
+    filtered_conversations_select,
+    static_select_element,
+)
+from slack_blocks_wrapper.elements.text import TextType, text_element
+from slack_blocks_wrapper.elements.timepicker import timepicker_element
+from slack_blocks_wrapper.input import input_block_node
+from slack_blocks_wrapper.validation import (
+    ValidationError,
+    Violation,
+    assert_valid,
+    check,
+    set_validation,
+    validate,
+    validation_disabled,
+    validation_enabled,
+)
+
+OPTIONS = [text_element("One", TextType.PLAIN_TEXT, value="1")]
+GROUPS = [{"label": text_element("Group", TextType.PLAIN_TEXT)["text"],
+           "options": OPTIONS}]
+
+# A builder call breaking each rule, and the message it fails with.
+BROKEN = [
+    (lambda: button_element("Go", "go", "secondary"),
+     "style must be `primary` or `danger`"),
+    (lambda: datepicker_element("date", initial_date="tomorrow"),
+     "`initial_date` must be a valid date"),
+    (lambda: static_select_element("Pick", "", options=OPTIONS),
+     "action_id is required"),
+    (lambda: static_select_element("Pick", "pick"),
+     "options or option_groups is required"),
+    (lambda: static_select_element(
+        "Pick", "pick", options=OPTIONS, option_groups=GROUPS),
+     "options and option_groups cannot be used together"),
+    (lambda: multistatic_select_element(
+        "Pick", OPTIONS, "pick", option_groups=GROUPS),
+     "`options` and `option_groups` cannot be used together"),
+    (lambda: external_select_element("", "pick"),
+     "placeholder is required"),
+    (lambda: external_select_element("Pick", ""),
+     "action_id is required"),
+    (lambda: conversations_select_element("", "pick"),
+     "placeholder is required"),
+    (lambda: conversations_select_element(
+        "Pick", "pick", filter={"include": ["dm"]}),
+     "conversations must be one of: im, mpim, private, public"),
+    (lambda: channels_select_element("Pick", ""),
+     "action_id is required"),
+    (lambda: multiuser_select_element("", "pick"),
+     "Placeholder is required"),
+    (lambda: multichannels_select_element("Pick", ""),
+     "Action ID is required"),
+    (lambda: timepicker_element("", "time"),
+     "Placeholder is required"),
+    (lambda: overflow_menu_element(OPTIONS, ""),
+     "action_id is required"),
+    (lambda: overflow_menu_element([], "more"),
+     "options is required"),
+    (lambda: radio_button_group_element("", OPTIONS),
+     "Action ID is required"),
+    (lambda: radio_button_group_element("pick", []),
+     "Options are required"),
+    (lambda: plain_text_input_element("", "Name"),
+     "action_id is required"),
+    (lambda: input_block_node("Name", {}),
+     "element is required"),
+]
+
+
+class RulesTest(unittest.TestCase):
+
+    def test_every_rule_is_enforced(self):
+        for build, message in BROKEN:
+            with self.subTest(message=message):
+                with self.assertRaises(ValidationError) as raised:
+                    build()
+                self.assertIn(message, str(raised.exception))
+
+    def test_errors_are_value_errors(self):
+        # The builders that raised a bare `Exception` raise a
+        # `ValidationError` now, which callers can catch as `ValueError`.
+        with self.assertRaises(ValueError):
+            overflow_menu_element([], "more")
+        with self.assertRaises(ValueError):
+            plain_text_input_element("", "Name")
+
+    def test_datepicker_without_initial_date(self):
+        self.assertEqual(datepicker_element("date"), {
+            "type": "datepicker",
+            "action_id": "date",
+            "focus_on_load": False,
+        })
+        self.assertEqual(
+            datepicker_element("date", "2024-01-31")["initial_date"],
+            "2024-01-31")
+
+    def test_link_button(self):
+        node = button_element("Docs", "docs", "link",
+                              url="https://example.com")
+        self.assertNotIn("style", node)
+        self.assertEqual(node["url"], "https://example.com")
+
+    def test_conversation_filter(self):
+        node = conversations_select_element(
+            "Pick", "pick", filter={"include": ["im", "public"]})
+        self.assertEqual(node["filter"], {"include": ["im", "public"]})
+        node = filtered_conversations_select(
+            "Pick", "pick", conversations=["private"])
+        self.assertEqual(node["filter"]["include"], ["private"])
+        with self.assertRaises(ValidationError):
+            filtered_conversations_select(
+                "Pick", "pick", conversations=["im", "group"])
+
+    def test_filtered_conversations_select_requires_fields(self):
+        with self.assertRaisesRegex(
+                ValidationError, "placeholder is required"):
+            filtered_conversations_select("", "pick")
+        with self.assertRaisesRegex(ValidationError, "action_id is required"):
+            filtered_conversations_select("Pick", "")
+
+
+class SwitchTest(unittest.TestCase):
+
+    def test_validation_disabled(self):
+        self.assertTrue(validation_enabled())
+        with validation_disabled():
+            self.assertFalse(validation_enabled())
+            for build, _ in BROKEN:
+                build()
+        self.assertTrue(validation_enabled())
+
+    def test_set_validation(self):
+        set_validation(False)
+        try:
+            self.assertFalse(validation_enabled())
+            overflow_menu_element([], "more")
+        finally:
+            set_validation(True)
+        self.assertTrue(validation_enabled())
+
+
+class CheckTest(unittest.TestCase):
+
+    def test_check_reports_every_violation(self):
+        with self.assertRaises(ValidationError) as raised:
+            check({"type": "overflow"})
+        self.assertEqual(
+            [violation.message for violation in raised.exception.violations],
+            ["action_id is required", "options is required"])
+
+    def test_check_ignores_unknown_types(self):
+        check({"type": "section"})
+        check({})
+
+    def test_validate_finds_nested_violations_with_paths(self):
+        with validation_disabled():
+            blocks = [
+                {"type": "section", "text": text_element(
+                    "Hi", TextType.PLAIN_TEXT)["text"]},
+                {"type": "section", "text": text_element(
+                    "Pick", TextType.PLAIN_TEXT)["text"],
+                 "accessory": static_select_element("Pick", "pick")},
+                {"type": "actions", "elements": [
+                    button_element("Go", "go", "primary"),
+                    button_element("Stop", "stop", "secondary"),
+                ]},
+            ]
+        self.assertEqual(validate(blocks), [
+            Violation("[1].accessory", "static_select",
+                      "options or option_groups is required"),
+            Violation("[2].elements[1]", "button",
+                      "style must be `primary` or `danger`"),
+        ])
+        self.assertEqual(validate(blocks[:1]), [])
+        with self.assertRaises(ValidationError) as raised:
+            assert_valid({"blocks": blocks})
+        self.assertEqual(len(raised.exception.violations), 2)
+        self.assertIn("blocks[2].elements[1]: style must be",
+                      str(raised.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()